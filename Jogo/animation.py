@@ -0,0 +1,31 @@
+from assets import asset_cache, asset_path
+
+# Animações conhecidas -> arquivos dos frames, na ordem de exibição
+ANIMATIONS = {
+    "player_attack": ("player_frame1.png", "player_frame2.png"),
+    "enemy_attack": ("enemy_frame(1).png", "enemy_frame(2).png"),
+}
+
+
+class AnimationFrameStore:
+    def __init__(self, cache=asset_cache):
+        """
+        Armazena os frames de animação já no tamanho da entidade que os usa.
+        Todas as instâncias com o mesmo tamanho compartilham a mesma tupla de frames,
+        em vez de cada uma guardar cópias em resolução de tela cheia.
+        """
+        self.cache = cache
+        self._frames = {}  # (animação, tamanho) -> tupla de superfícies
+
+    def frames(self, animation, size):
+        """Retorna os frames da animação redimensionados para 'size'."""
+        key = (animation, tuple(size))
+        frames = self._frames.get(key)
+        if frames is None:
+            frames = tuple(self.cache.image(asset_path(name), key[1]) for name in ANIMATIONS[animation])
+            self._frames[key] = frames
+        return frames
+
+
+# Armazenamento compartilhado de frames de animação
+animation_frames = AnimationFrameStore()
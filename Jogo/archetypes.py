@@ -0,0 +1,85 @@
+import random
+from settings import ENEMY_SPEED, ENEMY_HEALTH, ENEMY_ATTACK_COOLDOWN
+
+# Tipo de inimigo -> atributos do arquétipo.
+# Os pares (base, por round) crescem linearmente com o round: base + round_number * por_round.
+# "spawn_weights" são os pesos do sorteio de tipo nas ondas: (rounds comuns, rounds pares, rounds múltiplos de 3);
+# tipos com peso zero (o Boss) nunca são sorteados.
+# As imagens de cada tipo ficam em sprite_table.ENEMY_SPRITES.
+ENEMY_ARCHETYPES = {
+    "Normal": {
+        "speed": (ENEMY_SPEED, 0.2),
+        "health": (ENEMY_HEALTH, 10),
+        "damage": (10, 2),
+        "xp": (20, 5),
+        "can_be_frozen": True,
+        "round_multipliers": True,   # Rounds pares: vida x1.5 e dano x0.75
+        "attack_cooldown": ENEMY_ATTACK_COOLDOWN,
+        "spawn_delay": 2500,         # ms até o inimigo ficar visível
+        "spawn_weights": (1, 30, 30),
+    },
+    "Rápido": {
+        "speed": (ENEMY_SPEED, 0.3),
+        "health": (ENEMY_HEALTH, 5),
+        "damage": (8, 2),
+        "xp": (20, 5),
+        "can_be_frozen": True,
+        "round_multipliers": True,
+        "attack_cooldown": ENEMY_ATTACK_COOLDOWN,
+        "spawn_delay": 2500,
+        "spawn_weights": (1, 50, 30),
+    },
+    "Tanque": {
+        "speed": (ENEMY_SPEED, 0.05),
+        "health": (ENEMY_HEALTH, 20),
+        "damage": (15, 2.5),
+        "xp": (20, 5),
+        "can_be_frozen": False,      # O Tanque é resistente a congelamento
+        "round_multipliers": True,
+        "attack_cooldown": ENEMY_ATTACK_COOLDOWN,
+        "spawn_delay": 2500,
+        "spawn_weights": (1, 20, 40),
+    },
+    "Boss": {
+        "speed": (1.5, 0),
+        "health": (500, 50),
+        "damage": (30, 5),
+        "xp": (100, 20),
+        "can_be_frozen": False,
+        "round_multipliers": False,
+        "attack_cooldown": 1500,
+        "spawn_delay": 3000,
+        "spawn_weights": (0, 0, 0),
+    },
+}
+
+
+def archetype_stats(enemy_type, round_number):
+    """
+    Calcula os atributos do tipo de inimigo no round informado.
+    Retorna um dicionário com speed, max_health, attack_damage e xp_reward.
+    """
+    archetype = ENEMY_ARCHETYPES[enemy_type]
+    strength_multiplier = damage_multiplier = 1
+    if archetype["round_multipliers"] and round_number % 2 == 0:
+        strength_multiplier = 1.5
+        damage_multiplier = 0.75
+
+    def scaled(key):
+        base, per_round = archetype[key]
+        return base + round_number * per_round
+
+    return {
+        "speed": scaled("speed"),
+        "max_health": scaled("health") * strength_multiplier,
+        "attack_damage": scaled("damage") * damage_multiplier,
+        "xp_reward": scaled("xp"),
+    }
+
+
+def choose_enemy_type(round_number, rng=random):
+    """Sorteia o tipo de um inimigo comum da onda conforme os pesos do round."""
+    column = 2 if round_number % 3 == 0 else 1 if round_number % 2 == 0 else 0
+    types = [name for name, archetype in ENEMY_ARCHETYPES.items() if archetype["spawn_weights"][column] > 0]
+    weights = [ENEMY_ARCHETYPES[name]["spawn_weights"][column] for name in types]
+    return rng.choices(types, weights=weights)[0]
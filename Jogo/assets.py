@@ -0,0 +1,190 @@
+import os
+import pygame
+from settings import USE_TEXTURE_ATLAS, USE_ASSET_BUNDLE, SURFACE_MEMORY_BUDGET
+
+# Diretório padrão dos assets do jogo
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
+
+
+def asset_path(filename):
+    """Retorna o caminho completo de um arquivo dentro da pasta assets."""
+    return os.path.join(ASSETS_DIR, filename)
+
+
+class AssetCache:
+    def __init__(self, memory_budget=SURFACE_MEMORY_BUDGET):
+        """
+        Cache de imagens compartilhado por todo o processo.
+        Cada arquivo é lido do disco uma única vez; as superfícies derivadas
+        (convertidas e redimensionadas) são indexadas por (caminho, tamanho, alpha)
+        e entregues como referências compartilhadas.
+
+        As superfícies retornadas NÃO devem ser alteradas por quem as recebe
+        (fill, draw, etc.); quem precisar modificar deve fazer um .copy().
+        """
+        self._surfaces = {}  # (caminho, tamanho, alpha) -> pygame.Surface
+        self._pending = {}   # (caminho, tamanho) -> (Future com a imagem decodificada, callback de liberação)
+        self.atlas = None
+        self._atlas_checked = not USE_TEXTURE_ATLAS
+        self.bundle = None
+        self._bundle_checked = not USE_ASSET_BUNDLE
+        self.hits = 0
+        self.misses = 0
+        self.bytes_cached = 0
+        self.external_bytes = 0  # Superfícies mantidas fora do cache (ex.: tabela de sprites por round)
+        self.memory_budget = memory_budget
+        self._over_budget = False
+
+    def image(self, path, size=None, alpha=True):
+        """
+        Retorna a imagem do caminho informado, opcionalmente redimensionada.
+
+        Parâmetros:
+            path (str): Caminho do arquivo de imagem.
+            size (tuple): Tamanho final (largura, altura) ou None para o tamanho original.
+            alpha (bool): Se True usa convert_alpha(), senão convert().
+
+        Lança a mesma exceção de pygame.image.load caso o arquivo não exista;
+        falhas não são armazenadas no cache.
+        """
+        key = (os.path.normpath(path), tuple(size) if size else None, alpha)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        decoded = self._take_pending(key[0], key[1])
+        if decoded is not None:
+            surface = decoded.convert_alpha() if alpha else decoded.convert()
+        elif size is None:
+            surface = self._from_atlas(key[0], alpha)
+            if surface is None:
+                surface = self._decode(key[0])
+                surface = surface.convert_alpha() if alpha else surface.convert()
+        else:
+            surface = pygame.transform.scale(self.image(path, None, alpha), key[1])
+
+        self._surfaces[key] = surface
+        self.bytes_cached += surface_bytes(surface)
+        self._check_budget()
+        return surface
+
+    def memory_usage(self):
+        """Memória total (bytes) das superfícies contabilizadas."""
+        return self.bytes_cached + self.external_bytes
+
+    def track(self, surface):
+        """Contabiliza no orçamento uma superfície mantida por outro módulo."""
+        self.external_bytes += surface_bytes(surface)
+        self._check_budget()
+
+    def untrack(self, surface):
+        """Remove do orçamento uma superfície descartada por outro módulo."""
+        self.external_bytes -= surface_bytes(surface)
+        self._check_budget()
+
+    def _check_budget(self):
+        """Emite um aviso (uma vez) quando a memória das superfícies passa do orçamento."""
+        over_budget = self.memory_usage() > self.memory_budget
+        if over_budget and not self._over_budget:
+            print(f"⚠️ Memória de superfícies ({self.memory_usage() // (1024 * 1024)} MB) "
+                  f"excedeu o orçamento de {self.memory_budget // (1024 * 1024)} MB!")
+        self._over_budget = over_budget
+
+    def add_pending(self, path, size, future, release=None):
+        """
+        Registra uma decodificação em andamento (feita pelo pré-carregador) para o caminho e tamanho.
+        'release' é chamado quando a imagem é consumida, para que o pré-carregador solte o Future
+        e a superfície decodificada não fique viva fora do cache.
+        """
+        self._pending[(os.path.normpath(path), size)] = (future, release)
+
+    def _take_pending(self, path, size):
+        """Aguarda e retorna a imagem pré-carregada, se houver; caso contrário retorna None."""
+        future, release = self._pending.pop((path, size), (None, None))
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"⚠️ Falha no pré-carregamento de '{path}': {e}")
+            return None
+        finally:
+            if release is not None:
+                release()
+
+    def use_atlas(self, atlas):
+        """Define o atlas de texturas usado pelo cache (None desativa o atlas)."""
+        self.atlas = atlas
+        self._atlas_checked = True
+
+    def _from_atlas(self, path, alpha):
+        """
+        Retorna o sprite como subsuperfície do atlas, se ele estiver empacotado.
+        O atlas é carregado na primeira consulta (é preciso ter a janela criada).
+        """
+        if not self._atlas_checked:
+            from atlas import load_atlas
+            self.use_atlas(load_atlas())
+        if self.atlas is None or os.path.dirname(path) != os.path.normpath(ASSETS_DIR):
+            return None
+        name = os.path.basename(path)
+        if name not in self.atlas:
+            return None
+        surface = self.atlas.get(name)
+        return surface if alpha else surface.convert()
+
+    def use_bundle(self, bundle):
+        """Define o bundle de pixels usado pelo cache (None desativa o bundle)."""
+        self.bundle = bundle
+        self._bundle_checked = True
+
+    def in_bundle(self, path):
+        """Indica se a imagem do caminho pode ser lida do bundle mapeado em memória."""
+        if not self._bundle_checked:
+            from bundle import load_bundle
+            self.use_bundle(load_bundle())
+        return (
+            self.bundle is not None
+            and os.path.dirname(os.path.normpath(path)) == os.path.normpath(ASSETS_DIR)
+            and os.path.basename(path) in self.bundle
+        )
+
+    def _decode(self, path):
+        """Lê a imagem do bundle (sem decodificar PNG) ou, se não houver, do disco."""
+        if self.in_bundle(path):
+            return self.bundle.get(os.path.basename(path))
+        return pygame.image.load(path)
+
+    def stats(self):
+        """Retorna os contadores do cache (acertos, falhas, superfícies e bytes)."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "surfaces": len(self._surfaces),
+            "bytes": self.bytes_cached,
+            "external_bytes": self.external_bytes,
+            "budget": self.memory_budget,
+        }
+
+    def clear(self):
+        """Esvazia o cache (por exemplo, ao recriar a janela de exibição)."""
+        self._surfaces.clear()
+        self.bytes_cached = 0
+        self._check_budget()
+
+
+def surface_bytes(surface):
+    """Calcula a memória ocupada pelos pixels de uma superfície."""
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+# Instância única compartilhada pelos módulos do jogo
+asset_cache = AssetCache()
+
+
+def load_image(path, size=None, alpha=True):
+    """Atalho para asset_cache.image()."""
+    return asset_cache.image(path, size, alpha)
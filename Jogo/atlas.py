@@ -0,0 +1,150 @@
+import os
+import json
+import pygame
+from settings import ATLAS_SHEET_SIZE
+from assets import ASSETS_DIR
+
+# Pasta e índice gerados pelo empacotador (python atlas.py)
+ATLAS_DIR = os.path.join(ASSETS_DIR, "atlas")
+ATLAS_INDEX = os.path.join(ATLAS_DIR, "atlas.json")
+ATLAS_PADDING = 1  # Espaço entre sprites para evitar vazamento de pixels ao escalar
+
+# Sprites de jogabilidade empacotados -> maior dimensão mantida no atlas (mantém a proporção)
+ATLAS_SPRITES = {
+    "player_frame.png": 512,
+    "player_frame1.png": 512,
+    "player_frame2.png": 512,
+    "player1.png": 512,
+    "player2.png": 512,
+    "enemy.png": 512,
+    "enemy1.png": 512,
+    "enemy2.png": 512,
+    "enemy_frame(1).png": 512,
+    "enemy_frame(2).png": 512,
+    "boss.png": 1024,
+    "vida.png": 256,
+    "item.png": 256,
+    "gold_coin.png": 256,
+    "super_health_potion.png": 256,
+    "npc1.png": 512,
+    "npc_merchant.png": 512,
+    "npc_guardian.png": 512,
+}
+
+
+def _fit(size, max_dimension):
+    """Reduz o tamanho para caber em max_dimension, mantendo a proporção."""
+    width, height = size
+    scale = min(1.0, max_dimension / max(width, height))
+    return (max(1, int(width * scale)), max(1, int(height * scale)))
+
+
+def pack(sizes, sheet_size=ATLAS_SHEET_SIZE, padding=ATLAS_PADDING):
+    """
+    Distribui retângulos em folhas usando empacotamento por prateleiras (shelf packing).
+
+    Parâmetros:
+        sizes (dict): nome -> (largura, altura).
+    Retorna:
+        dict: nome -> (índice da folha, x, y).
+    """
+    placements = {}
+    sheet, x, y, shelf_height = 0, 0, 0, 0
+    # Ordena pela altura para que cada prateleira desperdice o mínimo de espaço
+    for name, (width, height) in sorted(sizes.items(), key=lambda item: item[1][1], reverse=True):
+        if width > sheet_size or height > sheet_size:
+            raise ValueError(f"Sprite '{name}' ({width}x{height}) não cabe em uma folha de {sheet_size}px")
+        if x + width > sheet_size:
+            # Abre uma nova prateleira
+            x, y = 0, y + shelf_height + padding
+            shelf_height = 0
+        if y + height > sheet_size:
+            # Abre uma nova folha
+            sheet, x, y, shelf_height = sheet + 1, 0, 0, 0
+        placements[name] = (sheet, x, y)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+    return placements
+
+
+def build_atlas(sprites=ATLAS_SPRITES, source_dir=ASSETS_DIR, output_dir=ATLAS_DIR, sheet_size=ATLAS_SHEET_SIZE):
+    """
+    Empacota os sprites de jogabilidade em poucas folhas grandes e grava
+    as imagens das folhas junto com o índice JSON (nome -> folha e retângulo).
+    """
+    images = {}
+    for name, max_dimension in sprites.items():
+        path = os.path.join(source_dir, name)
+        if not os.path.exists(path):
+            print(f"⚠️ Sprite '{name}' não encontrado, ignorado no atlas.")
+            continue
+        image = pygame.image.load(path)
+        images[name] = pygame.transform.smoothscale(image, _fit(image.get_size(), max_dimension))
+
+    placements = pack({name: image.get_size() for name, image in images.items()}, sheet_size)
+    sheet_count = max((sheet for sheet, _, _ in placements.values()), default=-1) + 1
+    sheets = [pygame.Surface((sheet_size, sheet_size), pygame.SRCALPHA) for _ in range(sheet_count)]
+
+    index = {"sheets": [], "sprites": {}}
+    for name, (sheet, x, y) in placements.items():
+        sheets[sheet].blit(images[name], (x, y))
+        width, height = images[name].get_size()
+        index["sprites"][name] = {"sheet": sheet, "rect": [x, y, width, height]}
+
+    os.makedirs(output_dir, exist_ok=True)
+    for number, surface in enumerate(sheets):
+        sheet_name = f"atlas_{number}.png"
+        pygame.image.save(surface, os.path.join(output_dir, sheet_name))
+        index["sheets"].append(sheet_name)
+    with open(os.path.join(output_dir, "atlas.json"), "w") as file:
+        json.dump(index, file, indent=2)
+
+    print(f"🧩 Atlas gerado: {len(placements)} sprites em {sheet_count} folha(s) de {sheet_size}px.")
+    return index
+
+
+class TextureAtlas:
+    def __init__(self, index_path=ATLAS_INDEX):
+        """
+        Carrega as folhas do atlas e entrega os sprites como subsuperfícies pelo nome
+        do arquivo original. Todas as subsuperfícies compartilham os pixels da folha.
+        """
+        with open(index_path) as file:
+            index = json.load(file)
+        atlas_dir = os.path.dirname(index_path)
+        self.sheets = [
+            pygame.image.load(os.path.join(atlas_dir, sheet_name)).convert_alpha()
+            for sheet_name in index["sheets"]
+        ]
+        self.sprites = {
+            name: (entry["sheet"], pygame.Rect(entry["rect"]))
+            for name, entry in index["sprites"].items()
+        }
+
+    def __contains__(self, name):
+        return name in self.sprites
+
+    def get(self, name):
+        """Retorna a subsuperfície do sprite informado."""
+        sheet, rect = self.sprites[name]
+        return self.sheets[sheet].subsurface(rect)
+
+    def source(self, name):
+        """Retorna (folha, retângulo) do sprite, útil para desenhos em lote com a mesma folha."""
+        sheet, rect = self.sprites[name]
+        return self.sheets[sheet], rect
+
+
+def load_atlas(index_path=ATLAS_INDEX):
+    """Carrega o atlas se o índice tiver sido gerado; caso contrário retorna None."""
+    if not os.path.exists(index_path):
+        return None
+    try:
+        return TextureAtlas(index_path)
+    except (OSError, ValueError, KeyError, pygame.error) as e:
+        print(f"⚠️ Falha ao carregar o atlas de texturas: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    build_atlas()
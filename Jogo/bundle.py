@@ -0,0 +1,103 @@
+import os
+import json
+import mmap
+import struct
+import pygame
+from assets import ASSETS_DIR
+
+# Arquivo gerado pelo empacotador (python bundle.py)
+BUNDLE_PATH = os.path.join(ASSETS_DIR, "assets.bundle")
+BUNDLE_MAGIC = b"RPGB"
+BUNDLE_VERSION = 1
+BUNDLE_ALIGNMENT = 16  # Alinhamento (bytes) do início dos pixels de cada imagem
+
+# Cabeçalho: magic, versão e tamanho do índice JSON
+_HEADER = struct.Struct("<4sII")
+
+
+def _align(offset):
+    return (offset + BUNDLE_ALIGNMENT - 1) // BUNDLE_ALIGNMENT * BUNDLE_ALIGNMENT
+
+
+def build_bundle(source_dir=ASSETS_DIR, output_path=BUNDLE_PATH):
+    """
+    Converte todas as imagens PNG da pasta de assets em pixels brutos (RGBA ou RGB)
+    e grava tudo em um único arquivo, com um índice JSON contendo posição,
+    dimensões e formato de cada imagem.
+    """
+    entries = {}
+    blobs = []
+    offset = 0
+    for name in sorted(os.listdir(source_dir)):
+        if not name.lower().endswith(".png"):
+            continue
+        image = pygame.image.load(os.path.join(source_dir, name))
+        pixel_format = "RGBA" if image.get_flags() & pygame.SRCALPHA else "RGB"
+        data = pygame.image.tobytes(image, pixel_format)
+        offset = _align(offset)
+        entries[name] = {"offset": offset, "length": len(data), "size": list(image.get_size()), "format": pixel_format}
+        blobs.append((offset, data))
+        offset += len(data)
+
+    index = json.dumps({"version": BUNDLE_VERSION, "images": entries}).encode("utf-8")
+    # Os offsets do índice são relativos ao início da área de dados
+    data_start = _align(_HEADER.size + len(index))
+    with open(output_path, "wb") as file:
+        file.write(_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(index)))
+        file.write(index)
+        for blob_offset, data in blobs:
+            file.seek(data_start + blob_offset)
+            file.write(data)
+
+    print(f"📦 Bundle gerado: {len(entries)} imagens, {os.path.getsize(output_path) // (1024 * 1024)} MB em {output_path}")
+    return entries
+
+
+class AssetBundle:
+    def __init__(self, path=BUNDLE_PATH):
+        """
+        Abre o bundle mapeado em memória. As imagens são criadas diretamente
+        a partir do buffer mapeado, sem decodificação de PNG.
+        """
+        self.file = open(path, "rb")
+        self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_length = _HEADER.unpack_from(self.buffer, 0)
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+            self.close()
+            raise ValueError(f"Bundle inválido ou de versão incompatível: {path}")
+        index_start = _HEADER.size
+        index = json.loads(self.buffer[index_start:index_start + index_length].decode("utf-8"))
+        self.data_start = _align(index_start + index_length)
+        self.images = index["images"]
+
+    def __contains__(self, name):
+        return name in self.images
+
+    def get(self, name):
+        """
+        Retorna a superfície da imagem. Ela referencia o buffer mapeado;
+        convert()/convert_alpha() produzem a cópia definitiva no formato da tela.
+        """
+        entry = self.images[name]
+        start = self.data_start + entry["offset"]
+        pixels = memoryview(self.buffer)[start:start + entry["length"]]
+        return pygame.image.frombuffer(pixels, tuple(entry["size"]), entry["format"])
+
+    def close(self):
+        self.buffer.close()
+        self.file.close()
+
+
+def load_bundle(path=BUNDLE_PATH):
+    """Abre o bundle se ele tiver sido gerado; caso contrário retorna None."""
+    if not os.path.exists(path):
+        return None
+    try:
+        return AssetBundle(path)
+    except (OSError, ValueError, KeyError, struct.error) as e:
+        print(f"⚠️ Falha ao abrir o bundle de assets: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    build_bundle()
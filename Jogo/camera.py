@@ -1,5 +1,8 @@
 import pygame
-from settings import WIDTH, HEIGHT, MAP_WIDTH, MAP_HEIGHT, ZOOM_FACTOR
+from collections import OrderedDict
+from settings import WIDTH, HEIGHT, MAP_WIDTH, MAP_HEIGHT, ZOOM_FACTOR, MIN_ZOOM, MAX_ZOOM, ZOOM_CACHE_SIZE, CULL_PADDING
+from assets import asset_cache
+from tilemap import ChunkedMap
 
 class Camera:
     def __init__(self, map_width, map_height):
@@ -17,6 +20,28 @@ class Camera:
         self.map_width = map_width
         self.map_height = map_height
 
+        # Cache do fundo redimensionado por nível de zoom: (id do fundo, zoom) -> (fundo, fundo com zoom)
+        self.zoom_cache = OrderedDict()
+        self.zoom_cache_size = ZOOM_CACHE_SIZE
+
+        # Cadeia de mipmaps do fundo (1, 1/2, 1/4, ...): id do fundo -> (fundo, lista de níveis)
+        self.mip_chains = {}
+
+        # Contadores de renderização do frame atual (entidades desenhadas e descartadas pelo culling)
+        self.drawn = 0
+        self.culled = 0
+
+    def set_zoom(self, zoom_factor):
+        """
+        Define o fator de zoom (limitado entre MIN_ZOOM e MAX_ZOOM e arredondado em passos de 0.1,
+        para que os níveis de zoom do fundo possam ser reaproveitados do cache)
+        e ajusta a área visível em coordenadas do mundo.
+        """
+        self.zoom_factor = round(max(MIN_ZOOM, min(MAX_ZOOM, zoom_factor)), 1)
+        center = self.camera_rect.center
+        self.camera_rect.size = (int(WIDTH / self.zoom_factor), int(HEIGHT / self.zoom_factor))
+        self.camera_rect.center = center
+
     def apply(self, entity):
         """
         Aplica o deslocamento da câmera e o zoom à entidade.
@@ -28,6 +53,26 @@ class Camera:
         new_h = int(entity.rect.height * self.zoom_factor)
         return pygame.Rect(new_x, new_y, new_w, new_h)
 
+    def is_visible(self, rect, padding=CULL_PADDING):
+        """
+        Indica se o retângulo (em coordenadas do mundo) aparece na área visível da câmera.
+        A margem cobre o que é desenhado fora do retângulo do sprite (barras de vida, prompts).
+        """
+        return self.camera_rect.inflate(padding * 2, padding * 2).colliderect(rect)
+
+    def cull(self, rect, padding=CULL_PADDING):
+        """Como is_visible, mas também atualiza os contadores de desenhados/descartados."""
+        if self.is_visible(rect, padding):
+            self.drawn += 1
+            return True
+        self.culled += 1
+        return False
+
+    def reset_render_stats(self):
+        """Zera os contadores de culling no início de cada frame."""
+        self.drawn = 0
+        self.culled = 0
+
     def update(self, target):
         """
         Centraliza a câmera no alvo (por exemplo, o jogador) e garante que ela permaneça
@@ -49,24 +94,92 @@ class Camera:
         self.camera_rect.x = max(0, min(centered_x, max_x))
         self.camera_rect.y = max(0, min(centered_y, max_y))
 
-    def apply_zoom_to_background(self, surface):
+    def build_mipmaps(self, surface):
+        """
+        Gera (uma única vez por fundo) a cadeia de mipmaps: o fundo original seguido de versões
+        com metade do tamanho da anterior, até o nível que cobre o zoom mínimo.
+        Retorna a lista de níveis, do maior para o menor.
+        """
+        entry = self.mip_chains.get(id(surface))
+        if entry is not None and entry[0] is surface:
+            return entry[1]
+
+        levels = [surface]
+        factor = 1.0
+        while factor > MIN_ZOOM and min(levels[-1].get_size()) > 1:
+            width, height = levels[-1].get_size()
+            level = pygame.transform.smoothscale(levels[-1], (max(1, width // 2), max(1, height // 2)))
+            asset_cache.track(level)
+            levels.append(level)
+            factor /= 2
+        self.mip_chains[id(surface)] = (surface, levels)
+        return levels
+
+    def mip_level_for(self, surface, size):
+        """Retorna o menor nível da cadeia de mipmaps que ainda é maior ou igual ao tamanho pedido."""
+        levels = self.build_mipmaps(surface)
+        source = levels[0]
+        for level in levels[1:]:
+            if level.get_width() < size[0] or level.get_height() < size[1]:
+                break
+            source = level
+        return source
+
+    def get_zoomed_background(self, surface):
         """
-        Aplica o zoom ao fundo do mapa. Primeiro, redimensiona a imagem do fundo
-        considerando o zoom. Em seguida, extrai a área correspondente à câmera,
-        garantindo que ela esteja dentro dos limites da imagem redimensionada.
+        Retorna o fundo inteiro redimensionado para o zoom atual.
+        O resultado fica em cache por nível de zoom, então o smoothscale só é executado
+        quando o zoom muda para um nível que não está entre os mais recentes; ele parte
+        do nível de mipmap mais próximo acima do tamanho final, e não do fundo original.
         """
-        # Redimensiona o fundo para o zoom desejado
+        key = (id(surface), self.zoom_factor)
+        entry = self.zoom_cache.get(key)
+        if entry is not None and entry[0] is surface:
+            self.zoom_cache.move_to_end(key)
+            return entry[1]
+
         zoomed_width = int(self.map_width * self.zoom_factor)
         zoomed_height = int(self.map_height * self.zoom_factor)
-        zoomed_bg = pygame.transform.smoothscale(surface, (zoomed_width, zoomed_height))
+        source = self.mip_level_for(surface, (zoomed_width, zoomed_height))
+        if source.get_size() == (zoomed_width, zoomed_height):
+            return source  # O próprio nível de mipmap já tem o tamanho do zoom
+        zoomed_bg = pygame.transform.smoothscale(source, (zoomed_width, zoomed_height))
 
-        # Converte a posição da câmera para as coordenadas do fundo redimensionado
+        self.zoom_cache[key] = (surface, zoomed_bg)
+        asset_cache.track(zoomed_bg)
+        if len(self.zoom_cache) > self.zoom_cache_size:
+            _, (_, evicted) = self.zoom_cache.popitem(last=False)
+            asset_cache.untrack(evicted)
+        return zoomed_bg
+
+    def background_area(self, zoomed_bg):
+        """
+        Converte a posição da câmera para as coordenadas do fundo redimensionado,
+        garantindo que a área não ultrapasse os limites do fundo.
+        """
+        zoomed_width, zoomed_height = zoomed_bg.get_size()
         cam_x = int(self.camera_rect.x * self.zoom_factor)
         cam_y = int(self.camera_rect.y * self.zoom_factor)
-
-        # Garante que a área da câmera não ultrapasse os limites do fundo
         cam_x = max(0, min(cam_x, zoomed_width - WIDTH))
         cam_y = max(0, min(cam_y, zoomed_height - HEIGHT))
+        return pygame.Rect(cam_x, cam_y, WIDTH, HEIGHT)
+
+    def draw_background(self, screen, surface):
+        """
+        Desenha a parte visível do fundo com zoom diretamente na tela (sem cópias).
+        Para um mapa em pedaços (ChunkedMap), apenas os pedaços visíveis são compostos.
+        """
+        if isinstance(surface, ChunkedMap):
+            surface.draw(screen, self)
+            return
+        zoomed_bg = self.get_zoomed_background(surface)
+        screen.blit(zoomed_bg, (0, 0), self.background_area(zoomed_bg))
 
-        camera_rect_zoom = pygame.Rect(cam_x, cam_y, WIDTH, HEIGHT)
-        return zoomed_bg.subsurface(camera_rect_zoom).copy()
+    def apply_zoom_to_background(self, surface):
+        """
+        Aplica o zoom ao fundo do mapa e retorna a área correspondente à câmera
+        como subsuperfície do fundo em cache (não deve ser modificada).
+        """
+        zoomed_bg = self.get_zoomed_background(surface)
+        area = self.background_area(zoomed_bg).clip(zoomed_bg.get_rect())
+        return zoomed_bg.subsurface(area)
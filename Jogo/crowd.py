@@ -0,0 +1,96 @@
+import math
+from settings import SEPARATION_RADIUS, SEPARATION_BUDGET, SEPARATION_MAX_NEIGHBOURS, SEPARATION_STRENGTH
+
+# Ângulo de ouro: direções bem espalhadas para separar inimigos exatamente sobrepostos
+GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+
+
+class CrowdSeparation:
+    def __init__(self, radius=SEPARATION_RADIUS, budget=SEPARATION_BUDGET,
+                 max_neighbours=SEPARATION_MAX_NEIGHBOURS, strength=SEPARATION_STRENGTH):
+        """
+        Afasta inimigos sobrepostos para que a onda não se empilhe no mesmo ponto.
+        A cada tick os centros dos inimigos são distribuídos numa grade uniforme com
+        células do tamanho do raio; cada inimigo só compara sua posição com os das
+        9 células ao redor, então o custo cresce com a densidade local e não com n².
+
+        Parâmetros:
+            radius (int): Distância (pixels) entre centros abaixo da qual dois inimigos se repelem.
+            budget (int): Máximo de inimigos separados por tick; os demais são processados
+                nos ticks seguintes (rodízio), limitando o custo em ondas muito grandes.
+            max_neighbours (int): Máximo de vizinhos considerados por inimigo (limita o custo
+                quando muitos inimigos já estão amontoados).
+            strength (float): Deslocamento máximo (pixels por tick) causado pela separação.
+        """
+        self.radius = radius
+        self.budget = budget
+        self.max_neighbours = max_neighbours
+        self.strength = strength
+        self._cursor = 0
+
+    def apply(self, centers, active):
+        """
+        Separa até 'budget' inimigos e retorna os deslocamentos [(índice, dx, dy), ...].
+        'centers' são os centros dos inimigos e 'active' indica quais já estão visíveis
+        (os demais não empurram nem são empurrados); quem chama aplica os deslocamentos.
+        """
+        count = len(centers)
+        if count < 2 or self.budget <= 0:
+            return []
+
+        radius = self.radius
+        grid = {}  # (cx, cy) -> índices dos inimigos visíveis com o centro na célula
+        for index, (x, y) in enumerate(centers):
+            if active[index]:
+                grid.setdefault((x // radius, y // radius), []).append(index)
+
+        if count <= self.budget:
+            indices = range(count)
+        else:
+            start = self._cursor % count
+            indices = [(start + offset) % count for offset in range(self.budget)]
+            self._cursor = (start + self.budget) % count
+
+        moves = []
+        for index in indices:
+            if not active[index]:
+                continue
+            x, y = centers[index]
+            push_x = push_y = 0.0
+            neighbours = 0
+            for other in self._nearby(grid, x // radius, y // radius):
+                if other == index:
+                    continue
+                dx = x - centers[other][0]
+                dy = y - centers[other][1]
+                distance = math.hypot(dx, dy)
+                if distance >= radius:
+                    continue
+                if distance == 0:
+                    # Exatamente sobrepostos: direção fixa por índice, para que cada um vá para um lado
+                    angle = index * GOLDEN_ANGLE
+                    dx, dy, distance = math.cos(angle), math.sin(angle), 1.0
+                # Metade da sobreposição para cada um dos dois inimigos
+                overlap = (radius - distance) / 2
+                push_x += dx / distance * overlap
+                push_y += dy / distance * overlap
+                neighbours += 1
+                if neighbours >= self.max_neighbours:
+                    break
+
+            length = math.hypot(push_x, push_y)
+            if length == 0:
+                continue
+            scale = min(length, self.strength) / length
+            step_x = round(push_x * scale)
+            step_y = round(push_y * scale)
+            if step_x or step_y:
+                moves.append((index, step_x, step_y))
+        return moves
+
+    @staticmethod
+    def _nearby(grid, cell_x, cell_y):
+        """Índices dos inimigos na célula e nas 8 células vizinhas."""
+        for grid_y in (cell_y - 1, cell_y, cell_y + 1):
+            for grid_x in (cell_x - 1, cell_x, cell_x + 1):
+                yield from grid.get((grid_x, grid_y), ())
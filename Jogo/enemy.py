@@ -1,166 +1,435 @@
-import os
-import pygame
+import array
+import math
 import random
+import threading
+import pygame
 from settings import *
 from item import Item  # Importa os itens para permitir o drop
+from animation import animation_frames
+from sprite_table import enemy_sprites
+from archetypes import ENEMY_ARCHETYPES, archetype_stats
+from gameclock import game_clock
+from spatial import SpatialHash, SpatialGroup
+from timestep import TELEPORT_DISTANCE
 
-class Enemy(pygame.sprite.Sprite):
-    def __init__(self, pos, round_number, all_sprites, items_group):
-        super().__init__()
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Sem NumPy a store é percorrida slot a slot
+
+# Tipos da tabela de arquétipos, pelo índice guardado em cada slot
+ENEMY_TYPES = list(ENEMY_ARCHETYPES)
+ENEMY_TYPE_IDS = {name: index for index, name in enumerate(ENEMY_TYPES)}
+
+# Estado de cada slot da store
+SLOT_FREE = 0
+SLOT_ACTIVE = 1
+SLOT_STASHED = 2  # Guardado enquanto o NPC conversa com o jogador (não anda, não é desenhado)
+
+# Colunas da store: nome -> typecode do array.array ('q' = int64, 'd' = float64, 'B' = uint8, 'b' = int8)
+ENEMY_COLUMNS = {
+    "state": "B",
+    "generation": "q",      # Muda a cada reuso do slot: timers e handles antigos são ignorados
+    "type_id": "B",
+    "round": "q",
+    "x": "q", "y": "q",     # topleft em pixels
+    "w": "q", "h": "q",
+    "prev_x": "q", "prev_y": "q",  # topleft antes do último tick (interpolação da renderização)
+    "speed": "d",
+    "health": "d",
+    "max_health": "d",
+    "damage": "d",
+    "xp_reward": "q",
+    "last_attack": "d",
+    "visible": "B",
+    "frozen": "B",
+    "freeze_serial": "q",   # Cada novo congelamento invalida o timer do anterior
+    "attack_frame": "b",    # Frame da animação de ataque (-1: imagem normal)
+    "attack_serial": "q",   # Cada novo ataque invalida os timers da animação anterior
+}
+NUMPY_DTYPES = {"q": "int64", "d": "float64", "B": "uint8", "b": "int8"}
+
+
+class Enemy:
+    """
+    Inimigo comum (Normal, Rápido, Tanque...) guardado na EnemyStore. O objeto é só um
+    handle (store, slot): o estado fica nos arrays da store e os atributos abaixo leem
+    e escrevem neles. Os atributos fixos de cada tipo vêm da tabela ENEMY_ARCHETYPES:
+    um novo tipo é apenas uma entrada na tabela e uma imagem em sprite_table.py.
+    """
+    __slots__ = ("store", "slot", "generation")
+    batched = True  # Movimento e alvo calculados pela EnemyBatch direto nos arrays (enemy_batch.py)
+
+    def __init__(self, store, slot):
+        self.store = store
+        self.slot = slot
+        self.generation = store.generation[slot]
+
+    @property
+    def rect(self):
+        store, slot = self.store, self.slot
+        return pygame.Rect(store.x[slot], store.y[slot], store.w[slot], store.h[slot])
+
+    @property
+    def type(self):
+        return ENEMY_TYPES[self.store.type_id[self.slot]]
+
+    @property
+    def health(self):
+        return self.store.health[self.slot]
+
+    @health.setter
+    def health(self, value):
+        self.store.health[self.slot] = value
+
+    @property
+    def max_health(self):
+        return self.store.max_health[self.slot]
+
+    @property
+    def xp_reward(self):
+        return self.store.xp_reward[self.slot]
+
+    @property
+    def attack_damage(self):
+        return self.store.damage[self.slot]
+
+    @property
+    def speed(self):
+        return self.store.speed[self.slot]
+
+    @property
+    def visible(self):
+        return bool(self.store.visible[self.slot])
 
-        self.current_path = os.path.dirname(__file__)
-        self.type = "Normal"
-
-        # Multiplicadores baseados no round
-        strength_multiplier = 1.5 if round_number % 2 == 0 else 1
-        damage_multiplier = 0.75 if round_number % 2 == 0 else 1
-
-        # XP reward
-        base_xp = 20
-        self.xp_reward = base_xp + (round_number * 5)
-
-        # Configurações específicas para o inimigo Normal
-        self.speed = ENEMY_SPEED + (round_number * 0.2)
-        self.health = self.max_health = (ENEMY_HEALTH + (round_number * 10)) * strength_multiplier
-        self.attack_damage = (10 + (round_number * 2)) * damage_multiplier
-        scale_factor = 1.0
-        self.can_be_frozen = True
-
-        # Carrega a imagem e aplica escala
-        enemy_image_path = os.path.join(self.current_path, "assets", "enemy.png")
-        try:
-            original_image = pygame.image.load(enemy_image_path).convert_alpha()
-        except pygame.error:
-            print(f"⚠️ ERRO: Imagem do inimigo {enemy_image_path} não encontrada!")
-            original_image = pygame.Surface((50, 50), pygame.SRCALPHA)
-            original_image.fill((255, 0, 255))
-
-        # Escala: aumenta 2% a cada round
-        scale_factor += round_number * 0.02
-        new_size = (int(128 * scale_factor), int(128 * scale_factor))
-        self.normal_image = pygame.transform.scale(original_image, new_size)
-        self.image = self.normal_image
-        self.rect = self.image.get_rect(center=pos)
-
-        # Configurações de ataque e spawn
-        self.attack_cooldown = 1000  # em ms
-        self.last_attack_time = 0
-        self.spawn_time = pygame.time.get_ticks() + 2500  # Delay de 2.5s
+    @property
+    def frozen(self):
+        return bool(self.store.frozen[self.slot])
+
+    def alive(self):
+        """Indica se o slot ainda pertence a este inimigo (não morreu nem foi reusado)."""
+        store, slot = self.store, self.slot
+        return store.state[slot] != SLOT_FREE and store.generation[slot] == self.generation
+
+    def take_damage(self, amount):
+        if self.alive():
+            self.store.take_damage(self.slot, amount)
+
+    def kill(self):
+        if self.alive():
+            self.store.kill(self.slot)
+
+
+class EnemySprite(pygame.sprite.Sprite):
+    """Sprite de um inimigo da store, criado só enquanto ele aparece na tela (ver EnemyStore.views)."""
+
+    def __init__(self):
+        super().__init__()
+        self.image = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
         self.visible = False
+        self.health = self.max_health = 0
+
 
-        # Controle de congelamento
-        self.frozen_until = 0
+class EnemyStore:
+    def __init__(self, all_sprites, items_group, capacity=ENEMY_STORE_CAPACITY, cell_size=SPATIAL_CELL_SIZE):
+        """
+        Inimigos comuns em estrutura de arrays: cada atributo (posição, vida, flags de
+        visível/congelado, cooldown, frame de ataque...) é um array tipado indexado pelo
+        slot do inimigo, sem um objeto pygame.sprite.Sprite com dicionário próprio por
+        inimigo. Slots livres são reusados; os arrays crescem quando todos estão ocupados.
+
+        A store se comporta como o grupo de inimigos (iteração, len, consultas espaciais
+        de colliding()/within_radius()) e devolve handles Enemy. Os sprites só existem
+        para os inimigos na área da câmera (views()), reaproveitados entre os frames.
+        O Boss, com máquina de estados própria, continua sendo um sprite e fica em 'extras'.
 
-        # Grupos para drops
+        Parâmetros:
+            all_sprites, items_group: Grupos que recebem os itens dropados.
+            capacity (int): Slots reservados inicialmente.
+            cell_size (int): Tamanho das células do índice espacial.
+        """
         self.all_sprites = all_sprites
         self.items_group = items_group
+        self.capacity = 0
+        for name, typecode in ENEMY_COLUMNS.items():
+            setattr(self, name, array.array(typecode))
+        self._handles = []
+        self._free = []      # Slots livres (pilha: o último liberado é o próximo usado)
+        self._active = {}    # Slots ativos, na ordem de spawn (dict usado como conjunto ordenado)
+        self._stashed = {}
+        self.spatial = SpatialHash(cell_size)
+        self.extras = SpatialGroup(cell_size=cell_size)  # Inimigos com classe própria (o Boss)
+        self.on_screen = []  # Sprites desenhados no último views()
+        self._views = {}     # slot -> EnemySprite enquanto o inimigo está na tela
+        self._spare_views = []
+        self._images = {}    # (tipo, round) -> (imagem normal, frames de ataque)
+        # A thread de rede do multiplayer sincroniza inimigos enquanto o jogo atualiza
+        self.lock = threading.RLock()
+        self._grow(max(1, capacity))
 
-        # Adiciona o inimigo ao grupo de sprites
-        self.all_sprites.add(self)
-        print(f"👿 {self.type} spawnado na posição {self.rect.topleft}, XP Reward={self.xp_reward}")
-
-        # --- Animação de Ataque ---
-        self.attack_frames = [
-            pygame.transform.scale(
-                pygame.image.load(os.path.join(self.current_path, "assets", "enemy_frame(1).png")).convert_alpha(),
-                (1920, 1080)
-            ),
-            pygame.transform.scale(
-                pygame.image.load(os.path.join(self.current_path, "assets", "enemy_frame(2).png")).convert_alpha(),
-                (1920, 1080)
-            )
-        ]
-        self.attack_anim_duration = 200      # Duração total da animação (ms)
-        self.attack_anim_frame_time = 100    # Tempo de cada frame (ms)
-        self.attack_anim_start = None
-        self.attacking = False
-
-    def play_attack_animation(self):
-        """Inicia a animação de ataque do inimigo."""
-        self.attacking = True
-        self.attack_anim_start = pygame.time.get_ticks()
-
-    def update(self, players):
-        """Atualiza o inimigo a cada frame."""
-        current_time = pygame.time.get_ticks()
-
-        # Atualiza a animação de ataque se estiver ocorrendo
-        if self.attacking:
-            elapsed = current_time - self.attack_anim_start
-            frame_index = int(elapsed / self.attack_anim_frame_time)
-            if frame_index < len(self.attack_frames):
-                self.image = self.attack_frames[frame_index]
-            else:
-                self.image = self.normal_image
-                self.attacking = False
-
-        # Torna o inimigo visível após o spawn_time
-        if not self.visible:
-            if current_time >= self.spawn_time:
-                self.visible = True
-                print(f"👀 {self.type} agora está visível!")
-            else:
+    # --- Armazenamento ---
+    def _grow(self, extra):
+        """Aumenta todos os arrays em 'extra' slots livres."""
+        old = self.capacity
+        for name, typecode in ENEMY_COLUMNS.items():
+            getattr(self, name).extend(array.array(typecode, bytes(array.array(typecode).itemsize * extra)))
+        self.attack_frame[old:] = array.array("b", [-1] * extra)
+        self._handles.extend([None] * extra)
+        self._free.extend(range(old + extra - 1, old - 1, -1))
+        self.capacity = old + extra
+
+    def numpy_columns(self, *names):
+        """
+        Views do NumPy (sem cópia) das colunas informadas, para a atualização em lote.
+        Não guardar as views: enquanto existirem, os arrays não podem crescer.
+        """
+        return [np.frombuffer(getattr(self, name), dtype=NUMPY_DTYPES[ENEMY_COLUMNS[name]]) for name in names]
+
+    def active_slots(self):
+        return list(self._active)
+
+    def handle(self, slot):
+        return self._handles[slot]
+
+    def _images_for(self, type_id, round_number):
+        """Imagem normal e frames de ataque do tipo no round (compartilhados pelos inimigos iguais)."""
+        key = (type_id, round_number)
+        images = self._images.get(key)
+        if images is None:
+            enemy_type = ENEMY_TYPES[type_id]
+            try:
+                normal_image = enemy_sprites.get(enemy_type, round_number)
+            except (pygame.error, FileNotFoundError):
+                print(f"⚠️ ERRO: Imagem do inimigo {enemy_sprites.path_for(enemy_type)} não encontrada!")
+                original_image = pygame.Surface((50, 50), pygame.SRCALPHA)
+                original_image.fill((255, 0, 255))
+                normal_image = pygame.transform.scale(original_image, enemy_sprites.size_for(enemy_type, round_number))
+            images = (normal_image, animation_frames.frames("enemy_attack", normal_image.get_size()))
+            self._images[key] = images
+        return images
+
+    # --- Ciclo de vida ---
+    def spawn(self, enemy_type, pos, round_number):
+        """Cria um inimigo do tipo no round, centralizado em 'pos', e retorna o seu handle."""
+        archetype = ENEMY_ARCHETYPES[enemy_type]
+        stats = archetype_stats(enemy_type, round_number)
+        type_id = ENEMY_TYPE_IDS[enemy_type]
+        width, height = self._images_for(type_id, round_number)[0].get_size()
+        with self.lock:
+            if not self._free:
+                self._grow(self.capacity)
+            slot = self._free.pop()
+            x, y = pos[0] - width // 2, pos[1] - height // 2
+            self.state[slot] = SLOT_ACTIVE
+            self.type_id[slot] = type_id
+            self.round[slot] = round_number
+            self.x[slot] = self.prev_x[slot] = x
+            self.y[slot] = self.prev_y[slot] = y
+            self.w[slot], self.h[slot] = width, height
+            self.speed[slot] = stats["speed"]
+            self.health[slot] = self.max_health[slot] = stats["max_health"]
+            self.damage[slot] = stats["attack_damage"]
+            self.xp_reward[slot] = stats["xp_reward"]
+            self.last_attack[slot] = 0
+            self.visible[slot] = self.frozen[slot] = 0
+            self.attack_frame[slot] = -1
+            enemy = self._handles[slot] = Enemy(self, slot)
+            self._active[slot] = None
+            self.spatial.insert(enemy)
+        # O inimigo aparece após spawn_delay ms de jogo
+        game_clock.schedule(archetype["spawn_delay"], self.appear, slot, enemy.generation)
+        print(f"👿 {enemy_type} spawnado na posição {(x, y)}, XP Reward={stats['xp_reward']}")
+        return enemy
+
+    def appear(self, slot, generation):
+        """Torna o inimigo visível (chamado pelo relógio do jogo após o spawn_delay)."""
+        if self.generation[slot] == generation and self.state[slot] != SLOT_FREE:
+            self.visible[slot] = 1
+            print(f"👀 {ENEMY_TYPES[self.type_id[slot]]} agora está visível!")
+
+    def kill(self, slot):
+        """Remove o inimigo e libera o slot (os timers pendentes dele passam a ser ignorados)."""
+        with self.lock:
+            if self.state[slot] == SLOT_FREE:
                 return
+            enemy = self._handles[slot]
+            self._handles[slot] = None
+            self._active.pop(slot, None)
+            self._stashed.pop(slot, None)
+            self.spatial.remove(enemy)
+            self.state[slot] = SLOT_FREE
+            self.generation[slot] += 1
+            self.visible[slot] = self.frozen[slot] = 0
+            self.attack_frame[slot] = -1
+            view = self._views.pop(slot, None)
+            if view is not None:
+                self._spare_views.append(view)
+            self._free.append(slot)
 
-        # Se estiver congelado, não age
-        if current_time < self.frozen_until:
-            return
+    def empty(self):
+        with self.lock:
+            for slot in list(self._active) + list(self._stashed):
+                self.kill(slot)
+            self.extras.empty()
+            self._images.clear()
 
-        # Se players não for uma lista, converte para lista
-        if not isinstance(players, list):
-            players = [players]
+    def add(self, *sprites):
+        """Adiciona inimigos com classe própria (ex.: o Boss); os comuns são criados com spawn()."""
+        self.extras.add(*sprites)
 
-        # Seleciona o jogador mais próximo
-        target = None
-        min_dist = float('inf')
-        for p in players:
-            dist = pygame.math.Vector2(self.rect.center).distance_to(p.rect.center)
-            if dist < min_dist:
-                min_dist = dist
-                target = p
+    def stash(self):
+        """
+        Guarda todos os inimigos (ex.: durante o diálogo com o NPC): eles deixam de andar,
+        de ser desenhados e de contar em len(). Retorna a lista para restore().
+        """
+        with self.lock:
+            pending = [self._handles[slot] for slot in self._active]
+            for enemy in pending:
+                self.state[enemy.slot] = SLOT_STASHED
+                self._stashed[enemy.slot] = None
+                self.spatial.remove(enemy)
+            self._active.clear()
+            extras = self.extras.sprites()
+            for sprite in extras:
+                self.all_sprites.remove(sprite)
+            self.extras.empty()
+        return pending + extras
 
-        if target is None:
+    def restore(self, pending):
+        """Devolve ao jogo os inimigos guardados por stash()."""
+        with self.lock:
+            for enemy in pending:
+                if isinstance(enemy, Enemy):
+                    if enemy.alive() and enemy.slot in self._stashed:
+                        del self._stashed[enemy.slot]
+                        self.state[enemy.slot] = SLOT_ACTIVE
+                        self._active[enemy.slot] = None
+                        self.spatial.insert(enemy)
+                else:
+                    self.all_sprites.add(enemy)
+                    self.extras.add(enemy)
+
+    # --- Interface de grupo ---
+    def __iter__(self):
+        return iter([self._handles[slot] for slot in self._active] + self.extras.sprites())
+
+    def __len__(self):
+        return len(self._active) + len(self.extras)
+
+    def __contains__(self, enemy):
+        if isinstance(enemy, Enemy):
+            return enemy.store is self and enemy.alive() and enemy.slot in self._active
+        return enemy in self.extras
+
+    def query_rect(self, rect):
+        return self.spatial.query_rect(rect) + self.extras.query_rect(rect)
+
+    def query_radius(self, center, radius):
+        return self.spatial.query_radius(center, radius) + self.extras.query_radius(center, radius)
+
+    # --- Comportamento ---
+    def move(self, slot, dx, dy):
+        """Desloca o inimigo e atualiza o índice espacial."""
+        self.x[slot] += dx
+        self.y[slot] += dy
+        self.spatial.update(self._handles[slot])
+
+    def update_slot(self, slot, players, flow_field=None):
+        """
+        Atualiza um inimigo (ver enemy_batch.py para a atualização em lote).
+        Com um flow_field (flowfield.py) o alvo e o caminho vêm do campo compartilhado,
+        contornando obstáculos; sem ele o inimigo anda reto até o jogador mais próximo.
+        """
+        # Aguardando o spawn ou congelado: não age (os timers do relógio mudam esses estados)
+        if not self.visible[slot] or self.frozen[slot]:
             return
 
-        # Movimento em direção ao alvo
-        direction = pygame.math.Vector2(
-            target.rect.centerx - self.rect.centerx,
-            target.rect.centery - self.rect.centery
-        )
-        if direction.length() != 0:
-            direction = direction.normalize()
-        self.rect.x += int(direction.x * self.speed)
-        self.rect.y += int(direction.y * self.speed)
+        center_x = self.x[slot] + self.w[slot] // 2
+        center_y = self.y[slot] + self.h[slot] // 2
+        target = waypoint = None
+        if flow_field is not None:
+            target, waypoint = flow_field.steer((center_x, center_y))
 
-        self.attack(target)
+        # Sem campo (ou fora dele): seleciona o jogador mais próximo
+        if target is None:
+            min_dist = float('inf')
+            for p in players:
+                dist = math.hypot(p.rect.centerx - center_x, p.rect.centery - center_y)
+                if dist < min_dist:
+                    min_dist = dist
+                    target = p
+            if target is None:
+                return
+            waypoint = target.rect.center
+
+        # Movimento em direção ao alvo (ou ao próximo ponto do caminho)
+        dx = waypoint[0] - center_x
+        dy = waypoint[1] - center_y
+        length = math.hypot(dx, dy)
+        if length != 0:
+            dx, dy = dx / length, dy / length
+        speed = self.speed[slot]
+        step_x, step_y = int(dx * speed), int(dy * speed)
+        if step_x or step_y:
+            self.move(slot, step_x, step_y)
 
-    def attack(self, target):
+        self.attack(slot, target)
+
+    def attack(self, slot, target):
         """Ataca o jogador se houver colisão e o cooldown permitir."""
-        current_time = pygame.time.get_ticks()
-        if self.visible and self.rect.colliderect(target.rect) and (current_time - self.last_attack_time >= self.attack_cooldown):
-            self.play_attack_animation()
-            target.take_damage(self.attack_damage)
-            self.last_attack_time = current_time
+        current_time = game_clock.now()
+        cooldown = ENEMY_ARCHETYPES[ENEMY_TYPES[self.type_id[slot]]]["attack_cooldown"]
+        rect = pygame.Rect(self.x[slot], self.y[slot], self.w[slot], self.h[slot])
+        if self.visible[slot] and rect.colliderect(target.rect) and (current_time - self.last_attack[slot] >= cooldown):
+            self.play_attack_animation(slot)
+            target.take_damage(self.damage[slot])
+            self.last_attack[slot] = current_time
 
-    def take_damage(self, amount):
+    def play_attack_animation(self, slot):
+        """Inicia a animação de ataque; os frames seguintes são trocados por timers."""
+        self.attack_serial[slot] += 1
+        self.show_attack_frame(slot, self.generation[slot], self.attack_serial[slot], 0)
+
+    def show_attack_frame(self, slot, generation, serial, frame_index):
+        """Mostra o frame da animação de ataque e agenda o próximo (ou a volta à imagem normal)."""
+        if self.generation[slot] != generation or self.attack_serial[slot] != serial:
+            return  # Inimigo morto ou animação reiniciada por um novo ataque
+        attack_frames = self._images_for(self.type_id[slot], self.round[slot])[1]
+        if frame_index < len(attack_frames):
+            self.attack_frame[slot] = frame_index
+            game_clock.schedule(ENEMY_ATTACK_FRAME_TIME, self.show_attack_frame, slot, generation, serial, frame_index + 1)
+        else:
+            self.attack_frame[slot] = -1
+
+    def take_damage(self, slot, amount):
         """Reduz a vida do inimigo. Se <=0, dropa um item e remove o inimigo."""
-        self.health -= amount
-        if self.health <= 0:
-            print(f"☠️ {self.type} eliminado! XP Reward={self.xp_reward}")
-            self.drop_item()
-            self.kill()
+        self.health[slot] -= amount
+        enemy_type = ENEMY_TYPES[self.type_id[slot]]
+        if self.health[slot] <= 0:
+            print(f"☠️ {enemy_type} eliminado! XP Reward={self.xp_reward[slot]}")
+            self.drop_item(slot)
+            self.kill(slot)
         else:
-            self.freeze_enemy()
+            self.freeze(slot)
 
-    def freeze_enemy(self):
-        """Congela o inimigo por 1.5s se permitido."""
-        if self.can_be_frozen:
-            self.frozen_until = pygame.time.get_ticks() + 1500
-            print(f"❄️ {self.type} congelado por 1.5s!")
+    def freeze(self, slot):
+        """Congela o inimigo por 1.5s se o tipo permitir (o Tanque é resistente)."""
+        enemy_type = ENEMY_TYPES[self.type_id[slot]]
+        if ENEMY_ARCHETYPES[enemy_type]["can_be_frozen"]:
+            # Um novo golpe reinicia a contagem do congelamento
+            self.frozen[slot] = 1
+            self.freeze_serial[slot] += 1
+            game_clock.schedule(ENEMY_FREEZE_DURATION, self.unfreeze, slot, self.generation[slot], self.freeze_serial[slot])
+            print(f"❄️ {enemy_type} congelado por 1.5s!")
         else:
-            print(f"🔥 {self.type} é resistente a congelamento!")
+            print(f"🔥 {enemy_type} é resistente a congelamento!")
+
+    def unfreeze(self, slot, generation, serial):
+        if self.generation[slot] == generation and self.freeze_serial[slot] == serial:
+            self.frozen[slot] = 0
 
-    def drop_item(self):
+    def drop_item(self, slot):
         """
         Realiza o drop de item (30% de chance):
           - Se drop_chance < 0.1: 'Super Health Potion'
@@ -168,57 +437,78 @@ class Enemy(pygame.sprite.Sprite):
         """
         drop_chance = random.random()
         if drop_chance < 0.3:
+            center = (self.x[slot] + self.w[slot] // 2, self.y[slot] + self.h[slot] // 2)
             if drop_chance < 0.1:
                 item_name = "Super Health Potion"
-                item = Item(self.rect.center, item_name, special=True)
+                item = Item(center, item_name, special=True)
                 print("💖 Super Health Potion dropada!")
             else:
                 item_name = random.choice(["Health Potion", "Mana Potion", "Gold Coin"])
-                item = Item(self.rect.center, item_name)
+                item = Item(center, item_name)
             self.all_sprites.add(item)
             self.items_group.add(item)
-            print(f"🆕 Item dropado: {item_name} na posição {self.rect.center}")
+            print(f"🆕 Item dropado: {item_name} na posição {center}")
 
-    def draw_health_bar(self, screen, zoomed_rect=None):
-        """Desenha a barra de vida acima do inimigo."""
-        if not self.visible:
-            return
+    # --- Renderização ---
+    def snapshot(self):
+        """Registra a posição atual de todos os slots (chamar antes de cada tick, como Interpolator.snapshot)."""
+        with self.lock:
+            self.prev_x[:] = self.x
+            self.prev_y[:] = self.y
 
-        if zoomed_rect is None:
-            bar_width = 50
-            bar_height = 5
-            fill = (self.health / self.max_health) * bar_width
-            fill = max(min(fill, bar_width), 0)
-            outline_rect = pygame.Rect(
-                self.rect.centerx - bar_width // 2,
-                self.rect.top - 10,
-                bar_width,
-                bar_height
-            )
-            fill_rect = pygame.Rect(
-                self.rect.centerx - bar_width // 2,
-                self.rect.top - 10,
-                fill,
-                bar_height
-            )
-        else:
-            bar_width = zoomed_rect.width * 0.6
-            bar_height = 5
-            fill = (self.health / self.max_health) * bar_width
-            fill = max(min(fill, bar_width), 0)
-            outline_rect = pygame.Rect(
-                zoomed_rect.centerx - bar_width // 2,
-                zoomed_rect.top - 10,
-                bar_width,
-                bar_height
-            )
-            fill_rect = pygame.Rect(
-                zoomed_rect.centerx - bar_width // 2,
-                zoomed_rect.top - 10,
-                fill,
-                bar_height
-            )
-
-        pygame.draw.rect(screen, (255, 255, 255), outline_rect)
-        pygame.draw.rect(screen, (255, 0, 0), fill_rect)
-        pygame.draw.rect(screen, (0, 0, 0), outline_rect, 1)
+    def _interpolated(self, slot, alpha):
+        x, y = self.x[slot], self.y[slot]
+        dx, dy = x - self.prev_x[slot], y - self.prev_y[slot]
+        if (dx == 0 and dy == 0) or abs(dx) > TELEPORT_DISTANCE or abs(dy) > TELEPORT_DISTANCE:
+            return x, y
+        return round(self.prev_x[slot] + dx * alpha), round(self.prev_y[slot] + dy * alpha)
+
+    def views(self, camera, alpha=1.0, padding=CULL_PADDING):
+        """
+        Sprites dos inimigos na área visível da câmera, na posição interpolada entre o
+        tick anterior e o atual (alpha, ver timestep.py), mais os inimigos de 'extras'.
+        Só os inimigos na tela recebem um sprite; os sprites dos que saíram voltam ao estoque.
+        """
+        area = camera.camera_rect.inflate(padding * 2, padding * 2)
+        with self.lock:
+            slots = self.active_slots()
+            if np is not None and len(slots) >= ENEMY_BATCH_THRESHOLD:
+                positions = self._visible_positions_batch(slots, area, alpha)
+            else:
+                positions = []
+                for slot in slots:
+                    x, y = self._interpolated(slot, alpha)
+                    if area.colliderect((x, y, self.w[slot], self.h[slot])):
+                        positions.append((slot, x, y))
+
+            views = {}
+            on_screen = []
+            for slot, x, y in positions:
+                view = self._views.pop(slot, None)
+                if view is None:
+                    view = self._spare_views.pop() if self._spare_views else EnemySprite()
+                normal_image, attack_frames = self._images_for(self.type_id[slot], self.round[slot])
+                frame = self.attack_frame[slot]
+                view.image = attack_frames[frame] if 0 <= frame < len(attack_frames) else normal_image
+                view.rect.update(x, y, self.w[slot], self.h[slot])
+                view.visible = bool(self.visible[slot])
+                view.health = self.health[slot]
+                view.max_health = self.max_health[slot]
+                views[slot] = view
+                on_screen.append(view)
+            self._spare_views.extend(self._views.values())
+            self._views = views
+        on_screen.extend(sprite for sprite in self.extras if area.colliderect(sprite.rect))
+        self.on_screen = on_screen
+        return on_screen
+
+    def _visible_positions_batch(self, slots, area, alpha):
+        """Como o laço de views(), com a interpolação e o teste de visibilidade em arrays."""
+        index = np.array(slots, dtype=np.int64)
+        x, y, prev_x, prev_y, w, h = (column[index] for column in self.numpy_columns("x", "y", "prev_x", "prev_y", "w", "h"))
+        dx, dy = x - prev_x, y - prev_y
+        smooth = ((dx != 0) | (dy != 0)) & (np.abs(dx) <= TELEPORT_DISTANCE) & (np.abs(dy) <= TELEPORT_DISTANCE)
+        x = np.where(smooth, np.round(prev_x + dx * alpha), x).astype(np.int64)
+        y = np.where(smooth, np.round(prev_y + dy * alpha), y).astype(np.int64)
+        visible = (x < area.right) & (area.left < x + w) & (y < area.bottom) & (area.top < y + h) & (w > 0) & (h > 0)
+        return [(slots[i], int(x[i]), int(y[i])) for i in np.flatnonzero(visible)]
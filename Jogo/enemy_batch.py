@@ -0,0 +1,137 @@
+from settings import ENEMY_BATCH_THRESHOLD
+from crowd import CrowdSeparation
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Sem NumPy, cada inimigo é atualizado individualmente
+
+
+class EnemyBatch:
+    def __init__(self, threshold=ENEMY_BATCH_THRESHOLD, separation=None):
+        """
+        Atualização dos inimigos da EnemyStore (enemy.py) direto nos arrays da store.
+        Com 'threshold' inimigos ou mais (e NumPy instalado), a escolha do jogador mais
+        próximo e o movimento da onda inteira são calculados com poucas operações sobre
+        views do NumPy das colunas da store, sem cópia para objetos; abaixo disso o laço
+        slot a slot (EnemyStore.update_slot) é mais barato.
+
+        Depois do movimento, 'separation' (crowd.py) afasta os inimigos sobrepostos.
+        """
+        self.threshold = threshold
+        self.separation = separation if separation is not None else CrowdSeparation()
+
+    def update(self, enemies, players, flow_field=None):
+        """
+        Atualiza todos os inimigos da store (movimento e ataque).
+        Com um flow_field (flowfield.py), o campo é atualizado uma vez e define o alvo
+        e o caminho de cada inimigo; sem ele os inimigos andam reto até o jogador mais próximo.
+        """
+        if not isinstance(players, list):
+            players = [players]
+        if not players:
+            return
+        if flow_field is not None:
+            flow_field.update(players)
+
+        # Inimigos com classe própria (ex.: o boss, cuja máquina de estados persegue um único jogador)
+        for enemy in enemies.extras.sprites():
+            enemy.update(nearest_player(enemy.rect.center, players, flow_field))
+            enemies.extras.spatial.update(enemy)
+
+        with enemies.lock:
+            slots = enemies.active_slots()
+            if np is None or len(slots) < self.threshold:
+                for slot in slots:
+                    enemies.update_slot(slot, players, flow_field)
+                centers = [(enemies.x[slot] + enemies.w[slot] // 2, enemies.y[slot] + enemies.h[slot] // 2) for slot in slots]
+                active = [enemies.visible[slot] for slot in slots]
+            else:
+                centers, active = self._update_batch(enemies, slots, players, flow_field)
+
+            # Separação da multidão
+            for index, step_x, step_y in self.separation.apply(centers, active):
+                enemies.move(slots[index], step_x, step_y)
+
+    def _update_batch(self, enemies, slots, players, flow_field=None):
+        """Movimento e ataque da onda em arrays; retorna (centros, visíveis) para a separação."""
+        index = np.array(slots, dtype=np.int64)
+        x, y, w, h, speed, visible, frozen = enemies.numpy_columns("x", "y", "w", "h", "speed", "visible", "frozen")
+        pos = np.stack([x[index], y[index]], axis=1)
+        size = np.stack([w[index], h[index]], axis=1)
+        shown = visible[index] != 0
+        centers = pos + size // 2
+
+        # Spawn e congelamento são alterados pelos timers do relógio do jogo (gameclock.py)
+        active = shown & (frozen[index] == 0)
+        if not active.any():
+            return centers.tolist(), shown.tolist()
+
+        target_rects = np.array([tuple(player.rect) for player in players], dtype=np.int64)
+        target_centers = target_rects[:, :2] + target_rects[:, 2:] // 2
+        if flow_field is not None and flow_field.active:
+            # Alvo e próximo ponto do caminho lidos do campo, uma consulta O(1) por inimigo
+            source, waypoints, direct = flow_field.arrays()
+            cell = flow_field.cell_size
+            cells = (
+                np.clip(centers[:, 1] // cell, 0, flow_field.rows - 1) * flow_field.cols
+                + np.clip(centers[:, 0] // cell, 0, flow_field.cols - 1)
+            )
+            nearest = source[cells]
+            outside = nearest < 0
+            if outside.any():
+                nearest[outside] = self._nearest(centers[outside], target_centers)
+            use_target = direct[cells] | outside
+            goal = np.where(use_target[:, None], target_centers[nearest], waypoints[cells])
+        else:
+            nearest = self._nearest(centers, target_centers)
+            goal = target_centers[nearest]
+
+        # Direção normalizada até o destino; o passo é truncado como int() em update_slot()
+        direction = (goal - centers).astype(np.float64)
+        length = np.hypot(direction[:, 0], direction[:, 1])
+        np.divide(direction, length[:, None], out=direction, where=length[:, None] != 0)
+        step = np.trunc(direction * speed[index][:, None]).astype(np.int64)
+        step[~active] = 0
+        old_pos = pos.copy()
+        pos += step
+        x[index] = pos[:, 0]
+        y[index] = pos[:, 1]
+        centers += step
+
+        # Índice espacial: só os inimigos que mudaram de célula são reposicionados na grade
+        cell = enemies.spatial.cell_size
+        last = size - 1
+        changed = ((old_pos // cell != pos // cell) | ((old_pos + last) // cell != (pos + last) // cell)).any(axis=1)
+        for i in np.flatnonzero(changed):
+            enemies.spatial.update(enemies.handle(slots[i]))
+
+        # Ataque: apenas inimigos ativos em contato com o seu alvo (o cooldown é verificado em attack())
+        target = target_rects[nearest]
+        touching = (
+            (pos[:, 0] < target[:, 0] + target[:, 2]) & (target[:, 0] < pos[:, 0] + size[:, 0])
+            & (pos[:, 1] < target[:, 1] + target[:, 3]) & (target[:, 1] < pos[:, 1] + size[:, 1])
+        )
+        for i in np.flatnonzero(active & touching):
+            enemies.attack(slots[i], players[nearest[i]])
+        return centers.tolist(), shown.tolist()
+
+    @staticmethod
+    def _nearest(centers, target_centers):
+        """Índice do jogador mais próximo de cada centro (distâncias entre todos os pares de uma vez)."""
+        offsets = target_centers[None, :, :] - centers[:, None, :]
+        return (offsets ** 2).sum(axis=2).argmin(axis=1)
+
+
+def nearest_player(position, players, flow_field=None):
+    """Jogador mais próximo da posição (pelo campo de direções, se houver, ou em linha reta)."""
+    if flow_field is not None:
+        player, _ = flow_field.steer(position)
+        if player is not None:
+            return player
+    x, y = position
+    return min(players, key=lambda player: (player.rect.centerx - x) ** 2 + (player.rect.centery - y) ** 2)
+
+
+# Atualizador em lote compartilhado
+enemy_batch = EnemyBatch()
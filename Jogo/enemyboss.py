@@ -1,8 +1,10 @@
-import os
 import pygame
 import random
 from settings import *
 from item import Item
+from sprite_table import enemy_sprites
+from archetypes import ENEMY_ARCHETYPES, archetype_stats
+from gameclock import game_clock
 
 STATE_IDLE    = 0
 STATE_CHASE   = 1
@@ -11,37 +13,42 @@ STATE_SPECIAL = 3
 STATE_EVADE   = 4
 
 class EnemyBoss(pygame.sprite.Sprite):
+    # Barra de vida maior que a dos inimigos comuns (ver healthbar.py)
+    health_bar_size = (150, 10)
+    health_bar_offset = 20
+    health_bar_border = 2
+
     def __init__(self, pos, round_number, all_sprites, items_group):
         super().__init__()
-        current_path = os.path.dirname(__file__)
-        boss_image_path = os.path.join(current_path, "assets", "boss.png")
+        self.type = "Boss"
+
+        # Imagem escalada conforme o round (2.0 + 5% por round), vinda da tabela compartilhada
         try:
-            original_image = pygame.image.load(boss_image_path).convert_alpha()
-        except pygame.error:
-            print(f"⚠️ ERRO: Imagem do Boss '{boss_image_path}' não encontrada!")
+            self.image = enemy_sprites.get(self.type, round_number)
+        except (pygame.error, FileNotFoundError):
+            print(f"⚠️ ERRO: Imagem do Boss '{enemy_sprites.path_for(self.type)}' não encontrada!")
             original_image = pygame.Surface((100, 100), pygame.SRCALPHA)
             original_image.fill((255, 0, 255))
-        
-        # Calcula um fator de escala baseado no round
-        scale_factor = 2.0 + round_number * 0.05
-        new_size = (int(256 * scale_factor), int(256 * scale_factor))
-        self.image = pygame.transform.scale(original_image, new_size)
+            self.image = pygame.transform.scale(original_image, enemy_sprites.size_for(self.type, round_number))
         self.rect = self.image.get_rect(center=pos)
 
-        # Atributos de saúde e dano ajustados conforme o round
-        self.max_health = 500 + round_number * 50
+        # Atributos de saúde, dano e XP ajustados conforme o round (tabela em archetypes.py)
+        archetype = ENEMY_ARCHETYPES[self.type]
+        stats = archetype_stats(self.type, round_number)
+        self.max_health = stats["max_health"]
         self.health = self.max_health
-        self.attack_damage = 30 + round_number * 5
-        self.speed = 1.5
-        self.attack_cooldown = 1500  # em milissegundos
+        self.attack_damage = stats["attack_damage"]
+        self.xp_reward = stats["xp_reward"]
+        self.speed = stats["speed"]
+        self.attack_cooldown = archetype["attack_cooldown"]  # em milissegundos
         self.last_attack_time = 0
 
         self.special_attack_cooldown = 5000
         self.last_special_attack = 0
 
-        # Tempo para spawn (o boss não aparece imediatamente)
-        self.spawn_time = pygame.time.get_ticks() + 3000
+        # Tempo para spawn (o boss não aparece imediatamente; o relógio do jogo chama appear())
         self.visible = False
+        game_clock.schedule(archetype["spawn_delay"], self.appear)
 
         self.all_sprites = all_sprites
         self.items_group = items_group
@@ -53,16 +60,14 @@ class EnemyBoss(pygame.sprite.Sprite):
         self.all_sprites.add(self)
         print(f"👹 Boss spawnado na posição {self.rect.topleft}!")
 
+    def appear(self):
+        self.visible = True
+        print("👀 Boss agora está visível!")
+
     def update(self, player):
-        current_time = pygame.time.get_ticks()
-        
-        # Controle do spawn: o boss só fica visível após spawn_time
+        # Controle do spawn: o boss só age depois de aparecer
         if not self.visible:
-            if current_time >= self.spawn_time:
-                self.visible = True
-                print("👀 Boss agora está visível!")
-            else:
-                return
+            return
 
         # Se a saúde cair abaixo de 50%, ativa o estado especial
         if self.health < self.max_health * 0.5:
@@ -104,7 +109,7 @@ class EnemyBoss(pygame.sprite.Sprite):
             self.state = STATE_ATTACK
 
     def attack(self, player):
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.now()
         if current_time - self.last_attack_time >= self.attack_cooldown:
             player.take_damage(self.attack_damage)
             self.last_attack_time = current_time
@@ -112,7 +117,7 @@ class EnemyBoss(pygame.sprite.Sprite):
             self.state = STATE_CHASE
 
     def special_attack(self, player):
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.now()
         if current_time - self.last_special_attack >= self.special_attack_cooldown:
             damage = self.attack_damage * 2
             player.take_damage(damage)
@@ -147,16 +152,3 @@ class EnemyBoss(pygame.sprite.Sprite):
         self.all_sprites.add(item)
         self.items_group.add(item)
         print("💖 Boss dropou uma Super Health Potion!")
-
-    def draw_health_bar(self, screen):
-        if self.visible:
-            bar_width = 150
-            bar_height = 10
-            fill = (self.health / self.max_health) * bar_width
-            outline_rect = pygame.Rect(self.rect.centerx - bar_width // 2,
-                                       self.rect.top - 20, bar_width, bar_height)
-            fill_rect = pygame.Rect(self.rect.centerx - bar_width // 2,
-                                    self.rect.top - 20, fill, bar_height)
-            pygame.draw.rect(screen, WHITE, outline_rect)
-            pygame.draw.rect(screen, RED, fill_rect)
-            pygame.draw.rect(screen, BLACK, outline_rect, 2)
@@ -0,0 +1,245 @@
+import heapq
+import math
+import pygame
+from settings import MAP_WIDTH, MAP_HEIGHT, FLOW_FIELD_CELL_SIZE
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Sem NumPy o campo é consultado apenas célula a célula
+
+# Vizinhança de 8 células: (dx, dy, custo)
+NEIGHBOURS = [(dx, dy, math.hypot(dx, dy)) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy]
+
+
+class FlowField:
+    def __init__(self, map_size=(MAP_WIDTH, MAP_HEIGHT), cell_size=FLOW_FIELD_CELL_SIZE):
+        """
+        Campo de direções sobre uma grade do mapa, compartilhado por todos os inimigos.
+        Um Dijkstra parte da célula de cada jogador (um campo por jogador) e cada célula
+        guarda o jogador mais próximo e o ponto para onde andar: o próprio
+        jogador, se houver linha de visão até ele, ou o canto do obstáculo que precisa
+        ser contornado. Consultar o campo custa O(1) por inimigo.
+
+        O mapa atual não tem obstáculos: enquanto nenhuma célula estiver bloqueada
+        (block_rect), o campo não é calculado e steer() aponta direto para o jogador
+        mais próximo. Com obstáculos, todos os campos são recalculados quando as células
+        bloqueadas mudam; quando um jogador muda de célula, só o campo dele é refeito e
+        combinado aos demais (o resultado é o mesmo de um recálculo completo).
+        """
+        self.cell_size = cell_size
+        self.cols = max(1, math.ceil(map_size[0] / cell_size))
+        self.rows = max(1, math.ceil(map_size[1] / cell_size))
+        count = self.cols * self.rows
+        self.blocked = set()                 # Índices das células intransitáveis
+        self.distance = [math.inf] * count   # Distância (pixels) até o jogador mais próximo
+        self.anchor = [-1] * count           # Célula para onde andar (origem se houver visão direta)
+        self.source = [-1] * count           # Índice do jogador mais próximo
+        self.players = []
+        self._player_cells = None
+        self._fields = []                    # (distância, âncora) de cada jogador, calculados separadamente
+        self._dirty = True
+        self._arrays = None
+        self.recomputes = 0
+        self.repairs = 0
+
+    # --- Grade ---
+    def cell_index(self, x, y):
+        """Índice da célula que contém o ponto (limitado às bordas do mapa)."""
+        cx = min(max(int(x // self.cell_size), 0), self.cols - 1)
+        cy = min(max(int(y // self.cell_size), 0), self.rows - 1)
+        return cy * self.cols + cx
+
+    def cell_center(self, index):
+        cy, cx = divmod(index, self.cols)
+        half = self.cell_size / 2
+        return (cx * self.cell_size + half, cy * self.cell_size + half)
+
+    def block_rect(self, rect):
+        """Marca como intransitáveis as células cobertas pelo retângulo (ex.: rochas, paredes)."""
+        rect = pygame.Rect(rect)
+        cx0, cy0 = rect.left // self.cell_size, rect.top // self.cell_size
+        cx1, cy1 = (rect.right - 1) // self.cell_size, (rect.bottom - 1) // self.cell_size
+        for cy in range(max(cy0, 0), min(cy1, self.rows - 1) + 1):
+            for cx in range(max(cx0, 0), min(cx1, self.cols - 1) + 1):
+                self.blocked.add(cy * self.cols + cx)
+        self._dirty = True
+
+    def clear_blocked(self):
+        self.blocked.clear()
+        self._dirty = True
+
+    def line_of_sight(self, a, b):
+        """Indica se o segmento entre os centros das células a e b não cruza células bloqueadas."""
+        if not self.blocked:
+            return True
+        ay, ax = divmod(a, self.cols)
+        by, bx = divmod(b, self.cols)
+        # Percorre as células cruzadas pelo segmento (supercover de Bresenham)
+        dx, dy = abs(bx - ax), abs(by - ay)
+        step_x = 1 if bx > ax else -1
+        step_y = 1 if by > ay else -1
+        x, y = ax, ay
+        error = dx - dy
+        dx2, dy2 = dx * 2, dy * 2
+        while x != bx or y != by:
+            if error > 0:
+                x += step_x
+                error -= dy2
+            elif error < 0:
+                y += step_y
+                error += dx2
+            else:
+                # Passa exatamente pelo canto: as duas células vizinhas precisam estar livres
+                if (y * self.cols + x + step_x in self.blocked
+                        or (y + step_y) * self.cols + x in self.blocked):
+                    return False
+                x += step_x
+                y += step_y
+                error += dx2 - dy2
+            if y * self.cols + x in self.blocked:
+                return False
+        return True
+
+    # --- Cálculo ---
+    @property
+    def active(self):
+        """Indica se o campo tem obstáculos (sem eles o caminho é sempre a linha reta)."""
+        return bool(self.blocked)
+
+    def update(self, players):
+        """Atualiza o campo para a posição atual dos jogadores (só refaz o campo de quem mudou de célula)."""
+        if not isinstance(players, list):
+            players = [players]
+        self.players = players
+        if not self.blocked:
+            return
+        cells = tuple(self.cell_index(*player.rect.center) for player in players)
+        previous = self._player_cells
+        self._player_cells = cells
+        if self._dirty or previous is None or len(previous) != len(cells):
+            self._dirty = False
+            self._recompute(cells)
+        elif cells != previous:
+            self._repair(cells, [index for index, (old, new) in enumerate(zip(previous, cells)) if old != new])
+
+    def _recompute(self, sources):
+        """Refaz o campo de todos os jogadores (obstáculos mudaram ou jogadores entraram/saíram)."""
+        self._fields = [self._single_source(cell) for cell in sources]
+        self._combine()
+        self.recomputes += 1
+
+    def _repair(self, sources, moved):
+        """
+        Refaz apenas o campo dos jogadores que mudaram de célula; os campos dos demais
+        não dependem deles e são reaproveitados. O resultado é idêntico ao de _recompute().
+        """
+        for player_index in moved:
+            self._fields[player_index] = self._single_source(sources[player_index])
+        self._combine()
+        self.repairs += 1
+
+    def _combine(self):
+        """Cada célula fica com o jogador de menor distância (empate: o de menor índice)."""
+        count = self.cols * self.rows
+        distance = [math.inf] * count
+        anchor = [-1] * count
+        source = [-1] * count
+        for player_index, (field_distance, field_anchor) in enumerate(self._fields):
+            for cell in range(count):
+                if field_distance[cell] < distance[cell]:
+                    distance[cell] = field_distance[cell]
+                    anchor[cell] = field_anchor[cell]
+                    source[cell] = player_index
+        self.distance, self.anchor, self.source = distance, anchor, source
+        self._arrays = None
+
+    def verify(self):
+        """Indica se o campo atual é igual ao de um recálculo completo (usado por headless.py)."""
+        if not self.blocked or self._player_cells is None:
+            return True
+        fields = [self._single_source(cell) for cell in self._player_cells]
+        return fields == self._fields
+
+    def _single_source(self, origin):
+        """
+        Dijkstra a partir da célula de um jogador; cada célula herda a âncora do vizinho
+        se ainda a enxergar. Retorna (distância, âncora) de todas as células.
+        """
+        count = self.cols * self.rows
+        distance = [math.inf] * count
+        anchor = [-1] * count
+        distance[origin] = 0.0
+        anchor[origin] = origin
+        heap = [(0.0, origin)]
+        closed = set()
+        cols, rows, blocked, size = self.cols, self.rows, self.blocked, self.cell_size
+        while heap:
+            dist, cell = heapq.heappop(heap)
+            if cell in closed:
+                continue
+            closed.add(cell)
+            cy, cx = divmod(cell, cols)
+            cell_anchor = anchor[cell]
+            ay, ax = divmod(cell_anchor, cols)
+            for dx, dy, cost in NEIGHBOURS:
+                nx, ny = cx + dx, cy + dy
+                if not (0 <= nx < cols and 0 <= ny < rows):
+                    continue
+                neighbour = ny * cols + nx
+                if neighbour in blocked or neighbour in closed:
+                    continue
+                # Diagonais não cortam o canto de células bloqueadas
+                if dx and dy and (cy * cols + nx in blocked or ny * cols + cx in blocked):
+                    continue
+                if cell_anchor == cell or self.line_of_sight(neighbour, cell_anchor):
+                    new_anchor = cell_anchor
+                    candidate = distance[cell_anchor] + math.hypot(nx - ax, ny - ay) * size
+                else:
+                    new_anchor = cell
+                    candidate = dist + cost * size
+                if candidate < distance[neighbour]:
+                    distance[neighbour] = candidate
+                    anchor[neighbour] = new_anchor
+                    heapq.heappush(heap, (candidate, neighbour))
+        return distance, anchor
+
+    # --- Consulta ---
+    def steer(self, position):
+        """
+        Retorna (jogador alvo, ponto para onde andar) para uma entidade na posição informada,
+        ou (None, None) se nenhum jogador for alcançável a partir dela.
+        """
+        if not self.blocked:
+            # Sem obstáculos: o jogador mais próximo em linha reta
+            if not self.players:
+                return None, None
+            x, y = position
+            player = min(self.players, key=lambda p: (p.rect.centerx - x) ** 2 + (p.rect.centery - y) ** 2)
+            return player, player.rect.center
+        cell = self.cell_index(*position)
+        player_index = self.source[cell]
+        if player_index < 0:
+            return None, None
+        player = self.players[player_index]
+        cell_anchor = self.anchor[cell]
+        if cell_anchor == self._player_cells[player_index]:
+            return player, player.rect.center  # Visão direta: anda reto até o jogador
+        return player, self.cell_center(cell_anchor)
+
+    def arrays(self):
+        """
+        Versão em arrays do NumPy do campo, para consultas em lote (enemy_batch.py):
+        (jogador mais próximo, ponto de destino de cada célula, âncora é a origem).
+        """
+        if self._arrays is None:
+            anchors = np.array(self.anchor, dtype=np.int64)
+            valid = anchors >= 0
+            safe = np.where(valid, anchors, 0)
+            half = self.cell_size / 2
+            waypoints = np.stack([(safe % self.cols) * self.cell_size + half, (safe // self.cols) * self.cell_size + half], axis=1)
+            source = np.array(self.source, dtype=np.int64)
+            origins = np.array(self._player_cells, dtype=np.int64)
+            direct = valid & (anchors == origins[np.maximum(source, 0)])
+            self._arrays = (source, waypoints, direct)
+        return self._arrays
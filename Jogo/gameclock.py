@@ -0,0 +1,159 @@
+import threading
+from settings import TIMER_WHEEL_RESOLUTION, TIMER_WHEEL_SLOTS, TIMER_WHEEL_LEVELS
+
+
+class Timer:
+    """Agendamento feito em GameClock.schedule(); pode ser cancelado com cancel()."""
+    __slots__ = ("due", "tick", "callback", "args", "cancelled")
+
+    def __init__(self, due, tick, callback, args):
+        self.due = due          # Instante (ms de jogo) em que o timer deve disparar
+        self.tick = tick        # Mesmo instante em unidades da roda (resolução)
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class TimerWheel:
+    def __init__(self, resolution=TIMER_WHEEL_RESOLUTION, slots=TIMER_WHEEL_SLOTS, levels=TIMER_WHEEL_LEVELS):
+        """
+        Roda de timers hierárquica.
+        O nível 0 tem 'slots' posições de 'resolution' ms cada; cada nível acima cobre
+        'slots' voltas completas do nível de baixo. Agendar e cancelar custam O(1) e,
+        a cada avanço, só a posição atual do nível 0 é visitada: timers de nível alto
+        descem (cascata) para os níveis de baixo quando a roda de baixo completa uma volta.
+        """
+        self.resolution = resolution
+        self.slots = slots
+        self.levels = levels
+        self.current = 0  # Última posição processada (em unidades de 'resolution')
+        self._wheels = [[[] for _ in range(slots)] for _ in range(levels)]
+        self.pending = 0
+
+    def _place(self, timer, earliest=1):
+        # Na cascata (earliest=0) a posição atual ainda vai ser processada; fora dela, já foi
+        delta = max(timer.tick - self.current, earliest)
+        tick = self.current + delta
+        span = self.slots
+        for level in range(self.levels):
+            if delta < span or level == self.levels - 1:
+                # Timers além do último nível ficam nele e são recolocados na próxima cascata
+                shift = self.slots ** level
+                self._wheels[level][(tick // shift) % self.slots].append(timer)
+                return
+            span *= self.slots
+
+    def add(self, timer):
+        self._place(timer)
+        self.pending += 1
+
+    def _cascade(self, level):
+        """Redistribui a posição atual do nível 'level' nos níveis de baixo."""
+        shift = self.slots ** level
+        bucket = self._wheels[level][(self.current // shift) % self.slots]
+        timers = list(bucket)
+        bucket.clear()
+        for timer in timers:
+            self._place(timer, earliest=0)
+
+    def advance(self, tick):
+        """Avança a roda até a posição 'tick' e retorna os timers vencidos, na ordem de vencimento."""
+        due = []
+        while self.current < tick:
+            self.current += 1
+            # Ao completar uma volta de um nível, o nível de cima desce uma posição
+            level = 1
+            while level < self.levels and self.current % (self.slots ** level) == 0:
+                level += 1
+            for upper in range(level - 1, 0, -1):
+                self._cascade(upper)
+
+            bucket = self._wheels[0][self.current % self.slots]
+            if bucket:
+                # Copia e esvazia antes de recolocar: com um só nível o timer volta para este mesmo bucket
+                timers = list(bucket)
+                bucket.clear()
+                for timer in timers:
+                    if timer.tick <= self.current:
+                        due.append(timer)
+                    else:
+                        self._place(timer)  # Ainda não venceu (volta a mais no último nível)
+        self.pending -= len(due)
+        due.sort(key=lambda timer: timer.due)
+        return due
+
+    def clear(self):
+        for wheel in self._wheels:
+            for bucket in wheel:
+                bucket.clear()
+        self.pending = 0
+
+
+class GameClock:
+    def __init__(self, resolution=TIMER_WHEEL_RESOLUTION):
+        """
+        Relógio do jogo em milissegundos, avançado pelo loop de simulação (um passo por tick).
+        Pausado (ex.: inventário aberto), o tempo não anda e nenhum timer dispara, então
+        cooldowns, congelamentos e buffs respeitam a pausa.
+        Entidades agendam callbacks com schedule() em vez de comparar o tempo a cada frame;
+        só os timers vencidos custam algo no avanço do relógio.
+        """
+        self.time = 0.0
+        self.paused = False
+        self._wheel = TimerWheel(resolution)
+        self._lock = threading.RLock()  # O multiplayer cria inimigos na thread de rede
+
+    def now(self):
+        """Tempo de jogo atual (ms)."""
+        return self.time
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def schedule(self, delay, callback, *args):
+        """Agenda callback(*args) para daqui a 'delay' ms de jogo e retorna o Timer."""
+        due = self.time + delay
+        tick = -(-due // self._wheel.resolution)  # Arredonda para cima: nunca dispara antes da hora
+        timer = Timer(due, int(tick), callback, args)
+        with self._lock:
+            self._wheel.add(timer)
+        return timer
+
+    @staticmethod
+    def cancel(timer):
+        """Cancela o timer (se houver); cancelar um timer já disparado não tem efeito."""
+        if timer is not None:
+            timer.cancel()
+
+    def advance(self, milliseconds):
+        """Avança o relógio (se não estiver pausado) e dispara os timers vencidos."""
+        if self.paused:
+            return
+        self.time += milliseconds
+        with self._lock:
+            due = self._wheel.advance(int(self.time // self._wheel.resolution))
+            for timer in due:
+                if not timer.cancelled:
+                    timer.callback(*timer.args)
+
+    def reset(self):
+        """Zera o relógio e descarta os timers pendentes (ex.: ao iniciar uma nova partida)."""
+        with self._lock:
+            self._wheel.clear()
+            self._wheel.current = 0
+            self.time = 0.0
+            self.paused = False
+
+    @property
+    def pending(self):
+        return self._wheel.pending
+
+
+# Relógio compartilhado por todas as entidades
+game_clock = GameClock()
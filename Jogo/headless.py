@@ -0,0 +1,182 @@
+import os
+import time
+import random
+import pygame
+from settings import MAP_WIDTH, MAP_HEIGHT, HEADLESS_FRAMES, SIMULATION_RATE
+from spatial import SpatialGroup, colliding
+from enemy_batch import enemy_batch
+from gameclock import game_clock
+
+# Variável de ambiente que ativa o modo headless (ex.: RPG_HEADLESS=1 python main.py)
+HEADLESS_ENV = "RPG_HEADLESS"
+
+
+def headless_requested():
+    """Indica se o modo headless foi pedido pela variável de ambiente."""
+    return os.getenv(HEADLESS_ENV, "").strip().lower() not in ("", "0", "false", "no")
+
+
+def init_headless():
+    """
+    Inicializa o pygame com os drivers "dummy" do SDL (sem janela, GPU ou placa de som).
+    Um modo de vídeo mínimo é criado apenas para que convert()/convert_alpha() funcionem
+    nos construtores das entidades; nada é desenhado nele.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+class SimulatedKeys:
+    def __init__(self, pressed=()):
+        """Substitui pygame.key.get_pressed(): keys[tecla] é True para as teclas em 'pressed'."""
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+def bot_keys(player, level):
+    """
+    Entrada automática do jogador simulado: anda até o NPC ativo ou até o inimigo
+    mais próximo e pressiona X para conversar com o NPC.
+    """
+    pressed = set()
+    if level.current_npc is not None:
+        target = level.current_npc.rect
+        pressed.add(pygame.K_x)
+    elif level.enemies_group:
+        target = min(
+            (enemy.rect for enemy in level.enemies_group),
+            key=lambda rect: (rect.centerx - player.rect.centerx) ** 2 + (rect.centery - player.rect.centery) ** 2,
+        )
+    else:
+        return SimulatedKeys(pressed)
+
+    dx = target.centerx - player.rect.centerx
+    dy = target.centery - player.rect.centery
+    if dx > player.speed:
+        pressed.add(pygame.K_d)
+    elif dx < -player.speed:
+        pressed.add(pygame.K_a)
+    if dy > player.speed:
+        pressed.add(pygame.K_s)
+    elif dy < -player.speed:
+        pressed.add(pygame.K_w)
+    return SimulatedKeys(pressed)
+
+
+def add_obstacles(flow_field, count, map_size, seed=None):
+    """
+    Bloqueia 'count' retângulos aleatórios no campo de direções (o mapa não tem obstáculos
+    próprios): exercita o contorno de obstáculos e a atualização incremental do campo.
+    Usa um gerador separado para não alterar a sequência aleatória da simulação.
+    """
+    rng = random.Random(seed)
+    for _ in range(count):
+        width = rng.randint(64, 256)
+        height = rng.randint(64, 256)
+        flow_field.block_rect((rng.randint(0, map_size[0] - width), rng.randint(0, map_size[1] - height), width, height))
+
+
+def run_simulation(frames=HEADLESS_FRAMES, seed=None, map_size=(MAP_WIDTH, MAP_HEIGHT), fps=None,
+                   obstacles=0, check_flow_field=False):
+    """
+    Executa a lógica do singleplayer (jogador, inimigos, itens, NPCs e Level) sem renderizar,
+    por até 'frames' atualizações ou até o jogador morrer.
+    Cada atualização avança o relógio do jogo em um tick (1/SIMULATION_RATE s), então
+    cooldowns, spawns e buffs seguem o tempo simulado e, com a mesma seed, o resultado
+    é sempre o mesmo. 'fps' apenas limita o ritmo real (sem ele: benchmark sem esperas).
+    'obstacles' bloqueia retângulos aleatórios no campo de direções e, com 'check_flow_field',
+    cada atualização incremental do campo é comparada com um recálculo completo.
+    Retorna um dicionário com o resultado da simulação.
+    """
+    # Importados aqui para que o pygame já esteja inicializado com os drivers dummy
+    from player import Player
+    from level import Level
+    from enemy import EnemyStore
+
+    if seed is not None:
+        random.seed(seed)
+
+    game_clock.reset()
+    all_sprites = pygame.sprite.Group()
+    items_group = SpatialGroup()
+    enemies_group = EnemyStore(all_sprites, items_group)
+    npc_group = pygame.sprite.Group()
+
+    player = Player((map_size[0] // 2, map_size[1] // 2), map_size)
+    player.show_game_over = False  # Sem tela de Game Over: a simulação apenas termina
+    all_sprites.add(player)
+    level = Level(player, all_sprites, enemies_group, items_group, npc_group, map_size)
+    level.round_delay = 0
+    flow_field = level.flow_field
+    if obstacles:
+        add_obstacles(flow_field, obstacles, map_size, seed)
+    flow_field_mismatches = 0
+
+    tick_ms = 1000 / SIMULATION_RATE
+    clock = pygame.time.Clock()
+    start = time.perf_counter()
+    frame = 0
+    while frame < frames and player.health > 0:
+        if fps:
+            clock.tick(fps)
+        game_clock.advance(tick_ms)
+        keys = bot_keys(player, level)
+        player.update(keys)
+        level.handle_npc_interaction(keys)
+        if not level.npc_active:
+            # O bot ataca sempre que houver inimigo em contato (os cooldowns continuam valendo)
+            if colliding(enemies_group, player.rect):
+                player.attack(enemies_group)
+                player.special_attack(enemies_group)
+            repairs = flow_field.repairs
+            enemy_batch.update(enemies_group, [player], flow_field)
+            if check_flow_field and flow_field.repairs != repairs and not flow_field.verify():
+                flow_field_mismatches += 1
+            items_group.update()
+            level.update()
+            for item in colliding(items_group, player.rect):
+                item.kill()
+                item.apply_effect(player)
+        npc_group.update(player)
+        frame += 1
+    elapsed = time.perf_counter() - start
+
+    return {
+        "frames": frame,
+        "seconds": elapsed,
+        "frames_per_second": frame / elapsed if elapsed else 0.0,
+        "round": level.round_number,
+        "enemies_killed": level.enemies_killed,
+        "player_level": player.level,
+        "player_health": player.health,
+        "flow_field_recomputes": flow_field.recomputes,
+        "flow_field_repairs": flow_field.repairs,
+        "flow_field_mismatches": flow_field_mismatches,
+    }
+
+
+def main(frames=HEADLESS_FRAMES, seed=None, fps=None, obstacles=0, check_flow_field=False):
+    init_headless()
+    result = run_simulation(frames, seed, fps=fps, obstacles=obstacles, check_flow_field=check_flow_field)
+    print(
+        f"🤖 Simulação headless: {result['frames']} frames em {result['seconds']:.2f}s "
+        f"({result['frames_per_second']:.0f} frames/s) | Round {result['round']} | "
+        f"{result['enemies_killed']} inimigos derrotados | Level {result['player_level']} | "
+        f"HP {result['player_health']}"
+    )
+    if obstacles:
+        check = f" | {result['flow_field_mismatches']} divergências" if check_flow_field else ""
+        print(
+            f"🧭 Campo de direções: {result['flow_field_recomputes']} recálculos completos, "
+            f"{result['flow_field_repairs']} atualizações incrementais{check}"
+        )
+    pygame.quit()
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import pygame
+from settings import WHITE, RED, BLACK, HEALTH_BAR_STEPS
+from assets import asset_cache
+
+# Barra padrão dos inimigos: (largura, altura), distância acima do sprite e espessura da borda.
+# Entidades podem sobrescrever com os atributos health_bar_size, health_bar_offset e health_bar_border.
+DEFAULT_BAR_SIZE = (50, 5)
+DEFAULT_BAR_OFFSET = 10
+DEFAULT_BAR_BORDER = 1
+
+
+class HealthBarBatch:
+    def __init__(self, steps=HEALTH_BAR_STEPS):
+        """
+        Desenha as barras de vida a partir de imagens pré-renderizadas.
+        Para cada tamanho de barra são geradas 'steps' + 1 imagens (de vazia a cheia);
+        a cada frame as barras visíveis são enfileiradas com add() e desenhadas
+        de uma só vez com flush(), usando Surface.blits quando disponível.
+        """
+        self.steps = steps
+        self._frames = {}  # (largura, altura, borda) -> lista de superfícies por nível de preenchimento
+        self._queue = []   # (superfície, posição) a desenhar no próximo flush
+
+    def frames(self, size, border=DEFAULT_BAR_BORDER):
+        """Retorna as imagens da barra no tamanho informado, gerando-as na primeira vez."""
+        key = (size[0], size[1], border)
+        frames = self._frames.get(key)
+        if frames is None:
+            width, height = size
+            frames = []
+            for step in range(self.steps + 1):
+                surface = pygame.Surface(size).convert()
+                surface.fill(WHITE)
+                fill_width = round(width * step / self.steps)
+                if fill_width:
+                    surface.fill(RED, (0, 0, fill_width, height))
+                pygame.draw.rect(surface, BLACK, surface.get_rect(), border)
+                asset_cache.track(surface)
+                frames.append(surface)
+            self._frames[key] = frames
+        return frames
+
+    def step_for(self, health, max_health):
+        """Nível de preenchimento (0 a steps) correspondente à vida; vida positiva nunca aparece vazia."""
+        ratio = max(0.0, min(1.0, health / max_health)) if max_health else 0.0
+        step = round(ratio * self.steps)
+        return max(step, 1) if health > 0 else step
+
+    def add(self, entity, screen_rect, zoom=1.0):
+        """
+        Enfileira a barra de vida da entidade, centralizada acima de screen_rect
+        (o retângulo do sprite na tela). Retorna (retângulo da barra, nível de preenchimento)
+        ou None se a entidade ainda não estiver visível.
+        """
+        if not getattr(entity, "visible", True):
+            return None
+        base_width, base_height = getattr(entity, "health_bar_size", DEFAULT_BAR_SIZE)
+        size = (max(1, int(base_width * zoom)), max(1, int(base_height * zoom)))
+        offset = int(getattr(entity, "health_bar_offset", DEFAULT_BAR_OFFSET) * zoom)
+        border = getattr(entity, "health_bar_border", DEFAULT_BAR_BORDER)
+
+        step = self.step_for(entity.health, entity.max_health)
+        surface = self.frames(size, border)[step]
+        rect = surface.get_rect(topleft=(screen_rect.centerx - size[0] // 2, screen_rect.top - offset))
+        self._queue.append((surface, rect.topleft))
+        return rect, step
+
+    def flush(self, screen):
+        """Desenha todas as barras enfileiradas e retorna a lista de retângulos desenhados."""
+        if not self._queue:
+            return []
+        if hasattr(screen, "blits"):
+            rects = screen.blits(self._queue)
+        else:
+            rects = [screen.blit(surface, position) for surface, position in self._queue]
+        self._queue.clear()
+        return rects
+
+    def clear(self):
+        for frames in self._frames.values():
+            for surface in frames:
+                asset_cache.untrack(surface)
+        self._frames.clear()
+        self._queue.clear()
+
+
+# Barras de vida compartilhadas por todos os inimigos
+health_bars = HealthBarBatch()
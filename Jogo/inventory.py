@@ -1,6 +1,8 @@
 import pygame
 import os
-from settings import WIDTH, HEIGHT, FONT_NAME, WHITE, BLACK
+from settings import WIDTH, HEIGHT, WHITE, BLACK
+from assets import load_image
+from render import DirtyRectRenderer, get_font, render_text
 
 class Inventory:
     def __init__(self, capacity=10):
@@ -74,56 +76,57 @@ class Inventory:
         Além disso, exibe estatísticas do jogador (HP, Mana e uso do inventário).
         """
         running = True
-        font = pygame.font.SysFont(FONT_NAME, 32)
+        font = get_font(32)
         clock = pygame.time.Clock()
+        renderer = DirtyRectRenderer()  # A tela só é redesenhada quando alguma tecla altera o inventário
 
         visible_slots = 7  # Número de itens visíveis simultaneamente
 
-        # Carrega a imagem de fundo do inventário
+        # Imagem de fundo do inventário (decodificada uma única vez e mantida no cache de assets)
         inventory_bg_path = os.path.join(os.path.dirname(__file__), "assets", "inventory.png")
         if os.path.exists(inventory_bg_path):
-            background_image = pygame.image.load(inventory_bg_path).convert()
-            background_image = pygame.transform.scale(background_image, (WIDTH, HEIGHT))
+            background_image = load_image(inventory_bg_path, (WIDTH, HEIGHT), alpha=False)
         else:
             background_image = None
 
         while running:
-            if background_image:
-                screen.blit(background_image, (0, 0))
-            else:
-                screen.fill((30, 30, 30))
-            # Título centralizado
-            title = font.render("🎒 Inventário", True, WHITE)
-            screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 20))
-            
-            # Exibe estatísticas do jogador
-            stats_text = font.render(
-                f"HP: {player.health}/{player.max_health} | Mana: {player.mana}/{player.max_mana} | Slots: {len(self.items)}/{self.capacity}",
-                True, WHITE)
-            screen.blit(stats_text, (WIDTH // 2 - stats_text.get_width() // 2, 70))
-
-            y_offset = 120
             items_list = list(self.items.items())
             visible_items = items_list[self.scroll_offset:self.scroll_offset + visible_slots]
 
-            for idx, (item_name, details) in enumerate(visible_items):
-                desc = getattr(details["object"], "description", "")
-                text_str = f"{idx + 1}. {item_name} (x{details['quantity']})"
-                if desc:
-                    text_str += f" - {desc}"
-                text = font.render(text_str, True, WHITE)
-                screen.blit(text, (WIDTH // 2 - text.get_width() // 2, y_offset))
-                y_offset += 40
-
-            instructions = font.render("↑/↓ para rolar | 1-9 para usar item | I para sair", True, WHITE)
-            screen.blit(instructions, (WIDTH // 2 - instructions.get_width() // 2, HEIGHT - 80))
+            if renderer.needs_redraw():
+                if background_image:
+                    screen.blit(background_image, (0, 0))
+                else:
+                    screen.fill((30, 30, 30))
+                # Título centralizado
+                title = render_text(font, "🎒 Inventário", WHITE)
+                screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 20))
+            
+                # Exibe estatísticas do jogador
+                stats_text = render_text(font,
+                    f"HP: {player.health}/{player.max_health} | Mana: {player.mana}/{player.max_mana} | Slots: {len(self.items)}/{self.capacity}",
+                    WHITE)
+                screen.blit(stats_text, (WIDTH // 2 - stats_text.get_width() // 2, 70))
+
+                y_offset = 120
+                for idx, (item_name, details) in enumerate(visible_items):
+                    desc = getattr(details["object"], "description", "")
+                    text_str = f"{idx + 1}. {item_name} (x{details['quantity']})"
+                    if desc:
+                        text_str += f" - {desc}"
+                    text = render_text(font, text_str, WHITE)
+                    screen.blit(text, (WIDTH // 2 - text.get_width() // 2, y_offset))
+                    y_offset += 40
+
+                instructions = render_text(font, "↑/↓ para rolar | 1-9 para usar item | I para sair", WHITE)
+                screen.blit(instructions, (WIDTH // 2 - instructions.get_width() // 2, HEIGHT - 80))
             
-            # Opção de bônus para Gold Coins
-            if "Gold Coin" in self.items and self.items["Gold Coin"]["quantity"] >= 10:
-                bonus_info = font.render("Pressione 0 para converter 10 Gold Coins em +5% de HP ou Mana", True, WHITE)
-                screen.blit(bonus_info, (WIDTH // 2 - bonus_info.get_width() // 2, HEIGHT - 120))
+                # Opção de bônus para Gold Coins
+                if "Gold Coin" in self.items and self.items["Gold Coin"]["quantity"] >= 10:
+                    bonus_info = render_text(font, "Pressione 0 para converter 10 Gold Coins em +5% de HP ou Mana", WHITE)
+                    screen.blit(bonus_info, (WIDTH // 2 - bonus_info.get_width() // 2, HEIGHT - 120))
 
-            pygame.display.flip()
+            renderer.present()
             clock.tick(30)
 
             for event in pygame.event.get():
@@ -131,6 +134,7 @@ class Inventory:
                     pygame.quit()
                     exit()
                 elif event.type == pygame.KEYDOWN:
+                    renderer.invalidate()  # Rolagem, uso de itens e bônus alteram o conteúdo exibido
                     if event.key == pygame.K_i:
                         running = False  # Fecha o inventário
                     elif event.key == pygame.K_DOWN:
@@ -143,14 +147,17 @@ class Inventory:
                         # Opção de bônus: converter 10 Gold Coins
                         if "Gold Coin" in self.items and self.items["Gold Coin"]["quantity"] >= 10:
                             bonus_running = True
-                            sub_font = pygame.font.SysFont(FONT_NAME, 32)
+                            sub_font = get_font(32)
+                            bonus_renderer = DirtyRectRenderer()
                             while bonus_running:
-                                screen.fill((30, 30, 30))
-                                bonus_text = sub_font.render("Pressione H para +5% HP ou M para +5% Mana", True, WHITE)
-                                screen.blit(bonus_text, (WIDTH // 2 - bonus_text.get_width() // 2, HEIGHT // 2 - 50))
-                                bonus_instructions = sub_font.render("Pressione I para cancelar", True, WHITE)
-                                screen.blit(bonus_instructions, (WIDTH // 2 - bonus_instructions.get_width() // 2, HEIGHT // 2))
-                                pygame.display.flip()
+                                if bonus_renderer.needs_redraw():
+                                    screen.fill((30, 30, 30))
+                                    bonus_text = render_text(sub_font, "Pressione H para +5% HP ou M para +5% Mana", WHITE)
+                                    screen.blit(bonus_text, (WIDTH // 2 - bonus_text.get_width() // 2, HEIGHT // 2 - 50))
+                                    bonus_instructions = render_text(sub_font, "Pressione I para cancelar", WHITE)
+                                    screen.blit(bonus_instructions, (WIDTH // 2 - bonus_instructions.get_width() // 2, HEIGHT // 2))
+                                bonus_renderer.present()
+                                clock.tick(30)
                                 for bonus_event in pygame.event.get():
                                     if bonus_event.type == pygame.QUIT:
                                         pygame.quit()
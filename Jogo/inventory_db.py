@@ -1,36 +1,189 @@
 import os
-from pymongo import MongoClient
-from dotenv import load_dotenv
+import sqlite3
+import threading
 
-# Carrega as variáveis do .env
-load_dotenv()
+try:
+    from dotenv import load_dotenv
+    # Carrega as variáveis do .env
+    load_dotenv()
+except ImportError:
+    pass
 
 # Obtém os dados de conexão do MongoDB do .env
 MONGO_URI = os.getenv("MONGO_URI")
 DB_NAME = os.getenv("DB_NAME")
 COLLECTION_NAME = os.getenv("COLLECTION_NAME")
 
-# Conectar ao MongoDB
-client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000)  # Timeout de 5 segundos
-db = client[DB_NAME]
-items_collection = db[COLLECTION_NAME]
+# Banco versionado com o catálogo inicial; é apenas lido, nunca reescrito em tempo de execução
+SQLITE_PATH = os.path.join(os.path.dirname(__file__), "game.db")
+# Cache local (fora do controle de versão) usado enquanto (ou quando) o MongoDB não responde
+CACHE_PATH = os.path.join(os.path.dirname(__file__), "items_cache.db")
 
-# Testar conexão antes de executar qualquer operação
-try:
+SAMPLE_ITEMS = [
+    {"name": "Health Potion", "description": "Restaura 50 HP", "rarity": "Common", "value": 10},
+    {"name": "Mana Potion", "description": "Restaura 30 MP", "rarity": "Common", "value": 12},
+    {"name": "Gold Coin", "description": "Uma moeda valiosa", "rarity": "Uncommon", "value": 50},
+]
+ITEM_FIELDS = ("name", "description", "rarity", "value")
+
+
+def mongo_collection():
+    """Conecta ao MongoDB (timeout de 5 segundos) e retorna a coleção de itens."""
+    from pymongo import MongoClient
+    if not MONGO_URI or not DB_NAME or not COLLECTION_NAME:
+        raise RuntimeError("MONGO_URI, DB_NAME ou COLLECTION_NAME não definidos no .env")
+    client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000)
     client.server_info()  # Teste de conexão
-    print("✅ Conectado ao MongoDB!")
-except Exception as e:
-    print(f"❌ Erro ao conectar ao MongoDB: {e}")
-    exit()
+    return client[DB_NAME][COLLECTION_NAME]
+
+
+class ItemCatalog:
+    def __init__(self, sqlite_path=SQLITE_PATH, remote_factory=mongo_collection, cache_path=CACHE_PATH):
+        """
+        Catálogo de itens com inicialização preguiçosa.
+        Os itens são servidos da memória (carregada do SQLite local) imediatamente;
+        a conexão com o banco remoto é feita em uma thread de fundo e, quando responde,
+        o catálogo e o cache local são atualizados.
+        Todo acesso ao banco remoto (conexão e itens padrão) acontece fora da thread principal.
+
+        Parâmetros:
+            sqlite_path (str): Banco SQLite versionado, lido quando ainda não existe cache local.
+            remote_factory (callable): Função que retorna a coleção remota. Qualquer objeto com
+                count_documents(), insert_many() e find() serve (útil para testes).
+            cache_path (str): Banco SQLite do cache local, o único escrito em disco
+                (None desativa o cache em disco).
+        """
+        self.sqlite_path = sqlite_path
+        self.cache_path = cache_path
+        self.remote_factory = remote_factory
+        self.remote = None
+        self.connected = threading.Event()   # Sinaliza que o banco remoto respondeu
+        self.finished = threading.Event()    # Sinaliza que a tentativa de conexão terminou
+        self._items = {}  # nome -> dados do item
+        self._lock = threading.Lock()
+        self._thread = None
+        self._seed_remote = False
+        self._saved_rows = None  # Conteúdo atual do cache local (evita reescritas sem mudança)
+
+    def start(self):
+        """Carrega o cache local e inicia a conexão remota em segundo plano (apenas uma vez)."""
+        if self._thread is not None:
+            return
+        self._load_local()
+        self._thread = threading.Thread(target=self._connect, name="item-catalog", daemon=True)
+        self._thread.start()
+
+    def _connect(self):
+        """Executado na thread de fundo: conecta ao banco remoto e sincroniza os itens."""
+        try:
+            remote = self.remote_factory()
+            with self._lock:
+                self.remote = remote
+                seed = self._seed_remote
+            if seed:
+                self._seed(remote)
+            items = [{field: doc.get(field) for field in ITEM_FIELDS} for doc in remote.find({})]
+            self._store(items)
+            self._save_local(items)
+            self.connected.set()
+            print("✅ Conectado ao MongoDB!")
+        except Exception as e:
+            print(f"❌ Erro ao conectar ao MongoDB: {e}. Usando o catálogo local.")
+        finally:
+            self.finished.set()
+
+    def _seed(self, remote):
+        """Adiciona os itens padrão ao banco remoto se a coleção estiver vazia."""
+        if remote.count_documents({}) == 0:
+            remote.insert_many([dict(item) for item in SAMPLE_ITEMS])
+            print("🆕 Itens padrão adicionados ao banco de dados!")
+
+    def _seed_in_background(self, remote):
+        """Executado em uma thread de fundo quando o banco remoto já estava conectado."""
+        try:
+            self._seed(remote)
+        except Exception as e:
+            print(f"❌ Erro ao adicionar os itens padrão no MongoDB: {e}")
+
+    def _store(self, items):
+        with self._lock:
+            for item in items:
+                if item.get("name"):
+                    self._items[item["name"]] = item
+
+    def _load_local(self):
+        """Carrega os itens do cache local (ou, se ainda não existir, do banco versionado) para a memória."""
+        has_cache = bool(self.cache_path) and os.path.exists(self.cache_path)
+        path = self.cache_path if has_cache else self.sqlite_path
+        if not path or not os.path.exists(path):
+            return
+        try:
+            # Somente leitura: o banco versionado nunca é alterado
+            with sqlite3.connect(f"file:{path}?mode=ro", uri=True) as conn:
+                rows = conn.execute("SELECT name, description, rarity, value FROM items").fetchall()
+        except sqlite3.Error as e:
+            print(f"⚠️ Falha ao ler o catálogo local: {e}")
+            return
+        if has_cache:
+            self._saved_rows = sorted(rows, key=repr)
+        self._store([dict(zip(ITEM_FIELDS, row)) for row in rows])
+
+    def _save_local(self, items):
+        """Substitui os itens do cache local pelos itens informados (apenas se o conteúdo mudou)."""
+        if not self.cache_path:
+            return
+        rows = [tuple(item.get(field) for field in ITEM_FIELDS) for item in items]
+        if sorted(rows, key=repr) == self._saved_rows:
+            return
+        try:
+            with sqlite3.connect(self.cache_path) as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS items ("
+                    "id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, "
+                    "description TEXT, rarity TEXT, value INTEGER)"
+                )
+                conn.execute("DELETE FROM items")
+                conn.executemany(
+                    "INSERT INTO items (name, description, rarity, value) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+            self._saved_rows = sorted(rows, key=repr)
+        except sqlite3.Error as e:
+            print(f"⚠️ Falha ao salvar o catálogo local: {e}")
+
+    def create_sample_items(self):
+        """
+        Garante que os itens padrão existam, sem bloquear:
+        o catálogo local é preenchido imediatamente e o banco remoto
+        recebe os itens quando a conexão for estabelecida.
+        """
+        with self._lock:
+            self._seed_remote = True
+            remote = self.remote
+            empty = not self._items
+        if remote is not None:
+            # Já conectado: os itens padrão também são enviados fora da thread principal
+            threading.Thread(target=self._seed_in_background, args=(remote,), name="item-catalog-seed", daemon=True).start()
+        if empty:
+            self._store([dict(item) for item in SAMPLE_ITEMS])
+            self._save_local(SAMPLE_ITEMS)
+
+    def get(self, name):
+        """Retorna os dados do item pelo nome (ou None)."""
+        with self._lock:
+            return self._items.get(name)
+
+    def all_items(self):
+        """Retorna a lista de itens conhecidos no momento."""
+        with self._lock:
+            return list(self._items.values())
+
+
+# Catálogo compartilhado; nada é conectado na importação
+catalog = ItemCatalog()
+
 
 def create_sample_items():
-    """Adiciona itens ao banco de dados se a coleção estiver vazia."""
-    if items_collection.count_documents({}) == 0:
-        items_collection.insert_many([
-            {"name": "Health Potion", "description": "Restaura 50 HP", "rarity": "Common", "value": 10},
-            {"name": "Mana Potion", "description": "Restaura 30 MP", "rarity": "Common", "value": 12},
-            {"name": "Gold Coin", "description": "Uma moeda valiosa", "rarity": "Uncommon", "value": 50},
-        ])
-        print("🆕 Itens padrão adicionados ao banco de dados!")
-
-create_sample_items()
+    """Inicia o catálogo (sem bloquear) e garante que os itens padrão existam."""
+    catalog.start()
+    catalog.create_sample_items()
@@ -1,7 +1,7 @@
 import pygame
 import os
 import random
-import time
+from assets import load_image
 
 class Item(pygame.sprite.Sprite):
     def __init__(self, pos, name, temporary=False, special=False, description="", rarity="Common", value=0):
@@ -47,17 +47,16 @@ class Item(pygame.sprite.Sprite):
         }
         assets_path = os.path.join(current_path, "assets", item_images.get(self.name, "item.png"))
 
+        # Ajusta o tamanho do item
+        scale_size = (72, 72) if (self.temporary or self.special) else (48, 48)
+
         # Verifica se a imagem existe antes de carregar; caso não, usa uma superfície padrão
         if os.path.exists(assets_path):
-            self.image = pygame.image.load(assets_path).convert_alpha()
+            self.image = load_image(assets_path, scale_size)
         else:
             print(f"⚠️ Erro: Imagem do item {assets_path} não encontrada! Usando um item padrão.")
-            self.image = pygame.Surface((50, 50))
+            self.image = pygame.Surface(scale_size)
             self.image.fill((255, 255, 0))
-
-        # Ajusta o tamanho do item
-        scale_size = (72, 72) if (self.temporary or self.special) else (48, 48)
-        self.image = pygame.transform.scale(self.image, scale_size)
         self.rect = self.image.get_rect(center=pos)
 
         # Configuração da animação de drop do item (queda suave)
@@ -100,11 +99,5 @@ class Item(pygame.sprite.Sprite):
 
     def activate_super_health(self, player):
         """Triplica a vida do jogador por 30 segundos, se o efeito não estiver ativo."""
-        if not player.super_health_active:  # Impede múltiplas ativações simultâneas
-            print("💖 Poção de Vida Especial ativada! HP x3 por 30 segundos!")
-            player.max_health *= 3
-            player.health = player.max_health
-            player.super_health_active = True
-            player.super_health_end_time = time.time() + 30  # Define a duração do efeito
-            # Define um evento para reverter o efeito após 30 segundos (caso seja tratado via event loop)
-            pygame.time.set_timer(pygame.USEREVENT + 1, 30000)
+        # O fim do efeito é agendado pelo jogador no relógio do jogo (respeita pausas)
+        player.activate_super_health()
@@ -1,24 +1,29 @@
 import pygame
 import random
-from enemy import Enemy as NormalEnemy
-from enemy2 import Enemy as FastEnemy
-from enemy3 import Enemy as TankEnemy
+from archetypes import choose_enemy_type
 from enemyboss import EnemyBoss  # Importa o boss
 from item import Item
 from npcs import spawn_npc
+from sprite_table import enemy_sprites
+from flowfield import FlowField
+from spawner import SpawnSampler
 from settings import WIDTH, HEIGHT, MAP_WIDTH, MAP_HEIGHT, NPC_INTERACTION_DISTANCE
 
 class Level:
-    def __init__(self, player, all_sprites, enemies_group, items_group, npc_group):
+    def __init__(self, player, all_sprites, enemies_group, items_group, npc_group, map_size=(MAP_WIDTH, MAP_HEIGHT)):
         self.player = player
+        self.map_width, self.map_height = map_size
+        self.flow_field = FlowField(map_size)  # Caminho dos inimigos até o jogador (flowfield.py)
+        self.spawner = SpawnSampler(map_size)  # Posições de spawn longe do jogador (spawner.py)
         self.all_sprites = all_sprites
-        self.enemies_group = enemies_group
+        self.enemies_group = enemies_group  # EnemyStore (enemy.py)
         self.items_group = items_group
         self.npc_group = npc_group
         self.enemies_killed = 0
         self.round_number = 1
         self.enemy_spawn_rate = 3
         self.round_active = True
+        self.round_delay = 1000  # Pausa (ms) antes de cada novo round; 0 na simulação headless
 
         # Controle de NPC para evento de nível 5
         self.npc_active = False
@@ -33,8 +38,7 @@ class Level:
     def create_level(self):
         """Cria os inimigos iniciais do nível (caso não haja NPC ativo)."""
         if not self.npc_active:
-            for _ in range(self.enemy_spawn_rate):
-                self.spawn_enemy()
+            self.spawn_wave(self.enemy_spawn_rate)
 
     def update(self):
         """
@@ -64,8 +68,6 @@ class Level:
         # Remove os inimigos mortos
         for enemy in enemies_to_remove:
             enemy.kill()
-            if enemy in self.enemies_group:
-                self.enemies_group.remove(enemy)
 
         # Gera um item a cada 6 inimigos mortos (evitando múltiplos spawns para o mesmo limiar)
         if self.enemies_killed - self.last_item_spawn_kill_count >= 6:
@@ -76,30 +78,23 @@ class Level:
         if len(self.enemies_group) == 0 and self.round_active and not self.npc_active:
             self.next_round()
 
-    def spawn_enemy(self):
-        """Gera um inimigo aleatório no mapa, desde que não haja NPC ativo."""
+    def spawn_wave(self, count):
+        """Gera 'count' inimigos em posições espalhadas (ver SpawnSampler.sample_wave)."""
+        positions = self.spawner.sample_wave(count, self.player.rect.topleft, self.enemies_group)
+        for pos in positions:
+            self.spawn_enemy(pos)
+
+    def spawn_enemy(self, pos=None):
+        """Gera um inimigo aleatório no mapa (em 'pos', se informada), desde que não haja NPC ativo."""
         if self.npc_active:
             return
 
-        pos = self.get_random_spawn_position()
+        if pos is None:
+            pos = self.get_random_spawn_position()
 
-        # Seleciona o tipo de inimigo com base no round, mantendo a mesma lógica de pesos
-        if self.round_number % 3 == 0:
-            enemy_class = random.choices(
-                [NormalEnemy, FastEnemy, TankEnemy],
-                weights=[30, 30, 40]
-            )[0]
-        elif self.round_number % 2 == 0:
-            enemy_class = random.choices(
-                [NormalEnemy, FastEnemy, TankEnemy],
-                weights=[30, 50, 20]
-            )[0]
-        else:
-            enemy_class = random.choice([NormalEnemy, FastEnemy, TankEnemy])
-
-        enemy = enemy_class(pos, self.round_number, self.all_sprites, self.items_group)
-        self.all_sprites.add(enemy)
-        self.enemies_group.add(enemy)
+        # Seleciona o tipo de inimigo com base no round (pesos em archetypes.py)
+        enemy_type = choose_enemy_type(self.round_number)
+        enemy = self.enemies_group.spawn(enemy_type, pos, self.round_number)
         print(f"👿 Novo inimigo spawnado! Tipo: {enemy.type}, Vida: {enemy.health}, XP: {enemy.xp_reward}, Posição: {pos}")
 
     def spawn_item(self):
@@ -131,10 +126,7 @@ class Level:
             print(f"🧙 NPC '{npc.name}' apareceu no mapa!")
 
             # Armazena e remove temporariamente os inimigos ativos
-            self.pending_enemies = list(self.enemies_group)
-            for enemy in self.pending_enemies:
-                self.all_sprites.remove(enemy)
-            self.enemies_group.empty()
+            self.pending_enemies = self.enemies_group.stash()
 
     def handle_npc_interaction(self, keys):
         """Gerencia a interação do jogador com o NPC ao pressionar 'X'."""
@@ -165,9 +157,8 @@ class Level:
             self.npc_active = False
 
             # Reintroduz os inimigos que foram removidos
+            self.enemies_group.restore(self.pending_enemies)
             for enemy in self.pending_enemies:
-                self.all_sprites.add(enemy)
-                self.enemies_group.add(enemy)
                 print(f"👿 {enemy.__class__.__name__} apareceu após o NPC! Vida: {enemy.health}")
 
             self.pending_enemies = []
@@ -186,17 +177,19 @@ class Level:
         self.enemy_spawn_rate += 1
 
         print(f"🔥 Novo Round {self.round_number}! Agora teremos {self.enemy_spawn_rate} inimigos!")
-        pygame.time.delay(1000)
+        if self.round_delay:
+            pygame.time.delay(self.round_delay)
 
         # Tenta spawnar o NPC (caso o evento ainda seja aplicável)
         self.spawn_npc()
         if not self.npc_active:
+            # Prepara os sprites escalados do round antes do spawn da onda
+            enemy_sprites.prepare_round(self.round_number)
             # Se for um round de boss (a cada 10 rounds), spawna o boss
             if self.round_number % 10 == 0:
                 self.spawn_boss()
             # Spawn de inimigos regulares
-            for _ in range(self.enemy_spawn_rate):
-                self.spawn_enemy()
+            self.spawn_wave(self.enemy_spawn_rate)
 
         self.round_active = True
 
@@ -204,16 +197,9 @@ class Level:
         """Gera o Enemy Boss no mapa."""
         pos = self.get_random_spawn_position()
         boss = EnemyBoss(pos, self.round_number, self.all_sprites, self.items_group)
-        self.all_sprites.add(boss)
         self.enemies_group.add(boss)
         print(f"👹 Boss spawnado no Round {self.round_number} na posição {pos}")
 
     def get_random_spawn_position(self):
-        """Gera uma posição aleatória dentro dos limites do mapa sem sobrepor o jogador."""
-        while True:
-            pos = (
-                random.randint(100, MAP_WIDTH - 100),
-                random.randint(100, MAP_HEIGHT - 100)
-            )
-            if abs(pos[0] - self.player.rect.x) > 200 and abs(pos[1] - self.player.rect.y) > 200:
-                return pos
+        """Gera uma posição aleatória dentro dos limites do mapa sem sobrepor o jogador nem os inimigos."""
+        return self.spawner.sample(self.player.rect.topleft, self.enemies_group)
@@ -7,29 +7,44 @@ from level import Level
 import inventory_db
 from menu import menu, save_record
 from camera import Camera
+from assets import load_image
+from render import (DirtyRectRenderer, RenderQueue, get_font, render_text,
+                    LAYER_BACKGROUND, LAYER_ITEMS, LAYER_ENEMIES, LAYER_PLAYER, LAYER_NPCS, LAYER_UI)
+from tilemap import load_map, ChunkedMap
+from healthbar import health_bars
+from timestep import FixedTimestep, Interpolator
+from gameclock import game_clock
+from spatial import SpatialGroup, colliding
+from enemy import EnemyStore
+from enemy_batch import enemy_batch
 
 def draw_hud(screen, player, font, level):
-    """Desenha a interface do jogador (HP, Mana, XP, Nível, Round e Inventário)."""
-    health_text = font.render(f'HP: {player.health}/{player.max_health}', True, WHITE)
-    mana_text = font.render(f'Mana: {player.mana}/{player.max_mana}', True, WHITE)
-    xp_text = font.render(f'XP: {player.xp}/{player.xp_to_next_level}', True, WHITE)
-    level_text = font.render(f'Level: {player.level}', True, RED)
-    round_text = font.render(f'Round: {level.round_number}', True, WHITE)
-
-    screen.blit(health_text, (10, 10))
-    screen.blit(mana_text, (10, 40))
-    screen.blit(xp_text, (10, 70))
-    screen.blit(level_text, (10, 100))
-    screen.blit(round_text, (10, 130))
+    """
+    Desenha a interface do jogador (HP, Mana, XP, Nível, Round e Inventário).
+    Os textos vêm do cache e só são renderizados novamente quando seus valores mudam.
+    Retorna o retângulo da tela ocupado pela HUD.
+    """
+    health_text = render_text(font, f'HP: {player.health}/{player.max_health}', WHITE)
+    mana_text = render_text(font, f'Mana: {player.mana}/{player.max_mana}', WHITE)
+    xp_text = render_text(font, f'XP: {player.xp}/{player.xp_to_next_level}', WHITE)
+    level_text = render_text(font, f'Level: {player.level}', RED)
+    round_text = render_text(font, f'Round: {level.round_number}', WHITE)
+
+    hud_rect = screen.blit(health_text, (10, 10))
+    hud_rect.union_ip(screen.blit(mana_text, (10, 40)))
+    hud_rect.union_ip(screen.blit(xp_text, (10, 70)))
+    hud_rect.union_ip(screen.blit(level_text, (10, 100)))
+    hud_rect.union_ip(screen.blit(round_text, (10, 130)))
 
     # Exibe o inventário na HUD (lista de itens)
-    inventory_text = font.render("Inventário:", True, WHITE)
-    screen.blit(inventory_text, (10, 160))
+    inventory_text = render_text(font, "Inventário:", WHITE)
+    hud_rect.union_ip(screen.blit(inventory_text, (10, 160)))
     y_offset = 190
     for item_name, details in player.inventory.items.items():
-        item_text = font.render(f"- {item_name} (x{details['quantity']})", True, WHITE)
-        screen.blit(item_text, (10, y_offset))
+        item_text = render_text(font, f"- {item_name} (x{details['quantity']})", WHITE)
+        hud_rect.union_ip(screen.blit(item_text, (10, y_offset)))
         y_offset += 30
+    return hud_rect
 
 def draw_player_health_bar(screen, player):
     """Desenha a barra de vida do jogador no canto superior direito com cores dinâmicas."""
@@ -53,6 +68,7 @@ def draw_player_health_bar(screen, player):
     pygame.draw.rect(screen, (255, 255, 255), outline_rect, 2)
     pygame.draw.rect(screen, health_color, fill_rect)
     pygame.draw.rect(screen, (0, 0, 0), outline_rect, 1)
+    return outline_rect
 
 def play_music():
     """Toca a música de fundo."""
@@ -69,22 +85,28 @@ def get_player_name(screen, font):
     """Exibe uma caixa de entrada para o jogador inserir seu nome ao morrer."""
     name = ""
     input_active = True
+    clock = pygame.time.Clock()
+    renderer = DirtyRectRenderer()
 
     while input_active:
-        screen.fill(WHITE)
-        prompt_text = font.render("Digite seu nome para salvar o recorde:", True, BLACK)
-        screen.blit(prompt_text, (WIDTH // 2 - 200, HEIGHT // 2 - 50))
+        # Redesenha apenas quando o nome digitado muda
+        if renderer.needs_redraw():
+            screen.fill(WHITE)
+            prompt_text = font.render("Digite seu nome para salvar o recorde:", True, BLACK)
+            screen.blit(prompt_text, (WIDTH // 2 - 200, HEIGHT // 2 - 50))
 
-        name_text = font.render(name, True, BLACK)
-        screen.blit(name_text, (WIDTH // 2 - 100, HEIGHT // 2))
+            name_text = font.render(name, True, BLACK)
+            screen.blit(name_text, (WIDTH // 2 - 100, HEIGHT // 2))
 
-        pygame.display.flip()
+        renderer.present()
+        clock.tick(FPS)
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             elif event.type == pygame.KEYDOWN:
+                renderer.invalidate()
                 if event.key == pygame.K_RETURN:
                     return name.strip()
                 elif event.key == pygame.K_BACKSPACE:
@@ -99,22 +121,27 @@ def singleplayer_main():
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("RPG Game - Prototype")
     clock = pygame.time.Clock()
-    font = pygame.font.SysFont("arial", 24)
+    font = get_font(24)
 
     inventory_db.create_sample_items()
 
-    # Carrega o background do mapa grande
-    background_path = os.path.join(os.path.dirname(__file__), "assets", "large_background.png")
-    if os.path.exists(background_path):
-        background = pygame.image.load(background_path).convert()
-        background = pygame.transform.scale(background, (MAP_WIDTH, MAP_HEIGHT))
+    # Carrega o mapa em pedaços (se gerado) ou o background do mapa grande
+    background = load_map() if USE_CHUNKED_MAP else None
+    if background is not None:
+        map_size = (background.width, background.height)
     else:
-        background = pygame.Surface((MAP_WIDTH, MAP_HEIGHT))
-        background.fill(GRAY)
-
-    # Inicializa a câmera
-    from camera import Camera
-    camera = Camera(MAP_WIDTH, MAP_HEIGHT)
+        map_size = (MAP_WIDTH, MAP_HEIGHT)
+        background_path = os.path.join(os.path.dirname(__file__), "assets", "large_background.png")
+        if os.path.exists(background_path):
+            background = load_image(background_path, map_size, alpha=False)
+        else:
+            background = pygame.Surface(map_size)
+            background.fill(GRAY)
+
+    # Inicializa a câmera e gera os mipmaps do fundo (zoom sem redimensionar o mapa inteiro)
+    camera = Camera(*map_size)
+    if not isinstance(background, ChunkedMap):
+        camera.build_mipmaps(background)
 
     if not pygame.mixer.get_init() or not pygame.mixer.music.get_busy():
         play_music()
@@ -122,20 +149,59 @@ def singleplayer_main():
     while True:
         # Cria os grupos de sprites
         all_sprites = pygame.sprite.Group()
-        enemies_group = pygame.sprite.Group()
-        items_group = pygame.sprite.Group()
+        items_group = SpatialGroup()  # Itens com índice espacial (coleta)
+        enemies_group = EnemyStore(all_sprites, items_group)  # Inimigos em arrays, com índice espacial (ataques)
         npc_group = pygame.sprite.Group()
 
+        # Nova partida: relógio do jogo zerado e sem timers da partida anterior
+        game_clock.reset()
+
         # Cria o jogador (posicionado no centro do mapa)
-        player = Player((MAP_WIDTH // 2, MAP_HEIGHT // 2))
+        player = Player((map_size[0] // 2, map_size[1] // 2), map_size)
         all_sprites.add(player)
 
         # Cria o nível (controle de inimigos, itens e NPCs)
-        level = Level(player, all_sprites, enemies_group, items_group, npc_group)
+        level = Level(player, all_sprites, enemies_group, items_group, npc_group, map_size)
+
+        # Com a câmera parada, apenas as regiões alteradas são enviadas para a janela
+        renderer = DirtyRectRenderer()
+        render_queue = RenderQueue()
+
+        def draw_background(screen):
+            """Camada de fundo: parte visível do mapa com zoom (em cache por nível de zoom)."""
+            screen.fill(BLACK)
+            camera.draw_background(screen, background)
+
+        def draw_ui(screen):
+            """Camada de interface: prompts e diálogo dos NPCs, barras de vida e HUD."""
+            for npc in npc_group:
+                prompt_rect = npc.draw_interaction_prompt(screen, font, camera)
+                if prompt_rect:
+                    renderer.mark(("prompt", id(npc)), prompt_rect)
+
+            # Se houver diálogo ativo, desenha a caixa de diálogo do NPC
+            if level.current_npc and level.dialogue_active:
+                dialogue_rect = level.current_npc.draw_dialogue_box(screen, font)
+                if dialogue_rect:
+                    renderer.mark("dialogue", dialogue_rect, level.current_npc.current_dialogue)
+
+            # Barras de vida dos inimigos na área visível (enfileiradas e desenhadas em um único lote)
+            for enemy in enemies_group.on_screen:
+                bar = health_bars.add(enemy, camera.apply(enemy), camera.zoom_factor)
+                if bar:
+                    renderer.mark(("bar", id(enemy)), *bar)
+            health_bars.flush(screen)
+
+            renderer.add_dirty(draw_hud(screen, player, font, level))
+            renderer.add_dirty(draw_player_health_bar(screen, player))
+
+        # A simulação avança em ticks fixos (SIMULATION_RATE), independente do FPS da renderização
+        timestep = FixedTimestep()
+        interpolator = Interpolator()
 
         running = True
         while running:
-            clock.tick(FPS)
+            frame_seconds = clock.tick(FPS) / 1000
             keys = pygame.key.get_pressed()
 
             for event in pygame.event.get():
@@ -149,36 +215,51 @@ def singleplayer_main():
                         player.special_attack(enemies_group)
                     # Ao pressionar I, abre a interface gráfica do inventário
                     elif event.key == pygame.K_i:
+                        # O relógio do jogo fica pausado: buffs, cooldowns e timers não correm
+                        game_clock.pause()
                         player.inventory.open_inventory(screen, player)
+                        game_clock.resume()
+                        renderer.invalidate()  # O inventário ocupou a tela inteira
+                        clock.tick()  # O tempo com o inventário aberto não é simulado
+                        timestep.reset()
                     elif event.key == pygame.K_h:
                         player.use_item("Health Potion")
                     elif event.key == pygame.K_m:
                         player.use_item("Mana Potion")
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 4:
-                        camera.zoom_factor = min(2.0, camera.zoom_factor + 0.1)
+                        camera.set_zoom(camera.zoom_factor + 0.1)
                     elif event.button == 5:
-                        camera.zoom_factor = max(0.5, camera.zoom_factor - 0.1)
-
-            # Atualiza o jogador SEMPRE, permitindo que ele se mova e interaja
-            player.update(keys)
-            
-            # Chama a função de interação do NPC a cada frame
-            level.handle_npc_interaction(keys)
-            
-            # Atualiza inimigos, itens e nível somente se não houver interação ativa com o NPC
-            if not level.npc_active:
-                enemies_group.update(player)
-                items_group.update()
-                level.update()
-
-            # Atualiza os NPCs, passando o objeto do jogador para atualizar a proximidade
-            npc_group.update(player)
+                        camera.set_zoom(camera.zoom_factor - 0.1)
+
+            for _ in range(timestep.advance(frame_seconds)):
+                interpolator.snapshot(all_sprites, items_group, npc_group)
+                enemies_group.snapshot()
+
+                # Avança o relógio do jogo em um tick, disparando os timers vencidos
+                game_clock.advance(timestep.dt * 1000)
+
+                # Atualiza o jogador SEMPRE, permitindo que ele se mova e interaja
+                player.update(keys)
+
+                # Chama a função de interação do NPC a cada tick
+                level.handle_npc_interaction(keys)
+
+                # Atualiza inimigos, itens e nível somente se não houver interação ativa com o NPC
+                if not level.npc_active:
+                    enemy_batch.update(enemies_group, [player], level.flow_field)
+                    items_group.update()
+                    level.update()
+
+                # Atualiza os NPCs, passando o objeto do jogador para atualizar a proximidade
+                npc_group.update(player)
+
+                if player.health <= 0:
+                    break
 
             # Se o jogador morrer, exibe mensagem e aguarda que pressione K para retornar ao menu
             if player.health <= 0:
-                game_over_font = pygame.font.SysFont("arial", 36)
-                game_over_text = game_over_font.render("Você morreu. Pressione K para retornar ao menu.", True, RED)
+                game_over_text = render_text(get_font(36), "Você morreu. Pressione K para retornar ao menu.", RED)
                 screen.fill(BLACK)
                 screen.blit(game_over_text, (WIDTH // 2 - game_over_text.get_width() // 2, HEIGHT // 2))
                 pygame.display.flip()
@@ -197,56 +278,28 @@ def singleplayer_main():
                 print("🔄 Voltando ao menu...")
                 return main()  # Retorna ao menu principal
 
-            collected_items = pygame.sprite.spritecollide(player, items_group, True)
-            for item in collected_items:
+            for item in colliding(items_group, player.rect):
+                item.kill()
                 item.apply_effect(player)
 
-            # Atualiza a câmera para centralizar o jogador (offset sem zoom)
-            camera.update(player)
-
-            screen.fill(BLACK)
-
-            # Aplica o zoom ao background e extrai a parte visível
-            zoomed_background = camera.apply_zoom_to_background(background)
-            screen.blit(zoomed_background, (0, 0))
-
-            # Desenha os sprites com o zoom aplicado
-            for sprite in all_sprites:
-                zoomed_rect = camera.apply(sprite)
-                zoomed_sprite = pygame.transform.scale(sprite.image, (zoomed_rect.width, zoomed_rect.height))
-                screen.blit(zoomed_sprite, zoomed_rect)
-            for sprite in items_group:
-                zoomed_rect = camera.apply(sprite)
-                zoomed_sprite = pygame.transform.scale(sprite.image, (zoomed_rect.width, zoomed_rect.height))
-                screen.blit(zoomed_sprite, zoomed_rect)
-            for sprite in npc_group:
-                zoomed_rect = camera.apply(sprite)
-                zoomed_sprite = pygame.transform.scale(sprite.image, (zoomed_rect.width, zoomed_rect.height))
-                screen.blit(zoomed_sprite, zoomed_rect)
-
-            # Se houver diálogo ativo, desenha a caixa de diálogo do NPC
-            if level.current_npc and level.dialogue_active:
-                level.current_npc.draw_dialogue_box(screen, font)
-
-            # Desenha as barras de vida dos inimigos
-            for enemy in enemies_group:
-                zoomed_rect = camera.apply(enemy)
-                bar_width = int(50 * camera.zoom_factor)
-                bar_height = int(5 * camera.zoom_factor)
-                fill = (enemy.health / enemy.max_health) * bar_width
-                outline_rect = pygame.Rect(zoomed_rect.centerx - bar_width // 2,
-                                             zoomed_rect.top - int(10 * camera.zoom_factor),
-                                             bar_width, bar_height)
-                fill_rect = pygame.Rect(zoomed_rect.centerx - bar_width // 2,
-                                        zoomed_rect.top - int(10 * camera.zoom_factor),
-                                        fill, bar_height)
-                pygame.draw.rect(screen, (255, 255, 255), outline_rect)
-                pygame.draw.rect(screen, (255, 0, 0), fill_rect)
-                pygame.draw.rect(screen, (0, 0, 0), outline_rect, 1)
-
-            draw_hud(screen, player, font, level)
-            draw_player_health_bar(screen, player)
-            pygame.display.flip()
+            # Desenha os sprites na posição interpolada entre o tick anterior e o atual
+            with interpolator.interpolated(timestep.alpha, all_sprites, items_group, npc_group):
+                # Atualiza a câmera para centralizar o jogador (offset sem zoom)
+                camera.update(player)
+                camera.reset_render_stats()
+                renderer.track_camera(camera)
+
+                # Cada entidade é enviada uma única vez, na camada do seu tipo; só os inimigos na
+                # área da câmera ganham um sprite (EnemyStore.views)
+                render_queue.submit_draw(LAYER_BACKGROUND, draw_background)
+                render_queue.submit_group(items_group, LAYER_ITEMS)
+                render_queue.submit_group(enemies_group.views(camera, timestep.alpha), LAYER_ENEMIES)
+                render_queue.submit(player, LAYER_PLAYER)
+                render_queue.submit_group(npc_group, LAYER_NPCS)
+                render_queue.submit_group(all_sprites, LAYER_ENEMIES)
+                render_queue.submit_draw(LAYER_UI, draw_ui)
+                render_queue.draw(screen, camera, renderer)
+                renderer.present()
 
 def main():
     mode = menu()  # O menu retorna o modo selecionado: "multiplayer" ou "singleplayer"
@@ -261,4 +314,22 @@ def main():
         singleplayer_main()
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    from headless import headless_requested
+    parser = argparse.ArgumentParser(description="RPG Game")
+    parser.add_argument("--headless", action="store_true",
+                        help="simula o singleplayer sem janela nem áudio (também ativado por RPG_HEADLESS=1)")
+    parser.add_argument("--frames", type=int, default=HEADLESS_FRAMES, help="atualizações da simulação headless")
+    parser.add_argument("--seed", type=int, default=None, help="semente aleatória da simulação headless")
+    parser.add_argument("--fps", type=int, default=None,
+                        help="limita a simulação headless a N atualizações por segundo (padrão: sem limite)")
+    parser.add_argument("--obstacles", type=int, default=0,
+                        help="bloqueia N retângulos aleatórios no campo de direções dos inimigos (headless)")
+    parser.add_argument("--check-flow-field", action="store_true",
+                        help="compara cada atualização incremental do campo com um recálculo completo (headless)")
+    args = parser.parse_args()
+    if args.headless or headless_requested():
+        import headless
+        headless.main(args.frames, args.seed, args.fps, args.obstacles, args.check_flow_field)
+    else:
+        main()
@@ -1,16 +1,44 @@
 import pygame
 import sys
 import os
-from settings import WIDTH, HEIGHT, WHITE, BLACK, RED
+from settings import WIDTH, HEIGHT, FPS, WHITE, BLACK, RED
+from assets import load_image
+from preloader import preloader
+from render import DirtyRectRenderer, get_font, render_text
 
 RECORDS_FILE = "records.txt"
 
 def draw_text(screen, text, font, color, x, y):
     """Desenha texto na tela, centralizado na posição (x, y)."""
-    text_surface = font.render(text, True, color)
+    text_surface = render_text(font, text, color)
     text_rect = text_surface.get_rect(center=(x, y))
     screen.blit(text_surface, text_rect)
 
+def draw_loading_bar(screen, progress, y=HEIGHT - 30):
+    """Desenha uma barra de progresso do carregamento dos assets."""
+    bar_width, bar_height = 300, 10
+    outline_rect = pygame.Rect(WIDTH // 2 - bar_width // 2, y, bar_width, bar_height)
+    fill_rect = pygame.Rect(outline_rect.x, y, int(bar_width * progress), bar_height)
+    pygame.draw.rect(screen, (50, 50, 50), outline_rect)
+    pygame.draw.rect(screen, WHITE, fill_rect)
+    pygame.draw.rect(screen, WHITE, outline_rect, 1)
+    return outline_rect
+
+def show_loading_screen(screen):
+    """Exibe a tela de carregamento até que todos os assets pré-carregados estejam prontos."""
+    font = get_font(30)
+    clock = pygame.time.Clock()
+    while not preloader.done():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+        screen.fill(BLACK)
+        draw_text(screen, "Carregando...", font, WHITE, WIDTH // 2, HEIGHT // 2 - 30)
+        draw_loading_bar(screen, preloader.progress(), HEIGHT // 2)
+        pygame.display.flip()
+        clock.tick(30)
+
 def save_record(player_name, rounds_survived):
     """Salva o recorde do jogador no arquivo records.txt."""
     if player_name.strip():  # Apenas salva se o jogador inserir um nome válido
@@ -32,33 +60,37 @@ def load_records():
 def show_records(screen):
     """Exibe a tela de recordes com um fundo personalizado."""
     running = True
-    font = pygame.font.SysFont("arial", 30)
+    font = get_font(30)
+    clock = pygame.time.Clock()
+    renderer = DirtyRectRenderer()
     records = load_records()
 
     # Carrega imagem de fundo para os recordes
     records_background_path = os.path.join(os.path.dirname(__file__), "assets", "background1.png")
     if os.path.exists(records_background_path):
-        records_background = pygame.image.load(records_background_path).convert()
-        records_background = pygame.transform.scale(records_background, (WIDTH, HEIGHT))
+        records_background = load_image(records_background_path, (WIDTH, HEIGHT), alpha=False)
     else:
         records_background = pygame.Surface((WIDTH, HEIGHT))
         records_background.fill(BLACK)  # Fundo preto caso a imagem não seja encontrada
     
     while running:
-        screen.blit(records_background, (0, 0))  # Exibe o fundo personalizado
-        draw_text(screen, "🏆 Recordes", font, WHITE, WIDTH // 2, 50)
-
-        y_offset = 120
-        if records:
-            for idx, (name, rounds) in enumerate(records[:10]):  # Mostra os 10 melhores
-                text = f"{idx + 1}. {name} - {rounds} Rounds"
-                draw_text(screen, text, font, WHITE, WIDTH // 2, y_offset)
-                y_offset += 40
-        else:
-            draw_text(screen, "Nenhum recorde salvo.", font, WHITE, WIDTH // 2, 120)
-
-        draw_text(screen, "Pressione ESC para voltar", font, WHITE, WIDTH // 2, HEIGHT - 50)
-        pygame.display.flip()
+        # A tela é estática: só é redesenhada quando invalidada
+        if renderer.needs_redraw():
+            screen.blit(records_background, (0, 0))  # Exibe o fundo personalizado
+            draw_text(screen, "🏆 Recordes", font, WHITE, WIDTH // 2, 50)
+
+            y_offset = 120
+            if records:
+                for idx, (name, rounds) in enumerate(records[:10]):  # Mostra os 10 melhores
+                    text = f"{idx + 1}. {name} - {rounds} Rounds"
+                    draw_text(screen, text, font, WHITE, WIDTH // 2, y_offset)
+                    y_offset += 40
+            else:
+                draw_text(screen, "Nenhum recorde salvo.", font, WHITE, WIDTH // 2, 120)
+
+            draw_text(screen, "Pressione ESC para voltar", font, WHITE, WIDTH // 2, HEIGHT - 50)
+        renderer.present()
+        clock.tick(FPS)
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -75,13 +107,14 @@ def game_mode_menu(screen):
     Retorna uma string indicando o modo selecionado.
     """
     running = True
-    font = pygame.font.SysFont("arial", 36)
+    font = get_font(36)
+    clock = pygame.time.Clock()
+    renderer = DirtyRectRenderer()
     
     # Carrega a imagem de fundo para o sub-menu
     background_path = os.path.join(os.path.dirname(__file__), "assets", "bck_grnd.png")
     if os.path.exists(background_path):
-        background = pygame.image.load(background_path).convert()
-        background = pygame.transform.scale(background, (WIDTH, HEIGHT))
+        background = load_image(background_path, (WIDTH, HEIGHT), alpha=False)
     else:
         background = pygame.Surface((WIDTH, HEIGHT))
         background.fill((30, 30, 30))
@@ -91,16 +124,17 @@ def game_mode_menu(screen):
     button_multi = pygame.Rect(WIDTH // 2 - 100, HEIGHT // 2 + 20, 200, 50)
     
     while running:
-        screen.blit(background, (0, 0))
-        draw_text(screen, "Escolha o Modo de Jogo", font, RED, WIDTH // 2, HEIGHT // 2 - 120)
-        
-        pygame.draw.rect(screen, (50, 50, 50), button_single)
-        pygame.draw.rect(screen, (50, 50, 50), button_multi)
-        
-        draw_text(screen, "Singleplayer", font, WHITE, WIDTH // 2, HEIGHT // 2 - 25)
-        draw_text(screen, "Multiplayer", font, WHITE, WIDTH // 2, HEIGHT // 2 + 45)
-        
-        pygame.display.flip()
+        if renderer.needs_redraw():
+            screen.blit(background, (0, 0))
+            draw_text(screen, "Escolha o Modo de Jogo", font, RED, WIDTH // 2, HEIGHT // 2 - 120)
+
+            pygame.draw.rect(screen, (50, 50, 50), button_single)
+            pygame.draw.rect(screen, (50, 50, 50), button_multi)
+
+            draw_text(screen, "Singleplayer", font, WHITE, WIDTH // 2, HEIGHT // 2 - 25)
+            draw_text(screen, "Multiplayer", font, WHITE, WIDTH // 2, HEIGHT // 2 + 45)
+        renderer.present()
+        clock.tick(FPS)
         
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -118,16 +152,21 @@ def menu():
     pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("RPG Game - Menu")
-    
+
+    # Começa a decodificar os assets do jogo em segundo plano enquanto o menu é exibido
+    preloader.preload_defaults()
+
     # Carrega a imagem de fundo para o menu (pode ser diferente se desejado)
     menu_background_path = os.path.join(os.path.dirname(__file__), "assets", "menu.png")
     if os.path.exists(menu_background_path):
-        menu_background = pygame.image.load(menu_background_path).convert()
+        menu_background = load_image(menu_background_path, alpha=False)
     else:
         menu_background = pygame.Surface((WIDTH, HEIGHT))
         menu_background.fill(BLACK)
     
-    font = pygame.font.SysFont("arial", 36)
+    font = get_font(36)
+    clock = pygame.time.Clock()
+    renderer = DirtyRectRenderer()
 
     # Define os botões do menu
     button_start = pygame.Rect(WIDTH // 2 - 100, HEIGHT // 2 - 80, 200, 50)
@@ -136,18 +175,30 @@ def menu():
 
     running = True
     mode = None  # Armazena o modo de jogo escolhido
+    loading = True
     while running:
-        screen.blit(menu_background, (0, 0))
+        # Ao terminar o pré-carregamento, redesenha tudo para apagar a barra de progresso
+        if loading and preloader.done():
+            loading = False
+            renderer.invalidate()
 
-        pygame.draw.rect(screen, (50, 50, 50), button_start)
-        pygame.draw.rect(screen, (50, 50, 50), button_records)
-        pygame.draw.rect(screen, (50, 50, 50), button_exit)
+        if renderer.needs_redraw():
+            screen.blit(menu_background, (0, 0))
 
-        draw_text(screen, "Iniciar Jogo", font, WHITE, WIDTH // 2, HEIGHT // 2 - 55)
-        draw_text(screen, "Recordes", font, WHITE, WIDTH // 2, HEIGHT // 2 + 25)
-        draw_text(screen, "Sair", font, WHITE, WIDTH // 2, HEIGHT // 2 + 105)
+            pygame.draw.rect(screen, (50, 50, 50), button_start)
+            pygame.draw.rect(screen, (50, 50, 50), button_records)
+            pygame.draw.rect(screen, (50, 50, 50), button_exit)
 
-        pygame.display.flip()
+            draw_text(screen, "Iniciar Jogo", font, WHITE, WIDTH // 2, HEIGHT // 2 - 55)
+            draw_text(screen, "Recordes", font, WHITE, WIDTH // 2, HEIGHT // 2 + 25)
+            draw_text(screen, "Sair", font, WHITE, WIDTH // 2, HEIGHT // 2 + 105)
+
+        if loading:
+            progress = preloader.progress()
+            renderer.mark("loading", draw_loading_bar(screen, progress), progress)
+
+        renderer.present()
+        clock.tick(FPS)
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -158,9 +209,11 @@ def menu():
                 if button_start.collidepoint(mouse_pos):
                     # Ao clicar em Iniciar Jogo, exibe o sub-menu de modos de jogo
                     mode = game_mode_menu(screen)
+                    show_loading_screen(screen)
                     running = False
                 elif button_records.collidepoint(mouse_pos):
                     show_records(screen)
+                    renderer.invalidate()  # A tela de recordes sobrescreveu o menu
                 elif button_exit.collidepoint(mouse_pos):
                     pygame.quit()
                     sys.exit()
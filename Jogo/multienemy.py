@@ -2,23 +2,28 @@ import pygame
 import random
 import pickle
 from settings import MAP_WIDTH, MAP_HEIGHT
-from enemy import Enemy as NormalEnemy
-from enemy2 import Enemy as FastEnemy
-from enemy3 import Enemy as TankEnemy
+from archetypes import ENEMY_ARCHETYPES, choose_enemy_type
 from enemyboss import EnemyBoss  # <-- Importe sua classe Boss aqui
+from sprite_table import enemy_sprites
+from enemy_batch import enemy_batch
+from flowfield import FlowField
+from gameclock import game_clock
+
 
 class MultiEnemyManager:
-    def __init__(self, all_sprites, enemies_group, items_group):
+    def __init__(self, all_sprites, enemies_group, items_group, map_size=(MAP_WIDTH, MAP_HEIGHT)):
         """
         Gerencia inimigos para o multiplayer.
         """
+        self.map_width, self.map_height = map_size
+        self.flow_field = FlowField(map_size)  # Campo com uma origem por jogador (flowfield.py)
         self.all_sprites = all_sprites
         self.enemies_group = enemies_group
         self.items_group = items_group
 
         self.round_number = 1
         self.spawn_interval = 5000  # Tempo (ms) entre spawns
-        self.last_spawn_time = pygame.time.get_ticks()
+        self.last_spawn_time = game_clock.now()
 
     def spawn_enemy(self):
         """
@@ -35,33 +40,20 @@ class MultiEnemyManager:
         Cria e adiciona um novo inimigo normal no mapa, escolhendo aleatoriamente
         entre Normal, Rápido e Tanque conforme o round.
         """
-        pos_x = random.randint(50, MAP_WIDTH - 50)
-        pos_y = random.randint(50, MAP_HEIGHT - 50)
+        pos_x = random.randint(50, self.map_width - 50)
+        pos_y = random.randint(50, self.map_height - 50)
 
-        # Seleciona o tipo de inimigo baseado no round
-        if self.round_number % 3 == 0:
-            enemy_class = random.choices(
-                [NormalEnemy, FastEnemy, TankEnemy],
-                weights=[30, 30, 40]
-            )[0]
-        elif self.round_number % 2 == 0:
-            enemy_class = random.choices(
-                [NormalEnemy, FastEnemy, TankEnemy],
-                weights=[30, 50, 20]
-            )[0]
-        else:
-            enemy_class = random.choice([NormalEnemy, FastEnemy, TankEnemy])
-        
-        enemy = enemy_class((pos_x, pos_y), self.round_number, self.all_sprites, self.items_group)
-        self.enemies_group.add(enemy)
+        # Seleciona o tipo de inimigo baseado no round (pesos em archetypes.py)
+        enemy_type = choose_enemy_type(self.round_number)
+        enemy = self.enemies_group.spawn(enemy_type, (pos_x, pos_y), self.round_number)
         print(f"👿 Novo inimigo ({enemy.type}) (round {self.round_number}) spawnado na posição {enemy.rect.topleft}!")
 
     def spawn_boss(self):
         """
         Cria e adiciona o Boss no mapa, em posição aleatória.
         """
-        pos_x = random.randint(100, MAP_WIDTH - 100)
-        pos_y = random.randint(100, MAP_HEIGHT - 100)
+        pos_x = random.randint(100, self.map_width - 100)
+        pos_y = random.randint(100, self.map_height - 100)
         boss = EnemyBoss((pos_x, pos_y), self.round_number, self.all_sprites, self.items_group)
         self.enemies_group.add(boss)
         print(f"👹 Boss spawnado no round {self.round_number}, posição {boss.rect.topleft}!")
@@ -71,16 +63,15 @@ class MultiEnemyManager:
         Atualiza os inimigos (movimentação, ataque) e realiza o spawn em intervalos de tempo.
         :param players: Lista de jogadores (ou jogador único) para os inimigos atacarem.
         """
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.now()
 
         # Verifica se deve spawnar um novo inimigo/boss
         if current_time - self.last_spawn_time >= self.spawn_interval:
             self.spawn_enemy()
             self.last_spawn_time = current_time
 
-        # Atualiza cada inimigo (movimento e ataque)
-        for enemy in self.enemies_group:
-            enemy.update(players)
+        # Atualiza os inimigos (movimento e ataque), em lote quando a onda é grande
+        enemy_batch.update(self.enemies_group, players, self.flow_field)
 
     def get_enemy_state(self):
         """
@@ -107,37 +98,17 @@ class MultiEnemyManager:
             self.enemies_group.empty()
 
             for _, info in enemies.items():
-                enemy_type = info.get("type", "Normal")
+                # Tipo recebido do servidor: o Boss tem classe própria, os demais vêm da tabela
+                enemy_type = info.get("type")
+                position = (info["x"], info["y"])
                 if enemy_type == "Boss":
-                    enemy = EnemyBoss(
-                        (info["x"], info["y"]),
-                        info["round"],
-                        self.all_sprites,
-                        self.items_group
-                    )
-                elif enemy_type == "Tanque":
-                    enemy = TankEnemy(
-                        (info["x"], info["y"]),
-                        info["round"],
-                        self.all_sprites,
-                        self.items_group
-                    )
-                elif enemy_type == "Rápido":
-                    enemy = FastEnemy(
-                        (info["x"], info["y"]),
-                        info["round"],
-                        self.all_sprites,
-                        self.items_group
-                    )
+                    enemy = EnemyBoss(position, info["round"], self.all_sprites, self.items_group)
+                    self.enemies_group.add(enemy)
                 else:
-                    enemy = NormalEnemy(
-                        (info["x"], info["y"]),
-                        info["round"],
-                        self.all_sprites,
-                        self.items_group
-                    )
+                    if enemy_type not in ENEMY_ARCHETYPES:
+                        enemy_type = "Normal"
+                    enemy = self.enemies_group.spawn(enemy_type, position, info["round"])
                 enemy.health = info["health"]
-                self.enemies_group.add(enemy)
         except Exception as e:
             print(f"[ERROR] Falha ao sincronizar inimigos: {e}")
 
@@ -147,4 +118,5 @@ class MultiEnemyManager:
         """
         self.round_number += 1
         self.spawn_interval = max(3000, self.spawn_interval - 500)
+        enemy_sprites.prepare_round(self.round_number)
         print(f"🔥 Novo Round: {self.round_number}. Inimigos mais fortes e spawn mais rápido!")
@@ -9,8 +9,17 @@ import time
 from player import Player
 from level import Level
 from multienemy import MultiEnemyManager
-from settings import WIDTH, HEIGHT, FPS, MAP_WIDTH, MAP_HEIGHT, WHITE, RED, BLACK, MUSIC_VOLUME
+from settings import WIDTH, HEIGHT, FPS, MAP_WIDTH, MAP_HEIGHT, WHITE, RED, BLACK, MUSIC_VOLUME, USE_CHUNKED_MAP
 from camera import Camera
+from assets import load_image
+from render import (DirtyRectRenderer, RenderQueue, get_font, render_text,
+                    LAYER_BACKGROUND, LAYER_ENEMIES, LAYER_PLAYER, LAYER_UI)
+from tilemap import load_map, ChunkedMap
+from healthbar import health_bars
+from timestep import FixedTimestep, Interpolator
+from gameclock import game_clock
+from spatial import SpatialGroup
+from enemy import EnemyStore
 
 # Domínio padrão (ngrok) e porta padrão para desenvolvimento local (pode ser alterada pelo usuário)
 SERVER_IP_DEFAULT = '0.tcp.sa.ngrok.io'
@@ -59,10 +68,10 @@ class MultiplayerGame:
         Desenha uma tela de entrada para coletar dados do usuário (por exemplo, porta ou nome).
         """
         input_text = ""
-        font = pygame.font.SysFont("arial", 30)
+        font = get_font(30)
         while True:
             self.screen.fill(BLACK)
-            prompt_text = font.render(prompt, True, WHITE)
+            prompt_text = render_text(font, prompt, WHITE)
             self.screen.blit(prompt_text, (WIDTH // 2 - 200, HEIGHT // 2 - 50))
             input_surface = font.render(input_text, True, WHITE)
             self.screen.blit(input_surface, (WIDTH // 2 - 100, HEIGHT // 2))
@@ -81,9 +90,8 @@ class MultiplayerGame:
 
     def display_message(self, message, duration=3000):
         """Exibe uma mensagem na tela por 'duration' ms."""
-        font = pygame.font.SysFont("arial", 24)
         self.screen.fill(BLACK)
-        text = font.render(message, True, WHITE)
+        text = render_text(get_font(24), message, WHITE)
         rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
         self.screen.blit(text, rect)
         pygame.display.flip()
@@ -125,34 +133,45 @@ class MultiplayerSession:
         self.screen = screen
         self.running = True
 
+        # Carrega o mapa em pedaços (se gerado) ou o background do mapa
+        self.background = load_map() if USE_CHUNKED_MAP else None
+        if self.background is not None:
+            map_size = (self.background.width, self.background.height)
+        else:
+            map_size = (MAP_WIDTH, MAP_HEIGHT)
+            background_path = os.path.join(os.path.dirname(__file__), "assets", "large_background.png")
+            if os.path.exists(background_path):
+                self.background = load_image(background_path, map_size, alpha=False)
+            else:
+                self.background = pygame.Surface(map_size)
+                self.background.fill(BLACK)
+
+        # Nova partida: relógio do jogo zerado e sem timers de partidas anteriores
+        game_clock.reset()
+
         # Inicializa o jogador local
-        self.player = Player((MAP_WIDTH // 2, MAP_HEIGHT // 2))
+        self.player = Player((map_size[0] // 2, map_size[1] // 2), map_size)
         self.remote_players = {}  # Dicionário de jogadores remotos
 
-        # Carrega o background do mapa
-        background_path = os.path.join(os.path.dirname(__file__), "assets", "large_background.png")
-        if os.path.exists(background_path):
-            self.background = pygame.image.load(background_path).convert()
-            self.background = pygame.transform.scale(self.background, (MAP_WIDTH, MAP_HEIGHT))
-        else:
-            self.background = pygame.Surface((MAP_WIDTH, MAP_HEIGHT))
-            self.background.fill(BLACK)
-
-        # Câmera
-        self.camera = Camera(MAP_WIDTH, MAP_HEIGHT)
+        # Câmera e apresentação por regiões alteradas (flip completo quando a câmera se move)
+        self.camera = Camera(*map_size)
+        if not isinstance(self.background, ChunkedMap):
+            self.camera.build_mipmaps(self.background)
+        self.renderer = DirtyRectRenderer()
+        self.render_queue = RenderQueue()
 
         # Grupos de sprites
         self.all_sprites = pygame.sprite.Group()
-        self.enemies_group = pygame.sprite.Group()
-        self.items_group = pygame.sprite.Group()
+        self.items_group = SpatialGroup()
+        self.enemies_group = EnemyStore(self.all_sprites, self.items_group)  # Inimigos em arrays, com índice espacial
         self.npc_group = pygame.sprite.Group()
         self.all_sprites.add(self.player)
 
         # Gerenciador de inimigos para multiplayer
-        self.enemy_manager = MultiEnemyManager(self.all_sprites, self.enemies_group, self.items_group)
+        self.enemy_manager = MultiEnemyManager(self.all_sprites, self.enemies_group, self.items_group, map_size)
 
         # Inicializa o nível
-        self.level = Level(self.player, self.all_sprites, self.enemies_group, self.items_group, self.npc_group)
+        self.level = Level(self.player, self.all_sprites, self.enemies_group, self.items_group, self.npc_group, map_size)
 
         # Socket para comunicação com o servidor
         self.client = None
@@ -212,12 +231,16 @@ class MultiplayerSession:
         except Exception as e:
             print(f"[ERROR] Erro ao enviar dados: {e}")
 
-    def process_events(self):
-        """Captura e processa os eventos do jogador local."""
-        keys = pygame.key.get_pressed()
+    def update(self, keys):
+        """Avança um tick de simulação: jogador local (posição enviada ao servidor) e inimigos."""
         self.player.update(keys)
         pos = {"x": self.player.rect.x, "y": self.player.rect.y}
         self.send_data({"action": "move", "player_id": self.player_id, "position": pos})
+        players_list = [self.player]
+        self.enemy_manager.update(players_list)
+
+    def process_events(self):
+        """Captura e processa os eventos do jogador local."""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
@@ -231,8 +254,11 @@ class MultiplayerSession:
                     self.running = False
 
     def draw_hud(self):
-        """Desenha informações (HP, Mana, XP, Level, Round) do jogador local."""
-        font = pygame.font.SysFont("arial", 24)
+        """
+        Desenha informações (HP, Mana, XP, Level, Round) do jogador local.
+        Retorna o retângulo da tela ocupado pela HUD.
+        """
+        font = get_font(24)
         # Agora usamos o round do gerenciador de inimigos, que reflete a lógica atualizada
         texts = [
             f'HP: {self.player.health}/{self.player.max_health}',
@@ -242,37 +268,65 @@ class MultiplayerSession:
             f'Round: {self.enemy_manager.round_number}'
         ]
         y = 10
+        hud_rect = pygame.Rect(10, y, 0, 0)
         for text in texts:
-            self.screen.blit(font.render(text, True, WHITE), (10, y))
+            hud_rect.union_ip(self.screen.blit(render_text(font, text, WHITE), (10, y)))
             y += 30
+        return hud_rect
 
-    def render(self):
-        """Renderiza cenário, inimigos, jogadores e HUD."""
-        self.camera.update(self.player)
-        zoomed_background = self.camera.apply_zoom_to_background(self.background)
-        self.screen.blit(zoomed_background, (0, 0))
-        for enemy in self.enemies_group:
-            zoomed_rect = self.camera.apply(enemy)
-            self.screen.blit(enemy.image, zoomed_rect)
-            enemy.draw_health_bar(self.screen, zoomed_rect)
+    def draw_remote_players(self, screen):
+        """Desenha os marcadores dos jogadores remotos (círculos de raio 20) visíveis na câmera."""
         for pid, pos in self.remote_players.items():
+            if not self.camera.cull(pygame.Rect(pos["x"] - 20, pos["y"] - 20, 40, 40)):
+                continue
             zoomed_x = int((pos["x"] - self.camera.camera_rect.x) * self.camera.zoom_factor)
             zoomed_y = int((pos["y"] - self.camera.camera_rect.y) * self.camera.zoom_factor)
-            pygame.draw.circle(self.screen, COLOR_REMOTE, (zoomed_x, zoomed_y), 20)
-        zoomed_rect = self.camera.apply(self.player)
-        scaled_player = pygame.transform.scale(self.player.image, (zoomed_rect.width, zoomed_rect.height))
-        self.screen.blit(scaled_player, zoomed_rect)
-        self.draw_hud()
-        pygame.display.flip()
+            marker_rect = pygame.draw.circle(screen, COLOR_REMOTE, (zoomed_x, zoomed_y), 20)
+            self.renderer.mark(("remote", pid), marker_rect)
+
+    def draw_ui(self, screen):
+        """Camada de interface: barras de vida dos inimigos visíveis (em um único lote) e HUD."""
+        for enemy in self.enemies_group.on_screen:
+            bar = health_bars.add(enemy, self.camera.apply(enemy), self.camera.zoom_factor)
+            if bar:
+                self.renderer.mark(("bar", id(enemy)), *bar)
+        health_bars.flush(screen)
+        self.renderer.add_dirty(self.draw_hud())
+
+    def render(self, alpha=1.0):
+        """
+        Renderiza cenário, inimigos, jogadores e HUD pela fila de renderização em camadas.
+        'alpha' é a fração do tick atual usada para interpolar os inimigos (timestep.py).
+        """
+        self.camera.update(self.player)
+        self.camera.reset_render_stats()
+        self.renderer.track_camera(self.camera)
+        self.render_queue.submit_draw(LAYER_BACKGROUND, lambda screen: self.camera.draw_background(screen, self.background))
+        self.render_queue.submit_group(self.enemies_group.views(self.camera, alpha), LAYER_ENEMIES)
+        self.render_queue.submit_draw(LAYER_PLAYER, self.draw_remote_players)
+        self.render_queue.submit(self.player, LAYER_PLAYER)
+        self.render_queue.submit_draw(LAYER_UI, self.draw_ui)
+        self.render_queue.draw(self.screen, self.camera, self.renderer)
+        self.renderer.present()
 
     def run(self):
         """Loop principal do multiplayer."""
         listener_thread = threading.Thread(target=self.listen_for_updates, daemon=True)
         listener_thread.start()
+        # Simulação em ticks fixos (SIMULATION_RATE), a mesma taxa em todos os clientes
+        clock = pygame.time.Clock()
+        timestep = FixedTimestep()
+        interpolator = Interpolator()
         while self.running:
+            frame_seconds = clock.tick(FPS) / 1000
+            keys = pygame.key.get_pressed()
             self.process_events()
-            players_list = [self.player]
-            self.enemy_manager.update(players_list)
-            self.render()
+            for _ in range(timestep.advance(frame_seconds)):
+                interpolator.snapshot(self.enemies_group.extras, [self.player])
+                self.enemies_group.snapshot()
+                game_clock.advance(timestep.dt * 1000)
+                self.update(keys)
+            with interpolator.interpolated(timestep.alpha, self.enemies_group.extras, [self.player]):
+                self.render(timestep.alpha)
         pygame.quit()
         self.client.close()
@@ -2,25 +2,21 @@ import os
 import pygame
 import random
 from settings import WIDTH, HEIGHT, WHITE, BLACK, NPC_INTERACTION_DISTANCE, NPC_DIALOGUE_DELAY
-
-# Cache global para evitar recarregamento repetido de imagens de NPCs
-npc_image_cache = {}
+from assets import load_image
+from render import render_text
+from gameclock import game_clock
 
 class NPC(pygame.sprite.Sprite):
     def __init__(self, pos, name, image_path, dialogues):
         super().__init__()
 
-        # Tenta obter a imagem do cache; se não existir, carrega e armazena
-        if image_path in npc_image_cache:
-            original_image = npc_image_cache[image_path]
+        # A imagem original vem do cache compartilhado de assets
+        if os.path.exists(image_path):
+            original_image = load_image(image_path)
         else:
-            if os.path.exists(image_path):
-                original_image = pygame.image.load(image_path).convert_alpha()
-            else:
-                print(f"⚠️ Imagem '{image_path}' não encontrada para o NPC '{name}'. Usando imagem padrão.")
-                original_image = pygame.Surface((100, 100), pygame.SRCALPHA)
-                original_image.fill((150, 150, 150))
-            npc_image_cache[image_path] = original_image
+            print(f"⚠️ Imagem '{image_path}' não encontrada para o NPC '{name}'. Usando imagem padrão.")
+            original_image = pygame.Surface((100, 100), pygame.SRCALPHA)
+            original_image.fill((150, 150, 150))
 
         # Ajuste dinâmico do tamanho para manter a proporção (altura fixa de 200 pixels)
         scale_height = 200
@@ -28,7 +24,10 @@ class NPC(pygame.sprite.Sprite):
         if original_height == 0:
             original_height = 1  # Evita divisão por zero
         scale_width = int((scale_height / original_height) * original_width)
-        self.image = pygame.transform.scale(original_image, (scale_width, scale_height))
+        if os.path.exists(image_path):
+            self.image = load_image(image_path, (scale_width, scale_height))
+        else:
+            self.image = pygame.transform.scale(original_image, (scale_width, scale_height))
         self.rect = self.image.get_rect(center=pos)
 
         # Informações do NPC
@@ -60,7 +59,7 @@ class NPC(pygame.sprite.Sprite):
         """
         if self.player_near and not self.finished_interaction:
             self.interacting = True
-            self.last_dialogue_advance_time = pygame.time.get_ticks()
+            self.last_dialogue_advance_time = game_clock.now()
 
     def advance_dialogue(self):
         """
@@ -69,7 +68,7 @@ class NPC(pygame.sprite.Sprite):
         Quando não houver mais diálogos, finaliza a interação e dropa um item.
         """
         if self.interacting:
-            current_time = pygame.time.get_ticks()
+            current_time = game_clock.now()
             if current_time - self.last_dialogue_advance_time >= self.dialogue_delay:
                 if self.current_dialogue < len(self.dialogues) - 1:
                     self.current_dialogue += 1
@@ -78,7 +77,10 @@ class NPC(pygame.sprite.Sprite):
                     self.end_interaction()
 
     def draw_dialogue_box(self, screen, font):
-        """Desenha a caixa de diálogo na tela enquanto o NPC está interagindo."""
+        """
+        Desenha a caixa de diálogo na tela enquanto o NPC está interagindo.
+        Retorna o retângulo da caixa (ou None se nada foi desenhado).
+        """
         if self.interacting:
             dialogue_text = self.dialogues[self.current_dialogue]
 
@@ -89,21 +91,31 @@ class NPC(pygame.sprite.Sprite):
             pygame.draw.rect(screen, WHITE, (box_x, box_y, box_width, box_height), 2)
 
             # Renderiza o texto do diálogo
-            text_surface = font.render(f"{self.name}: {dialogue_text}", True, WHITE)
+            text_surface = render_text(font, f"{self.name}: {dialogue_text}", WHITE)
             screen.blit(text_surface, (box_x + 20, box_y + 30))
 
             # Instrução para continuar o diálogo
-            continue_text = font.render("Pressione X para continuar...", True, WHITE)
+            continue_text = render_text(font, "Pressione X para continuar...", WHITE)
             screen.blit(continue_text, (box_x + 20, box_y + 60))
+            return pygame.Rect(box_x, box_y, box_width, box_height)
+        return None
 
-    def draw_interaction_prompt(self, screen, font):
-        """Exibe um prompt indicando que o jogador pode interagir com o NPC."""
+    def draw_interaction_prompt(self, screen, font, camera=None):
+        """
+        Exibe um prompt indicando que o jogador pode interagir com o NPC.
+        Com uma câmera, o prompt acompanha o NPC na tela e não é desenhado se ele estiver fora dela.
+        Retorna o retângulo do prompt na tela (ou None se nada foi desenhado).
+        """
         if self.player_near and not self.interacting and not self.finished_interaction:
-            prompt_text = font.render("Pressione X para falar", True, WHITE)
+            if camera is not None and not camera.is_visible(self.rect):
+                return None
+            rect = camera.apply(self) if camera is not None else self.rect
+            prompt_text = render_text(font, "Pressione X para falar", WHITE)
             # Posiciona o prompt centralizado horizontalmente acima do NPC
-            prompt_x = self.rect.centerx - prompt_text.get_width() // 2
-            prompt_y = self.rect.top - 30
-            screen.blit(prompt_text, (prompt_x, prompt_y))
+            prompt_x = rect.centerx - prompt_text.get_width() // 2
+            prompt_y = rect.top - 30
+            return screen.blit(prompt_text, (prompt_x, prompt_y))
+        return None
 
     def drop_item(self):
         """Cria e retorna um item de Super Health Potion."""
@@ -1,13 +1,19 @@
 import os
 import pygame
 import sys
-import time
 from settings import *  # Certifique-se de que MAP_WIDTH e MAP_HEIGHT estão definidos em settings
 from inventory import Inventory
+from assets import load_image
+from animation import animation_frames
+from render import DirtyRectRenderer, get_font, render_text
+from spatial import colliding
+from gameclock import game_clock
 
 class Player(pygame.sprite.Sprite):
-    def __init__(self, pos):
+    def __init__(self, pos, map_size=(MAP_WIDTH, MAP_HEIGHT)):
         super().__init__()
+        self.map_width, self.map_height = map_size
+        self.show_game_over = True  # Desativado na simulação headless
 
         # Caminho dos assets
         self.current_path = os.path.dirname(__file__)
@@ -17,20 +23,15 @@ class Player(pygame.sprite.Sprite):
             "special2": os.path.join(self.current_path, "assets", "player2.png"),
         }
         # Carrega a imagem normal
-        self.normal_image = pygame.transform.scale(
-            pygame.image.load(self.image_paths["normal"]).convert_alpha(), (256, 144)
-        )
+        self.normal_image = load_image(self.image_paths["normal"], (256, 144))
         self.image = self.normal_image
         self.rect = self.image.get_rect(center=pos)
 
-        # Animação de ataque: carrega frames de ataque
-        self.attack_frames = [
-            pygame.transform.scale(pygame.image.load(os.path.join(self.current_path, "assets", "player_frame1.png")).convert_alpha(), (1920, 1080)),
-            pygame.transform.scale(pygame.image.load(os.path.join(self.current_path, "assets", "player_frame2.png")).convert_alpha(), (1920, 1080))
-        ]
+        # Animação de ataque: frames no tamanho do jogador, compartilhados pelo armazenamento de animações
+        self.attack_frames = animation_frames.frames("player_attack", self.normal_image.get_size())
         self.attack_anim_duration = 300  # duração total da animação de ataque (ms)
         self.attack_anim_frame_time = 100  # tempo de cada frame (ms)
-        self.attack_anim_start = None   # hora de início da animação
+        self.attack_anim_timer = None   # timer do relógio do jogo que troca o próximo frame
         self.attacking = False
 
         # Atributos do jogador
@@ -41,8 +42,9 @@ class Player(pygame.sprite.Sprite):
         self.max_mana = PLAYER_MANA
         self.base_damage = PLAYER_DAMAGE
         self.special_damage = PLAYER_SPECIAL_DAMAGE
-        self.last_attack = 0
-        self.last_special_attack = 0
+        # Tempos em ms do relógio do jogo (gameclock.py); -inf: pode atacar desde o início
+        self.last_attack = float("-inf")
+        self.last_special_attack = float("-inf")
         self.attack_cooldown = PLAYER_ATTACK_COOLDOWN
         self.special_cooldown = 3000
         self.mana_cost = 30
@@ -51,9 +53,9 @@ class Player(pygame.sprite.Sprite):
         # Multiplicadores de dano e vida
         self.damage_multiplier = 1
         self.multiplier_active = False
-        self.multiplier_end_time = 0
+        self.multiplier_timer = None
         self.super_health_active = False
-        self.super_health_end_time = 0
+        self.super_health_timer = None
 
         # Sistema de level e XP
         self.xp = 0
@@ -61,11 +63,15 @@ class Player(pygame.sprite.Sprite):
         self.xp_to_next_level = 100
 
         # Controle de troca de imagem para itens especiais
-        self.special_item_time = 0  # Última vez que pegou um item especial
-        self.image_change_end_time = 0  # Momento em que a imagem deve voltar ao normal
+        self.special_item_time = float("-inf")  # Última vez (ms de jogo) que pegou um item especial
+        self.image_reset_timer = None  # Timer que devolve a imagem normal
 
     def update(self, keys):
-        """Atualiza a movimentação do jogador, animação de ataque e verifica efeitos ativos."""
+        """
+        Atualiza a movimentação do jogador.
+        Animação de ataque, fim dos buffs e volta da imagem normal são disparados
+        pelos timers do relógio do jogo (gameclock.py), sem verificação a cada frame.
+        """
         dx, dy = 0, 0
         if keys[pygame.K_w]:
             dy = -self.speed
@@ -77,84 +83,76 @@ class Player(pygame.sprite.Sprite):
             dx = self.speed
 
         # Atualiza a posição, garantindo que o jogador não saia dos limites do MAPA
-        self.rect.x = max(0, min(MAP_WIDTH - self.rect.width, self.rect.x + dx))
-        self.rect.y = max(0, min(MAP_HEIGHT - self.rect.height, self.rect.y + dy))
-
-        # Atualiza a animação de ataque, se estiver ocorrendo
-        if self.attacking:
-            elapsed = pygame.time.get_ticks() - self.attack_anim_start
-            frame_index = int(elapsed / self.attack_anim_frame_time)
-            if frame_index < len(self.attack_frames):
-                self.image = self.attack_frames[frame_index]
-            else:
-                # Final da animação; volta para imagem normal
-                self.image = self.normal_image
-                self.attacking = False
-
-        # Verifica se os buffs ou efeitos especiais expiraram
-        self.check_buffs()
-        self.check_image_reset()
+        self.rect.x = max(0, min(self.map_width - self.rect.width, self.rect.x + dx))
+        self.rect.y = max(0, min(self.map_height - self.rect.height, self.rect.y + dy))
 
     def play_attack_animation(self):
-        """Inicia a animação de ataque."""
+        """Inicia a animação de ataque; os frames seguintes são trocados por timers."""
+        game_clock.cancel(self.attack_anim_timer)
         self.attacking = True
-        self.attack_anim_start = pygame.time.get_ticks()
+        self.show_attack_frame(0)
+
+    def show_attack_frame(self, frame_index):
+        """Mostra o frame da animação de ataque e agenda o próximo (ou a volta à imagem normal)."""
+        if frame_index < len(self.attack_frames):
+            self.image = self.attack_frames[frame_index]
+            self.attack_anim_timer = game_clock.schedule(self.attack_anim_frame_time, self.show_attack_frame, frame_index + 1)
+        else:
+            # Final da animação; volta para imagem normal
+            self.image = self.normal_image
+            self.attacking = False
+            self.attack_anim_timer = None
 
     def collect_special_item(self):
-        """Altera a imagem do jogador ao pegar um item especial."""
-        current_time = time.time()
+        """Altera a imagem do jogador ao pegar um item especial (por 10s de jogo)."""
+        current_time = game_clock.now()
 
-        if current_time - self.special_item_time < 10:
-            self.image = pygame.transform.scale(
-                pygame.image.load(self.image_paths["special2"]).convert_alpha(), (180, 180)
-            )
+        if current_time - self.special_item_time < 10000:
+            self.image = load_image(self.image_paths["special2"], (180, 180))
             print("🔵 O jogador pegou outro item especial rapidamente! Mudou para player2.png")
         else:
-            self.image = pygame.transform.scale(
-                pygame.image.load(self.image_paths["special1"]).convert_alpha(), (200, 200)
-            )
+            self.image = load_image(self.image_paths["special1"], (200, 200))
             print("🟢 O jogador pegou um item especial! Mudou para player1.png")
 
         self.special_item_time = current_time
-        self.image_change_end_time = current_time + 10
+        game_clock.cancel(self.image_reset_timer)
+        self.image_reset_timer = game_clock.schedule(10000, self.reset_image)
 
-    def check_image_reset(self):
-        """Verifica se a imagem do jogador deve voltar à normalidade."""
-        if time.time() >= self.image_change_end_time and self.image_change_end_time != 0:
-            self.image = self.normal_image
-            self.image_change_end_time = 0
-            print("🔄 O tempo do efeito especial acabou. Voltando para a imagem normal.")
+    def reset_image(self):
+        """Volta à imagem normal quando o efeito do item especial acaba."""
+        self.image = self.normal_image
+        self.image_reset_timer = None
+        print("🔄 O tempo do efeito especial acabou. Voltando para a imagem normal.")
 
     def attack(self, enemies_group):
         """Realiza o ataque normal e toca a animação de ataque."""
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.now()
         if current_time - self.last_attack >= self.attack_cooldown:
             # Inicia animação de ataque
             self.play_attack_animation()
 
             damage = (self.base_damage + (self.level * 2)) * self.damage_multiplier
 
-            for enemy in enemies_group.copy():
-                if self.rect.colliderect(enemy.rect):
-                    enemy.take_damage(damage)
-                    if enemy.health <= 0:
-                        self.gain_xp(enemy.xp_reward)
-                        self.restore_health(25)
-                        print(f"⚔️ Inimigo derrotado! +25 HP. HP atual: {self.health}/{self.max_health}")
+            # Apenas os inimigos próximos são consultados (índice espacial do grupo)
+            for enemy in colliding(enemies_group, self.rect):
+                enemy.take_damage(damage)
+                if enemy.health <= 0:
+                    self.gain_xp(enemy.xp_reward)
+                    self.restore_health(25)
+                    print(f"⚔️ Inimigo derrotado! +25 HP. HP atual: {self.health}/{self.max_health}")
 
             self.last_attack = current_time
 
     def special_attack(self, enemies_group):
         """Realiza o ataque especial, consumindo mana."""
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.now()
         if self.mana >= self.mana_cost and (current_time - self.last_special_attack >= self.special_cooldown):
             damage = (self.special_damage + (self.level * 5)) * self.damage_multiplier
             self.mana -= self.mana_cost
 
-            for enemy in enemies_group.copy():
-                if self.rect.colliderect(enemy.rect):
-                    enemy.take_damage(damage)
-                    print(f"💥 Ataque Especial! Causou {damage} de dano.")
+            for enemy in colliding(enemies_group, self.rect):
+                enemy.take_damage(damage)
+                print(f"💥 Ataque Especial! Causou {damage} de dano.")
 
             self.last_special_attack = current_time
         elif self.mana < self.mana_cost:
@@ -174,7 +172,7 @@ class Player(pygame.sprite.Sprite):
         """Reduz o HP do jogador ao receber dano."""
         self.health -= amount
         print(f"💥 Dano recebido: {amount}. HP atual: {self.health}/{self.max_health}")
-        if self.health <= 0:
+        if self.health <= 0 and self.show_game_over:
             self.game_over()
 
     def gain_xp(self, amount):
@@ -199,7 +197,9 @@ class Player(pygame.sprite.Sprite):
         """Ativa o multiplicador de dano por 10 segundos."""
         self.damage_multiplier = 0.5
         self.multiplier_active = True
-        self.multiplier_end_time = time.time() + 10
+        # Ativar de novo renova a duração
+        game_clock.cancel(self.multiplier_timer)
+        self.multiplier_timer = game_clock.schedule(10000, self.end_damage_multiplier)
         print("🔥 Dano x2 ativado por 10 segundos!")
 
     def activate_super_health(self):
@@ -209,34 +209,40 @@ class Player(pygame.sprite.Sprite):
             self.max_health *= 3
             self.health = self.max_health
             self.super_health_active = True
-            self.super_health_end_time = time.time() + 30
-
-    def check_buffs(self):
-        """Verifica se os buffs de dano e super health expiraram."""
-        if self.multiplier_active and time.time() >= self.multiplier_end_time:
-            self.damage_multiplier = 1
-            self.multiplier_active = False
-            print("⏳ Dano x2 expirado!")
-        if self.super_health_active and time.time() >= self.super_health_end_time:
-            self.max_health //= 3
-            self.health = min(self.health, self.max_health)
-            self.super_health_active = False
-            print("💖 Poção de Vida Especial acabou! HP voltou ao normal.")
+            self.super_health_timer = game_clock.schedule(30000, self.end_super_health)
+
+    def end_damage_multiplier(self):
+        """Fim do multiplicador de dano (disparado pelo relógio do jogo)."""
+        self.damage_multiplier = 1
+        self.multiplier_active = False
+        self.multiplier_timer = None
+        print("⏳ Dano x2 expirado!")
+
+    def end_super_health(self):
+        """Fim da Poção de Vida Especial (disparado pelo relógio do jogo)."""
+        self.max_health //= 3
+        self.health = min(self.health, self.max_health)
+        self.super_health_active = False
+        self.super_health_timer = None
+        print("💖 Poção de Vida Especial acabou! HP voltou ao normal.")
 
     def game_over(self):
         """Exibe a tela de Game Over e aguarda a ação do jogador."""
         print("💀 GAME OVER! Você foi derrotado.")
         screen = pygame.display.set_mode((WIDTH, HEIGHT))
         gameover_path = os.path.join(os.path.dirname(__file__), "assets", "gameover.png")
-        gameover_image = pygame.image.load(gameover_path).convert()
+        gameover_image = load_image(gameover_path, alpha=False)
 
         running = True
+        clock = pygame.time.Clock()
+        renderer = DirtyRectRenderer()  # A tela de Game Over é estática: desenhada uma única vez
         while running:
-            screen.blit(gameover_image, (0, 0))
-            font = pygame.font.SysFont("arial", 36)
-            text = font.render("Pressione R para Reiniciar ou ESC para Sair", True, (255, 255, 255))
-            screen.blit(text, (WIDTH // 2 - 200, HEIGHT - 100))
-            pygame.display.flip()
+            if renderer.needs_redraw():
+                screen.blit(gameover_image, (0, 0))
+                text = render_text(get_font(36), "Pressione R para Reiniciar ou ESC para Sair", (255, 255, 255))
+                screen.blit(text, (WIDTH // 2 - 200, HEIGHT - 100))
+            renderer.present()
+            clock.tick(FPS)
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     pygame.quit()
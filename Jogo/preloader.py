@@ -0,0 +1,113 @@
+import os
+import threading
+import pygame
+from concurrent.futures import ThreadPoolExecutor
+from settings import WIDTH, HEIGHT, MAP_WIDTH, MAP_HEIGHT, PRELOAD_WORKERS, USE_CHUNKED_MAP
+from assets import asset_cache, asset_path
+from atlas import ATLAS_INDEX, ATLAS_SPRITES
+from tilemap import chunked_map_available
+
+# Assets conhecidos -> tamanho final (None mantém o tamanho original)
+BACKGROUND_ASSETS = {
+    "large_background.png": (MAP_WIDTH, MAP_HEIGHT),
+    "inventory.png": (WIDTH, HEIGHT),
+    "background1.png": (WIDTH, HEIGHT),
+    "bck_grnd.png": (WIDTH, HEIGHT),
+    "gameover.png": None,
+}
+SPRITE_ASSETS = [
+    "player_frame.png", "player_frame1.png", "player_frame2.png", "player1.png", "player2.png",
+    "enemy.png", "enemy1.png", "enemy2.png", "enemy_frame(1).png", "enemy_frame(2).png", "boss.png",
+    "vida.png", "item.png", "gold_coin.png", "super_health_potion.png",
+    "npc1.png", "npc_merchant.png", "npc_guardian.png",
+]
+
+
+def _decode(path, size):
+    """Decodifica (e redimensiona) a imagem em uma thread de trabalho, sem converter o formato."""
+    surface = pygame.image.load(path)
+    if size is not None and surface.get_size() != size:
+        surface = pygame.transform.scale(surface, size)
+    return surface
+
+
+class AssetPreloader:
+    def __init__(self, cache=asset_cache, workers=PRELOAD_WORKERS):
+        """
+        Decodifica os assets em um pool de threads enquanto o menu está na tela.
+        Os resultados são entregues ao cache de assets, que faz apenas a conversão
+        final (convert/convert_alpha) na thread principal quando a imagem for pedida.
+        """
+        self.cache = cache
+        self.workers = workers
+        self.executor = None
+        self.futures = {}  # (caminho, tamanho) -> Future ainda não consumido pelo cache
+        self.scheduled = set()  # Todas as chaves já agendadas (consumidas ou não)
+        self.completed = 0
+        self._lock = threading.Lock()
+
+    def preload(self, assets):
+        """
+        Agenda a decodificação dos assets informados.
+
+        Parâmetros:
+            assets (dict): caminho -> tamanho final (ou None).
+        """
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="preloader")
+        for path, size in assets.items():
+            key = (os.path.normpath(path), size)
+            if key in self.scheduled or not os.path.exists(path):
+                continue
+            future = self.executor.submit(_decode, key[0], size)
+            future.add_done_callback(self._on_done)
+            self.scheduled.add(key)
+            self.futures[key] = future
+            self.cache.add_pending(key[0], size, future, release=lambda key=key: self.futures.pop(key, None))
+
+    def _on_done(self, future):
+        with self._lock:
+            self.completed += 1
+
+    def preload_defaults(self):
+        """Agenda todos os assets conhecidos do jogo (sprites do atlas são ignorados)."""
+        assets = {asset_path(name): size for name, size in BACKGROUND_ASSETS.items()}
+        if USE_CHUNKED_MAP and chunked_map_available():
+            # O jogo desenha o mapa em pedaços: decodificar o mapa inteiro só ocuparia memória
+            del assets[asset_path("large_background.png")]
+        use_atlas = os.path.exists(ATLAS_INDEX)
+        for name in SPRITE_ASSETS:
+            if not (use_atlas and name in ATLAS_SPRITES):
+                assets[asset_path(name)] = None
+        # Imagens presentes no bundle já estão em pixels brutos e não precisam de decodificação
+        self.preload({path: size for path, size in assets.items() if not self.cache.in_bundle(path)})
+
+    def future(self, path, size=None):
+        """Retorna o Future da decodificação do asset (ou None se não foi agendado ou já foi consumido)."""
+        return self.futures.get((os.path.normpath(path), size))
+
+    def progress(self):
+        """Fração (0.0 a 1.0) dos assets agendados que já foram decodificados."""
+        if not self.scheduled:
+            return 1.0
+        return min(self.completed / len(self.scheduled), 1.0)
+
+    def done(self):
+        return self.progress() >= 1.0
+
+    def wait(self, timeout=None):
+        """Aguarda todos os assets agendados serem decodificados."""
+        for future in list(self.futures.values()):
+            try:
+                future.result(timeout)
+            except Exception as e:
+                print(f"⚠️ Falha ao pré-carregar asset: {e}")
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+
+# Pré-carregador compartilhado (iniciado pelo menu principal)
+preloader = AssetPreloader()
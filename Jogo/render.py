@@ -0,0 +1,262 @@
+import pygame
+from collections import OrderedDict
+from settings import SCALED_SPRITE_CACHE_SIZE, DIRTY_RECT_RENDERING, TEXT_CACHE_SIZE, FONT_NAME
+from assets import asset_cache
+
+
+class ScaledSpriteCache:
+    def __init__(self, capacity=SCALED_SPRITE_CACHE_SIZE):
+        """
+        Cache das imagens dos sprites já redimensionadas para o zoom da câmera.
+        As entradas são indexadas pela identidade da imagem de origem e pelo tamanho final;
+        quando uma entidade troca de imagem (ex.: frame de ataque), a chave muda
+        automaticamente e a entrada antiga acaba descartada pelo LRU.
+        """
+        self.capacity = capacity
+        self._cache = OrderedDict()  # (id da imagem, tamanho) -> (imagem, imagem escalada)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, image, size):
+        """Retorna a imagem no tamanho informado, redimensionando apenas na primeira vez."""
+        size = (max(0, int(size[0])), max(0, int(size[1])))
+        if image.get_size() == size:
+            return image
+
+        key = (id(image), size)
+        entry = self._cache.get(key)
+        # A referência guardada garante que o id não foi reaproveitado por outra superfície
+        if entry is not None and entry[0] is image:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return entry[1]
+
+        self.misses += 1
+        scaled = pygame.transform.scale(image, size)
+        self._store(key, (image, scaled))
+        return scaled
+
+    def _store(self, key, entry):
+        old_entry = self._cache.pop(key, None)
+        if old_entry is not None:
+            asset_cache.untrack(old_entry[1])
+        self._cache[key] = entry
+        asset_cache.track(entry[1])
+        while len(self._cache) > self.capacity:
+            _, (_, evicted) = self._cache.popitem(last=False)
+            asset_cache.untrack(evicted)
+
+    def invalidate(self, image):
+        """Remove todas as versões escaladas de uma imagem (ex.: quando ela foi alterada)."""
+        for key in [key for key, entry in self._cache.items() if entry[0] is image]:
+            _, scaled = self._cache.pop(key)
+            asset_cache.untrack(scaled)
+
+    def clear(self):
+        for _, scaled in self._cache.values():
+            asset_cache.untrack(scaled)
+        self._cache.clear()
+
+
+class FontRegistry:
+    def __init__(self):
+        """Fontes compartilhadas, criadas uma única vez por (nome, tamanho)."""
+        self._fonts = {}  # (nome, tamanho) -> pygame.font.Font
+
+    def get(self, size, name=FONT_NAME):
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(name, size)
+            self._fonts[key] = font
+        return font
+
+    def clear(self):
+        self._fonts.clear()
+
+
+class TextCache:
+    def __init__(self, capacity=TEXT_CACHE_SIZE):
+        """
+        Cache das superfícies de texto já renderizadas, indexadas por (fonte, texto, cor, antialias).
+        Um texto só é renderizado novamente quando seu conteúdo muda (ex.: o HP na HUD);
+        os textos menos usados são descartados (LRU).
+        """
+        self.capacity = capacity
+        self._cache = OrderedDict()  # (fonte, texto, cor, antialias) -> pygame.Surface
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        """Equivalente a font.render(text, antialias, color), reaproveitando o resultado."""
+        key = (font, text, tuple(color), antialias)
+        surface = self._cache.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._cache[key] = surface
+        asset_cache.track(surface)
+        if len(self._cache) > self.capacity:
+            _, evicted = self._cache.popitem(last=False)
+            asset_cache.untrack(evicted)
+        return surface
+
+    def clear(self):
+        for surface in self._cache.values():
+            asset_cache.untrack(surface)
+        self._cache.clear()
+
+
+class DirtyRectRenderer:
+    def __init__(self, enabled=DIRTY_RECT_RENDERING):
+        """
+        Apresenta o frame na janela atualizando apenas as regiões que mudaram.
+        Cada entidade desenhada é marcada com uma chave, seu retângulo na tela e uma
+        assinatura do conteúdo (ex.: a imagem atual); comparando com o frame anterior,
+        somente as áreas alteradas são enviadas com pygame.display.update(rects).
+        Se a câmera rolar ou mudar o zoom (ou invalidate() for chamado), faz um flip completo.
+        Com enabled=False o comportamento é sempre o flip completo.
+        """
+        self.enabled = enabled
+        self._previous = {}  # chave -> (retângulo, assinatura) do frame anterior
+        self._current = {}
+        self._extra = []     # Regiões marcadas diretamente como alteradas
+        self._full = True
+        self._camera_state = None
+
+    def invalidate(self):
+        """Força um redesenho e flip completos no próximo frame."""
+        self._full = True
+
+    def needs_redraw(self):
+        """Indica se a cena estática precisa ser desenhada novamente por inteiro."""
+        return self._full or not self.enabled
+
+    def track_camera(self, camera):
+        """Invalida o frame se a câmera rolou ou mudou o zoom desde o último frame."""
+        state = (tuple(camera.camera_rect), camera.zoom_factor)
+        if state != self._camera_state:
+            self._camera_state = state
+            self._full = True
+
+    def mark(self, key, rect, signature=None):
+        """Registra uma entidade desenhada neste frame."""
+        self._current[key] = (pygame.Rect(rect), signature)
+
+    def add_dirty(self, rect):
+        """Marca uma região da tela como alterada neste frame."""
+        self._extra.append(pygame.Rect(rect))
+
+    def present(self):
+        """Envia o frame para a janela e prepara o próximo."""
+        if self.needs_redraw():
+            pygame.display.flip()
+        else:
+            rects = list(self._extra)
+            for key in self._previous.keys() | self._current.keys():
+                previous = self._previous.get(key)
+                current = self._current.get(key)
+                if previous != current:
+                    rects.extend(entry[0] for entry in (previous, current) if entry is not None)
+            if rects:
+                pygame.display.update(rects)
+        self._previous = self._current
+        self._current = {}
+        self._extra = []
+        self._full = False
+
+
+# Cache compartilhado pelos laços de renderização
+scaled_sprites = ScaledSpriteCache()
+fonts = FontRegistry()
+text_cache = TextCache()
+
+
+def get_font(size, name=FONT_NAME):
+    """Retorna a fonte compartilhada do tamanho informado."""
+    return fonts.get(size, name)
+
+
+def render_text(font, text, color, antialias=True):
+    """Renderiza o texto usando o cache compartilhado."""
+    return text_cache.render(font, text, color, antialias)
+
+
+def draw_sprite(screen, camera, sprite, renderer=None):
+    """
+    Desenha o sprite na tela com o deslocamento e o zoom da câmera.
+    Sprites fora da área visível são ignorados; nesse caso retorna None.
+    """
+    if not camera.cull(sprite.rect):
+        return None
+    zoomed_rect = camera.apply(sprite)
+    screen.blit(scaled_sprites.get(sprite.image, zoomed_rect.size), zoomed_rect)
+    if renderer is not None:
+        renderer.mark(id(sprite), zoomed_rect, id(sprite.image))
+    return zoomed_rect
+
+
+# Camadas de desenho, de trás para frente
+LAYER_BACKGROUND = 0
+LAYER_ITEMS = 1
+LAYER_ENEMIES = 2
+LAYER_PLAYER = 3
+LAYER_NPCS = 4
+LAYER_UI = 5
+LAYER_COUNT = 6
+
+
+class RenderQueue:
+    def __init__(self):
+        """
+        Fila de renderização em camadas (fundo, itens, inimigos, jogador, NPCs e interface).
+        Cada sprite é enviado uma única vez por frame, mesmo que pertença a vários grupos:
+        vale a primeira camada em que foi enviado. Dentro de uma camada, os sprites são
+        desenhados por ordem da base (rect.bottom), de modo que quem está mais abaixo
+        na tela fica na frente. Desenhos que não são sprites (fundo, HUD) entram como funções.
+        """
+        self._sprites = [[] for _ in range(LAYER_COUNT)]
+        self._draws = [[] for _ in range(LAYER_COUNT)]
+        self._submitted = set()
+
+    def submit(self, sprite, layer):
+        """Envia o sprite para a camada; retorna False se ele já foi enviado neste frame."""
+        if sprite in self._submitted:
+            return False
+        self._submitted.add(sprite)
+        self._sprites[layer].append(sprite)
+        return True
+
+    def submit_group(self, group, layer):
+        for sprite in group:
+            self.submit(sprite, layer)
+
+    def submit_draw(self, layer, draw):
+        """Agenda uma função draw(screen) na camada; ela roda antes dos sprites da mesma camada."""
+        self._draws[layer].append(draw)
+
+    def draw(self, screen, camera, renderer=None):
+        """
+        Desenha todas as camadas em ordem e esvazia a fila.
+        Retorna um dicionário sprite -> retângulo na tela dos sprites desenhados (não descartados pelo culling).
+        """
+        drawn = {}
+        for layer in range(LAYER_COUNT):
+            for draw in self._draws[layer]:
+                draw(screen)
+            for sprite in sorted(self._sprites[layer], key=lambda sprite: sprite.rect.bottom):
+                zoomed_rect = draw_sprite(screen, camera, sprite, renderer)
+                if zoomed_rect is not None:
+                    drawn[sprite] = zoomed_rect
+        self.clear()
+        return drawn
+
+    def clear(self):
+        for layer in range(LAYER_COUNT):
+            self._sprites[layer].clear()
+            self._draws[layer].clear()
+        self._submitted.clear()
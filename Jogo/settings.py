@@ -6,6 +6,13 @@
 WIDTH = 1024
 HEIGHT = 768
 FPS = 60  # Frames por segundo
+DIRTY_RECT_RENDERING = True  # Atualiza apenas as regiões alteradas da tela quando a câmera está parada
+TEXT_CACHE_SIZE = 256  # Textos já renderizados mantidos em cache (LRU)
+SIMULATION_RATE = 60   # Ticks de simulação por segundo (velocidades são em pixels por tick)
+MAX_FRAME_TIME = 0.25  # Tempo máximo (s) simulado por frame, evitando avalanche de ticks após travamentos
+TIMER_WHEEL_RESOLUTION = 10  # Precisão (ms) dos timers do relógio do jogo (gameclock.py)
+TIMER_WHEEL_SLOTS = 64       # Posições por nível da roda de timers
+TIMER_WHEEL_LEVELS = 4       # Níveis da roda (64^4 posições de 10 ms ≈ 46 horas de jogo)
 
 # ----------------------
 # Map Settings
@@ -13,11 +20,19 @@ FPS = 60  # Frames por segundo
 # Dimensões do mapa baseadas no arquivo large_background.png (1920x1080)
 MAP_WIDTH = 1920
 MAP_HEIGHT = 1080
+USE_CHUNKED_MAP = True                     # Usa o mapa em pedaços gerado por tilemap.py (se existir)
+MAP_CHUNK_SIZE = 512                       # Largura/altura de cada pedaço do mapa (pixels)
+MAP_CHUNK_MEMORY_LIMIT = 64 * 1024 * 1024  # Memória máxima dos pedaços do mapa em cache (bytes)
 
 # ----------------------
 # Zoom Settings
 # ----------------------
 ZOOM_FACTOR = 1.0  # 1.0 = Sem zoom, >1.0 = Zoom In, <1.0 = Zoom Out
+MIN_ZOOM = 0.5
+MAX_ZOOM = 2.0
+ZOOM_CACHE_SIZE = 4  # Quantidade de níveis de zoom do fundo mantidos em cache (LRU)
+SCALED_SPRITE_CACHE_SIZE = 256  # Imagens de sprites já escaladas para o zoom mantidas em cache (LRU)
+CULL_PADDING = 40  # Margem (pixels do mundo) ao redor da câmera para barras de vida e prompts acima dos sprites
 
 # ----------------------
 # Color Definitions (RGB)
@@ -58,6 +73,17 @@ ENEMY_DAMAGE = 7
 ENEMY_ATTACK_COOLDOWN = 1000       # milissegundos
 ENEMY_DROP_CHANCE = 0.3            # 30% de chance de dropar um item ao morrer
 ENEMY_FREEZE_DURATION = 1500       # milissegundos que o inimigo fica congelado ao tomar dano
+ENEMY_ATTACK_FRAME_TIME = 100      # milissegundos de cada frame da animação de ataque dos inimigos
+ENEMY_STORE_CAPACITY = 64          # Slots reservados na store de inimigos (os arrays crescem se faltar)
+ENEMY_SPRITE_TABLE_SIZE = 32       # Máximo de sprites escalados mantidos na tabela por round (LRU)
+HEALTH_BAR_STEPS = 20              # Níveis de preenchimento pré-renderizados das barras de vida
+SPATIAL_CELL_SIZE = 128            # Tamanho (pixels) das células do índice espacial de inimigos e itens
+ENEMY_BATCH_THRESHOLD = 32         # A partir de quantos inimigos o movimento é calculado em lote (NumPy)
+FLOW_FIELD_CELL_SIZE = 64          # Tamanho (pixels) das células do campo de direções dos inimigos
+SEPARATION_RADIUS = 64             # Distância (pixels) entre centros abaixo da qual inimigos se afastam
+SEPARATION_BUDGET = 200            # Máximo de inimigos separados por tick (o restante fica para os próximos)
+SEPARATION_MAX_NEIGHBOURS = 8      # Máximo de vizinhos considerados por inimigo na separação
+SEPARATION_STRENGTH = 4            # Deslocamento máximo (pixels por tick) causado pela separação
 
 # ----------------------
 # Round Settings
@@ -65,6 +91,10 @@ ENEMY_FREEZE_DURATION = 1500       # milissegundos que o inimigo fica congelado
 ROUND_ENEMY_INCREMENT = 1          # Incrementa a quantidade de inimigos a cada round
 ROUND_NPC_INTERVAL = 5             # NPCs aparecem a cada 3 rounds
 ROUND_DELAY = 3000                 # Tempo de espera antes de iniciar um novo round (ms)
+SPAWN_MARGIN = 100                 # Distância mínima (pixels) entre um spawn e a borda do mapa
+SPAWN_PLAYER_DISTANCE = 200        # Spawns ficam a mais que isso do jogador nos dois eixos
+SPAWN_MIN_SPACING = 96             # Distância mínima (pixels) entre inimigos spawnados (Poisson-disc)
+SPAWN_ATTEMPTS = 8                 # Tentativas por posição antes de desistir do espaçamento
 
 # ----------------------
 # Item Settings
@@ -81,6 +111,15 @@ NPC_SCALE_HEIGHT = 200           # Altura fixa dos NPCs (mantém a proporção)
 NPC_DIALOGUE_DELAY = 2000        # Delay entre as falas dos NPCs (ms)
 NPC_INTERACTION_DISTANCE = 100   # Distância mínima para interagir com NPCs
 
+# ----------------------
+# Asset Settings
+# ----------------------
+USE_TEXTURE_ATLAS = True         # Usa o atlas gerado por atlas.py (se existir) para os sprites
+USE_ASSET_BUNDLE = True          # Usa o bundle de pixels gerado por bundle.py (se existir) em vez de decodificar PNGs
+ATLAS_SHEET_SIZE = 2048          # Largura/altura de cada folha do atlas (pixels)
+PRELOAD_WORKERS = 4              # Threads usadas para decodificar os assets durante o menu
+SURFACE_MEMORY_BUDGET = 256 * 1024 * 1024  # Memória máxima esperada para superfícies em cache (bytes)
+
 # ----------------------
 # Audio Settings
 # ----------------------
@@ -91,4 +130,5 @@ SFX_VOLUME = 0.2                 # Volume dos efeitos sonoros (ataque, dano, etc
 # General Game Settings
 # ----------------------
 FONT_NAME = 'arial'
+HEADLESS_FRAMES = 3600             # Atualizações executadas pela simulação headless (python main.py --headless)
 GAME_OVER_DELAY = 3000           # Delay antes de voltar ao menu após Game Over (ms)
@@ -0,0 +1,147 @@
+import pygame
+from settings import SPATIAL_CELL_SIZE
+
+
+def rect_in_radius(rect, center, radius):
+    """Indica se o retângulo intersecta o círculo (distância do centro ao ponto mais próximo do retângulo)."""
+    x, y = center
+    dx = x - max(rect.left, min(x, rect.right))
+    dy = y - max(rect.top, min(y, rect.bottom))
+    return dx * dx + dy * dy <= radius * radius
+
+
+class SpatialHash:
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        """
+        Grade uniforme em coordenadas do mundo: cada entidade é registrada nas células
+        cobertas pelo seu retângulo. Consultas por retângulo ou raio visitam apenas as
+        células da região, então o custo depende da densidade local e não do total de entidades.
+        """
+        self.cell_size = cell_size
+        self._cells = {}     # (cx, cy) -> entidades da célula (dict usado como conjunto ordenado)
+        self._entities = {}  # entidade -> (cx0, cy0, cx1, cy1) células ocupadas
+
+    def _cell_range(self, rect):
+        size = self.cell_size
+        return (rect.left // size, rect.top // size, (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    def _link(self, entity, cells):
+        cx0, cy0, cx1, cy1 = cells
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                self._cells.setdefault((cx, cy), {})[entity] = None
+
+    def _unlink(self, entity, cells):
+        cx0, cy0, cx1, cy1 = cells
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                bucket = self._cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.pop(entity, None)
+                    if not bucket:
+                        del self._cells[(cx, cy)]
+
+    def insert(self, entity):
+        cells = self._cell_range(entity.rect)
+        self._entities[entity] = cells
+        self._link(entity, cells)
+
+    def remove(self, entity):
+        cells = self._entities.pop(entity, None)
+        if cells is not None:
+            self._unlink(entity, cells)
+
+    def update(self, entity):
+        """Reposiciona a entidade na grade; só mexe nas células se ela mudou de célula."""
+        cells = self._cell_range(entity.rect)
+        old_cells = self._entities.get(entity)
+        if old_cells == cells:
+            return
+        if old_cells is not None:
+            self._unlink(entity, old_cells)
+        self._entities[entity] = cells
+        self._link(entity, cells)
+
+    def _candidates(self, rect):
+        cx0, cy0, cx1, cy1 = self._cell_range(rect)
+        # Ordem de inserção (e não a ordem de um set, que depende do endereço dos objetos):
+        # as consultas devolvem sempre a mesma ordem e a simulação headless é reproduzível
+        found = {}
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                bucket = self._cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return found
+
+    def query_rect(self, rect):
+        """Lista as entidades cujo retângulo colide com 'rect'."""
+        return [entity for entity in self._candidates(rect) if entity.rect.colliderect(rect)]
+
+    def query_radius(self, center, radius):
+        """Lista as entidades cujo retângulo intersecta o círculo de centro 'center' e raio 'radius'."""
+        x, y = center
+        bounds = pygame.Rect(int(x - radius), int(y - radius), int(radius * 2) + 1, int(radius * 2) + 1)
+        return [entity for entity in self._candidates(bounds) if rect_in_radius(entity.rect, center, radius)]
+
+    def clear(self):
+        self._cells.clear()
+        self._entities.clear()
+
+    def __contains__(self, entity):
+        return entity in self._entities
+
+    def __len__(self):
+        return len(self._entities)
+
+
+class SpatialGroup(pygame.sprite.Group):
+    """
+    Grupo de sprites com índice espacial.
+    Sprites adicionados/removidos entram e saem da grade automaticamente e, após
+    update(), apenas os que mudaram de célula são reposicionados.
+    """
+
+    def __init__(self, *sprites, cell_size=SPATIAL_CELL_SIZE):
+        self.spatial = SpatialHash(cell_size)
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.spatial.update(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.spatial.remove(sprite)
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.refresh()
+
+    def refresh(self):
+        """Atualiza a grade com a posição atual dos sprites (ex.: após movê-los fora de update())."""
+        for sprite in self.sprites():
+            self.spatial.update(sprite)
+
+    def query_rect(self, rect):
+        return self.spatial.query_rect(rect)
+
+    def query_radius(self, center, radius):
+        return self.spatial.query_radius(center, radius)
+
+
+def colliding(group, rect):
+    """
+    Sprites do grupo que colidem com 'rect'. Usa o índice espacial quando o grupo
+    tem um (SpatialGroup, EnemyStore); caso contrário percorre o grupo inteiro.
+    """
+    if hasattr(group, "query_rect"):
+        return group.query_rect(rect)
+    return [sprite for sprite in group if sprite.rect.colliderect(rect)]
+
+
+def within_radius(group, center, radius):
+    """Sprites do grupo a até 'radius' pixels de 'center' (ver SpatialHash.query_radius)."""
+    if hasattr(group, "query_radius"):
+        return group.query_radius(center, radius)
+    return [sprite for sprite in group if rect_in_radius(sprite.rect, center, radius)]
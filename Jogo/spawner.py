@@ -0,0 +1,119 @@
+import math
+import random
+from settings import MAP_WIDTH, MAP_HEIGHT, SPAWN_MARGIN, SPAWN_PLAYER_DISTANCE, SPAWN_MIN_SPACING, SPAWN_ATTEMPTS
+from spatial import within_radius
+
+
+class SpawnSampler:
+    def __init__(self, map_size=(MAP_WIDTH, MAP_HEIGHT), margin=SPAWN_MARGIN, clearance=SPAWN_PLAYER_DISTANCE,
+                 spacing=SPAWN_MIN_SPACING, attempts=SPAWN_ATTEMPTS, rng=random):
+        """
+        Sorteia posições de spawn sem o laço de rejeição.
+        A regra "longe do jogador" vale separadamente em cada eixo (|x - px| e |y - py|
+        maiores que 'clearance'), então as posições válidas de cada eixo formam no
+        máximo dois intervalos: basta sortear x e y dentro deles, com peso pelo
+        tamanho de cada intervalo, para obter uma posição uniforme entre as válidas
+        em tempo constante.
+
+        O espaçamento entre inimigos ('spacing') é uma preferência: cada posição tem
+        no máximo 'attempts' sorteios e, se todos caírem perto de outro inimigo, a
+        última posição sorteada é usada mesmo assim. O custo é sempre limitado.
+
+        Parâmetros:
+            map_size (tuple): Largura e altura do mapa.
+            margin (int): Distância mínima entre o spawn e a borda do mapa.
+            clearance (int): Distância mínima do jogador em cada eixo.
+            spacing (int): Distância mínima desejada entre inimigos spawnados.
+            attempts (int): Sorteios por posição antes de desistir do espaçamento.
+            rng: Gerador de números aleatórios (por padrão o módulo random, que o headless semeia).
+        """
+        self.map_width, self.map_height = map_size
+        self.margin = margin
+        self.clearance = clearance
+        self.spacing = spacing
+        self.attempts = max(1, attempts)
+        self.rng = rng
+
+    # --- Intervalos válidos ---
+    def axis_intervals(self, low, high, center):
+        """
+        Intervalos inteiros [a, b] de [low, high] a mais de 'clearance' de 'center'.
+        Se o mapa for pequeno demais para isso, usa a extremidade mais distante de 'center'.
+        """
+        if center is None or self.clearance <= 0:
+            return [(low, high)]
+        intervals = []
+        left = min(high, math.ceil(center - self.clearance) - 1)
+        if left >= low:
+            intervals.append((low, left))
+        right = max(low, math.floor(center + self.clearance) + 1)
+        if right <= high:
+            intervals.append((right, high))
+        if not intervals:
+            far = low if center - low > high - center else high
+            intervals.append((far, far))
+        return intervals
+
+    def _regions(self, player_pos):
+        """Intervalos válidos dos eixos x e y para a posição atual do jogador."""
+        player_x, player_y = player_pos if player_pos is not None else (None, None)
+        x_intervals = self.axis_intervals(self.margin, max(self.margin, self.map_width - self.margin), player_x)
+        y_intervals = self.axis_intervals(self.margin, max(self.margin, self.map_height - self.margin), player_y)
+        return x_intervals, y_intervals
+
+    @staticmethod
+    def pick(intervals, rng):
+        """Sorteia um inteiro uniforme na união dos intervalos (peso pelo tamanho de cada um)."""
+        total = sum(b - a + 1 for a, b in intervals)
+        value = rng.randrange(total)
+        for a, b in intervals:
+            length = b - a + 1
+            if value < length:
+                return a + value
+            value -= length
+        return intervals[-1][1]
+
+    # --- Sorteio ---
+    def sample(self, player_pos=None, avoid=None):
+        """
+        Uma posição de spawn longe de player_pos (pode ser None) e, se possível,
+        a mais de 'spacing' pixels dos sprites de 'avoid' (ex.: o grupo de inimigos).
+        """
+        return self.sample_wave(1, player_pos, avoid)[0]
+
+    def sample_wave(self, count, player_pos=None, avoid=None):
+        """
+        'count' posições para uma onda inteira, espalhadas como um Poisson-disc por
+        lançamento de dardos: cada posição tem até 'attempts' sorteios e é aceita se
+        estiver a mais de 'spacing' pixels dos sprites de 'avoid' (consulta ao índice
+        espacial do grupo) e das posições já escolhidas na onda (grade local com
+        células de 'spacing' pixels, só as 9 células ao redor são comparadas).
+        O custo é O(count * attempts), independente do tamanho do mapa; se a região
+        estiver cheia, a última posição sorteada é usada sem o espaçamento.
+        """
+        x_intervals, y_intervals = self._regions(player_pos)
+        spacing = self.spacing
+        grid = {}  # (cx, cy) -> posições da onda com o ponto na célula
+        positions = []
+        for _ in range(count):
+            for _ in range(self.attempts):
+                pos = (self.pick(x_intervals, self.rng), self.pick(y_intervals, self.rng))
+                if spacing <= 0 or self._is_clear(pos, grid, avoid):
+                    break
+            positions.append(pos)
+            if spacing > 0:
+                grid.setdefault((pos[0] // spacing, pos[1] // spacing), []).append(pos)
+        return positions
+
+    def _is_clear(self, pos, grid, avoid):
+        """Indica se 'pos' está a pelo menos 'spacing' pixels das posições da grade e dos sprites de 'avoid'."""
+        spacing = self.spacing
+        x, y = pos
+        cell_x, cell_y = x // spacing, y // spacing
+        spacing_sq = spacing * spacing
+        for grid_y in (cell_y - 1, cell_y, cell_y + 1):
+            for grid_x in (cell_x - 1, cell_x, cell_x + 1):
+                for other_x, other_y in grid.get((grid_x, grid_y), ()):
+                    if (x - other_x) ** 2 + (y - other_y) ** 2 < spacing_sq:
+                        return False
+        return avoid is None or not within_radius(avoid, pos, spacing)
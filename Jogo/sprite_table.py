@@ -0,0 +1,74 @@
+import pygame
+from collections import OrderedDict
+from settings import ENEMY_SPRITE_TABLE_SIZE
+from assets import asset_cache, asset_path
+
+# Tipo de inimigo -> (arquivo, tamanho base em pixels, escala inicial, aumento de escala por round)
+ENEMY_SPRITES = {
+    "Normal": ("enemy.png", 128, 1.0, 0.02),
+    "Rápido": ("enemy1.png", 128, 1.2, 0.02),
+    "Tanque": ("enemy2.png", 128, 1.5, 0.02),
+    "Boss":   ("boss.png", 256, 2.0, 0.05),
+}
+
+
+class EnemySpriteTable:
+    def __init__(self, capacity=ENEMY_SPRITE_TABLE_SIZE):
+        """
+        Tabela de sprites de inimigos já redimensionados para cada round.
+        As superfícies são indexadas por (tipo, tamanho), de modo que todos os inimigos
+        do mesmo tipo no mesmo round compartilham a mesma imagem escalada.
+        A tabela é limitada a 'capacity' entradas, descartando a menos usada (LRU).
+        """
+        self.capacity = capacity
+        self._table = OrderedDict()  # (tipo, tamanho) -> pygame.Surface
+        self.hits = 0
+        self.misses = 0
+
+    def path_for(self, enemy_type):
+        """Caminho da imagem usada pelo tipo de inimigo."""
+        return asset_path(ENEMY_SPRITES[enemy_type][0])
+
+    def size_for(self, enemy_type, round_number):
+        """Calcula o tamanho do sprite do tipo de inimigo no round informado."""
+        _, base_size, base_scale, round_scale = ENEMY_SPRITES[enemy_type]
+        scale_factor = base_scale + round_number * round_scale
+        return (int(base_size * scale_factor), int(base_size * scale_factor))
+
+    def get(self, enemy_type, round_number):
+        """
+        Retorna o sprite escalado do tipo de inimigo para o round.
+        Se ainda não existir na tabela, é gerado a partir da imagem original em cache.
+        """
+        key = (enemy_type, self.size_for(enemy_type, round_number))
+        surface = self._table.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._table.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        original_image = asset_cache.image(self.path_for(enemy_type))
+        surface = pygame.transform.scale(original_image, key[1])
+        self._table[key] = surface
+        asset_cache.track(surface)
+        if len(self._table) > self.capacity:
+            _, evicted = self._table.popitem(last=False)
+            asset_cache.untrack(evicted)
+        return surface
+
+    def prepare_round(self, round_number, enemy_types=None):
+        """
+        Pré-calcula os sprites de todos os tipos de inimigos para o round,
+        evitando redimensionamentos durante o spawn da onda.
+        """
+        for enemy_type in enemy_types or ENEMY_SPRITES:
+            try:
+                self.get(enemy_type, round_number)
+            except (pygame.error, FileNotFoundError):
+                # O próprio inimigo usa uma imagem padrão ao ser criado
+                pass
+
+
+# Tabela compartilhada por todos os inimigos
+enemy_sprites = EnemySpriteTable()
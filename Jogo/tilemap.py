@@ -0,0 +1,155 @@
+import os
+import json
+import pygame
+from collections import OrderedDict
+from settings import MAP_WIDTH, MAP_HEIGHT, MAP_CHUNK_SIZE, MAP_CHUNK_MEMORY_LIMIT
+from assets import ASSETS_DIR, surface_bytes
+
+# Pasta com os pedaços do mapa gerados por "python tilemap.py"
+MAP_CHUNKS_DIR = os.path.join(ASSETS_DIR, "map_chunks")
+MAP_CHUNKS_INDEX = "map.json"
+
+
+def chunk_filename(cx, cy):
+    return f"chunk_{cx}_{cy}.png"
+
+
+def split_map(image_path, output_dir=MAP_CHUNKS_DIR, map_size=(MAP_WIDTH, MAP_HEIGHT), chunk_size=MAP_CHUNK_SIZE):
+    """
+    Divide a imagem do mapa em pedaços de chunk_size x chunk_size pixels
+    e grava um índice com as dimensões do mundo.
+    """
+    image = pygame.image.load(image_path)
+    if image.get_size() != tuple(map_size):
+        image = pygame.transform.scale(image, map_size)
+    width, height = map_size
+    os.makedirs(output_dir, exist_ok=True)
+    count = 0
+    for cy in range((height + chunk_size - 1) // chunk_size):
+        for cx in range((width + chunk_size - 1) // chunk_size):
+            rect = pygame.Rect(cx * chunk_size, cy * chunk_size, chunk_size, chunk_size).clip(image.get_rect())
+            pygame.image.save(image.subsurface(rect), os.path.join(output_dir, chunk_filename(cx, cy)))
+            count += 1
+    with open(os.path.join(output_dir, MAP_CHUNKS_INDEX), "w") as file:
+        json.dump({"width": width, "height": height, "chunk_size": chunk_size}, file)
+    print(f"🗺️ Mapa dividido em {count} pedaços de {chunk_size}px em {output_dir}")
+
+
+class ChunkedMap:
+    def __init__(self, width, height, load_chunk, chunk_size=MAP_CHUNK_SIZE, memory_limit=MAP_CHUNK_MEMORY_LIMIT):
+        """
+        Mapa dividido em pedaços de tamanho fixo, carregados sob demanda ao redor da câmera.
+        Os pedaços (originais e com zoom) ficam em um cache LRU limitado por memória,
+        de modo que o custo por frame e a memória não crescem com o tamanho do mapa.
+
+        Parâmetros:
+            width, height (int): Dimensões do mundo em pixels.
+            load_chunk (callable): Função (cx, cy) -> pygame.Surface que carrega um pedaço.
+            chunk_size (int): Largura/altura de cada pedaço em pixels.
+            memory_limit (int): Memória máxima (bytes) dos pedaços em cache.
+        """
+        self.width = width
+        self.height = height
+        self.load_chunk = load_chunk
+        self.chunk_size = chunk_size
+        self.memory_limit = memory_limit
+        self.columns = (width + chunk_size - 1) // chunk_size
+        self.rows = (height + chunk_size - 1) // chunk_size
+        self._cache = OrderedDict()  # (cx, cy, zoom) -> pygame.Surface (zoom None = pedaço original)
+        self.bytes_cached = 0
+        self.loads = 0
+
+    @classmethod
+    def from_directory(cls, directory=MAP_CHUNKS_DIR, memory_limit=MAP_CHUNK_MEMORY_LIMIT):
+        """Cria o mapa a partir dos pedaços gerados por split_map (ou None se não existirem)."""
+        index_path = os.path.join(directory, MAP_CHUNKS_INDEX)
+        if not os.path.exists(index_path):
+            return None
+        with open(index_path) as file:
+            index = json.load(file)
+
+        def load_chunk(cx, cy):
+            return pygame.image.load(os.path.join(directory, chunk_filename(cx, cy))).convert()
+
+        return cls(index["width"], index["height"], load_chunk, index["chunk_size"], memory_limit)
+
+    def _get(self, key):
+        surface = self._cache.get(key)
+        if surface is not None:
+            self._cache.move_to_end(key)
+        return surface
+
+    def _store(self, key, surface):
+        self._cache[key] = surface
+        self.bytes_cached += surface_bytes(surface)
+        # Descarta os pedaços menos usados até respeitar o limite (mantém ao menos o recém-inserido)
+        while self.bytes_cached > self.memory_limit and len(self._cache) > 1:
+            _, evicted = self._cache.popitem(last=False)
+            self.bytes_cached -= surface_bytes(evicted)
+
+    def chunk(self, cx, cy):
+        """Retorna o pedaço original (sem zoom), carregando-o se necessário."""
+        key = (cx, cy, None)
+        surface = self._get(key)
+        if surface is None:
+            surface = self.load_chunk(cx, cy)
+            self.loads += 1
+            self._store(key, surface)
+        return surface
+
+    def _chunk_span(self, index, zoom):
+        """Posição e tamanho (em pixels com zoom) de um pedaço; arredondado sem deixar frestas."""
+        start = int(index * self.chunk_size * zoom)
+        end = int((index + 1) * self.chunk_size * zoom)
+        return start, end - start
+
+    def zoomed_chunk(self, cx, cy, zoom):
+        """Retorna o pedaço redimensionado para o zoom informado."""
+        if zoom == 1.0:
+            return self.chunk(cx, cy)
+        key = (cx, cy, zoom)
+        surface = self._get(key)
+        if surface is None:
+            original = self.chunk(cx, cy)
+            # Pedaços da borda podem ser menores que chunk_size
+            width = self._chunk_span(cx, zoom)[1] if original.get_width() == self.chunk_size else int(original.get_width() * zoom)
+            height = self._chunk_span(cy, zoom)[1] if original.get_height() == self.chunk_size else int(original.get_height() * zoom)
+            surface = pygame.transform.smoothscale(original, (max(1, width), max(1, height)))
+            self._store(key, surface)
+        return surface
+
+    def visible_chunks(self, world_rect):
+        """Lista os índices (cx, cy) dos pedaços que intersectam o retângulo do mundo."""
+        first_cx = max(0, world_rect.left // self.chunk_size)
+        first_cy = max(0, world_rect.top // self.chunk_size)
+        last_cx = min(self.columns - 1, (world_rect.right - 1) // self.chunk_size)
+        last_cy = min(self.rows - 1, (world_rect.bottom - 1) // self.chunk_size)
+        return [(cx, cy) for cy in range(first_cy, last_cy + 1) for cx in range(first_cx, last_cx + 1)]
+
+    def draw(self, screen, camera):
+        """Compõe na tela apenas os pedaços visíveis pela câmera, já com o zoom aplicado."""
+        zoom = camera.zoom_factor
+        offset_x = int(camera.camera_rect.x * zoom)
+        offset_y = int(camera.camera_rect.y * zoom)
+        for cx, cy in self.visible_chunks(camera.camera_rect):
+            x = self._chunk_span(cx, zoom)[0] - offset_x
+            y = self._chunk_span(cy, zoom)[0] - offset_y
+            screen.blit(self.zoomed_chunk(cx, cy, zoom), (x, y))
+
+
+def chunked_map_available(directory=MAP_CHUNKS_DIR):
+    """Indica se o mapa em pedaços foi gerado (sem carregar nenhum pedaço)."""
+    return os.path.exists(os.path.join(directory, MAP_CHUNKS_INDEX))
+
+
+def load_map():
+    """Carrega o mapa em pedaços, se ele tiver sido gerado; caso contrário retorna None."""
+    try:
+        return ChunkedMap.from_directory()
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠️ Falha ao carregar o mapa em pedaços: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    split_map(os.path.join(ASSETS_DIR, "large_background.png"))
@@ -0,0 +1,80 @@
+from contextlib import contextmanager
+from settings import SIMULATION_RATE, MAX_FRAME_TIME
+
+# Deslocamentos maiores que isto entre dois ticks são tratados como teletransporte (sem interpolação)
+TELEPORT_DISTANCE = 200
+
+
+class FixedTimestep:
+    def __init__(self, rate=SIMULATION_RATE, max_frame_time=MAX_FRAME_TIME):
+        """
+        Passo de simulação fixo com acumulador.
+        A cada frame renderizado, advance() recebe o tempo real decorrido e informa
+        quantos ticks de 1/rate segundos devem ser simulados; a sobra fica acumulada
+        para o próximo frame e define o fator de interpolação (alpha) da renderização.
+        Assim a velocidade do jogo não depende do FPS alcançado.
+
+        Parâmetros:
+            rate (int): Ticks de simulação por segundo.
+            max_frame_time (float): Tempo máximo (s) considerado por frame, evitando que
+                uma pausa longa (ex.: janela arrastada) gere uma avalanche de ticks.
+        """
+        self.rate = rate
+        self.dt = 1.0 / rate
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.ticks = 0
+
+    def advance(self, frame_seconds):
+        """Acumula o tempo do frame e retorna quantos ticks devem ser simulados agora."""
+        self.accumulator += min(frame_seconds, self.max_frame_time)
+        steps = int(self.accumulator / self.dt)
+        self.accumulator -= steps * self.dt
+        self.alpha = self.accumulator / self.dt
+        self.ticks += steps
+        return steps
+
+    def reset(self):
+        """Descarta o tempo acumulado (ex.: ao sair de uma tela que pausou o jogo)."""
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+
+class Interpolator:
+    def __init__(self):
+        """
+        Guarda a posição dos sprites antes de cada tick para que a renderização
+        possa desenhá-los entre o estado anterior e o atual (movimento suave
+        mesmo quando o FPS é diferente da taxa de simulação).
+        """
+        self._previous = {}  # sprite -> posição (topleft) antes do último tick
+
+    def snapshot(self, *groups):
+        """Registra a posição atual dos sprites dos grupos (chamar antes de cada tick)."""
+        self._previous = {sprite: sprite.rect.topleft for group in groups for sprite in group}
+
+    @contextmanager
+    def interpolated(self, alpha, *groups):
+        """
+        Dentro do bloco, os retângulos dos sprites ficam na posição interpolada
+        (anterior + alpha * deslocamento); ao sair, as posições simuladas são restauradas.
+        """
+        moved = []
+        # Um sprite pode estar em mais de um grupo; cada um é deslocado uma única vez
+        for sprite in {sprite for group in groups for sprite in group}:
+            previous = self._previous.get(sprite)
+            if previous is None:
+                continue
+            current = sprite.rect.topleft
+            dx = current[0] - previous[0]
+            dy = current[1] - previous[1]
+            if (dx == 0 and dy == 0) or abs(dx) > TELEPORT_DISTANCE or abs(dy) > TELEPORT_DISTANCE:
+                continue
+            moved.append((sprite, current))
+            sprite.rect.topleft = (round(previous[0] + dx * alpha), round(previous[1] + dy * alpha))
+        try:
+            yield
+        finally:
+            for sprite, current in moved:
+                sprite.rect.topleft = current